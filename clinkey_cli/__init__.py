@@ -1,6 +1,21 @@
 """clinkey-cli package public API."""
 
-from .main import Clinkey, clinkey
+from typing import Any
 
 __all__ = ["Clinkey", "clinkey"]
 __version__ = "2.0.0"
+
+
+def __getattr__(name: str) -> Any:
+    """Load the syllable-based API on first access (PEP 562).
+
+    Keeps ``import clinkey_cli.cli`` from building syllable tables when
+    another generator type is requested.
+    """
+    if name in __all__:
+        from clinkey_cli import main
+
+        value = getattr(main, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
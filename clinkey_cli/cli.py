@@ -4,9 +4,12 @@ Supports both interactive and scripted launches, pairing Click for argument
 parsing with Rich for terminal rendering.
 """
 
+import os
 import pathlib
+import sys
 import time
-from typing import Iterable, Optional
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, TextIO
 
 from clinkey_cli.settings import click
 from rich import box
@@ -21,12 +24,20 @@ from rich.prompt import Prompt
 
 from clinkey_cli.logos import display_logo
 from clinkey_cli.const import centered_spinner
-from clinkey_cli.main import Clinkey
-from clinkey_cli.generators import registry
+from clinkey_cli.generators.registry import registry
+from clinkey_cli.generators.stats import GeneratorStats
+from clinkey_cli.generators.unique import DEFAULT_MEMORY_LIMIT_MB, UniqueFilter
 from clinkey_cli.generators.pattern import PatternGenerator
+from clinkey_cli.languages import available_languages
+
+if TYPE_CHECKING:
+    from clinkey_cli.security.compliance import CompliancePolicy
 
 console = Console()
 
+# Number of passwords buffered in memory before each write in stream mode
+STREAM_BUFFER_LINES = 1024
+
 
 class ClinkeyView:
     """Render the interactive experience using Rich panels and prompts.
@@ -508,6 +519,54 @@ def _parse_extra_options(options: Iterable[str]) -> dict[str, bool]:
     return result
 
 
+def _stream_passwords(
+    handle: TextIO,
+    passwords: Iterable[str],
+    buffer_lines: int = STREAM_BUFFER_LINES,
+) -> int:
+    """Write passwords to a text stream through a bounded buffer.
+
+    Parameters
+    ----------
+    handle : TextIO
+        Destination stream (stdout or an open file).
+    passwords : Iterable[str]
+        Passwords to write, one per line. The iterable is consumed lazily, so
+        at most ``buffer_lines`` passwords are held in memory at once.
+    buffer_lines : int, default STREAM_BUFFER_LINES
+        Number of passwords joined into each write call.
+
+    Returns
+    -------
+    int
+        Number of passwords written.
+    """
+    iterator = iter(passwords)
+    written = 0
+    while chunk := list(islice(iterator, buffer_lines)):
+        chunk.append("")
+        handle.write("\n".join(chunk))
+        written += len(chunk) - 1
+    handle.flush()
+    return written
+
+
+def _stream_to_stdout(passwords: Iterable[str]) -> None:
+    """Stream passwords to stdout, exiting quietly if the reader goes away.
+
+    Parameters
+    ----------
+    passwords : Iterable[str]
+        Passwords to write, one per line.
+    """
+    try:
+        _stream_passwords(sys.stdout, passwords)
+    except BrokenPipeError:
+        # Downstream consumer (e.g. ``head``) closed the pipe: stop cleanly and
+        # keep Python from complaining again when it flushes stdout at exit.
+        sys.stdout = open(os.devnull, "w")
+
+
 def _write_passwords(path: pathlib.Path, passwords: Iterable[str]) -> None:
     """Persist generated passwords to the provided file path.
 
@@ -519,8 +578,7 @@ def _write_passwords(path: pathlib.Path, passwords: Iterable[str]) -> None:
         Passwords to write, one per line. The iterable is consumed once.
     """
     with path.open("w", encoding="utf-8") as handle:
-        for password in passwords:
-            handle.write(f"{password}\n")
+        _stream_passwords(handle, passwords)
 
 
 def _generate_passwords(
@@ -533,6 +591,15 @@ def _generate_passwords(
     word_count: int,
     capitalize: bool,
     pattern: Optional[str],
+    workers: int = 1,
+    ordered: bool = True,
+    seed: Optional[str] = None,
+    wordlist: Optional[pathlib.Path] = None,
+    language: Optional[str] = None,
+    min_bits: Optional[float] = None,
+    policy: Optional[str] = None,
+    rules: Optional[str] = None,
+    stats: Optional[GeneratorStats] = None,
 ) -> list[str]:
     """Generate passwords using the appropriate generator from registry.
 
@@ -569,6 +636,34 @@ def _generate_passwords(
     pattern : str | None
         Pattern template (pattern only, required).
 
+    workers : int, default 1
+        Number of worker processes used to generate the batch.
+
+    ordered : bool, default True
+        Keep chunk submission order when using several workers.
+
+    seed : str | None, default None
+        Seed for reproducible output (never for real credentials).
+
+    wordlist : pathlib.Path | None, default None
+        Custom wordlist file (passphrase only).
+
+    language : str | None, default None
+        Syllable language pack (syllable types only).
+
+    min_bits : float | None, default None
+        Minimum entropy in bits; raises length or word count as needed.
+
+    policy : str | None, default None
+        Compliance policy every password is generated to meet.
+
+    rules : str | None, default None
+        Site rules in ``passwordrules`` syntax (pattern type, instead of a
+        pattern template).
+
+    stats : GeneratorStats | None, default None
+        Collector filled with the generator's counters and timings.
+
     Returns
     -------
     list[str]
@@ -579,26 +674,154 @@ def _generate_passwords(
     click.BadParameter
         If pattern type is used without pattern template.
     """
+    return list(
+        _iter_passwords(
+            type_=type_,
+            length=length,
+            number=number,
+            lower=lower,
+            no_sep=no_sep,
+            separator=separator,
+            word_count=word_count,
+            capitalize=capitalize,
+            pattern=pattern,
+            workers=workers,
+            ordered=ordered,
+            seed=seed,
+            wordlist=wordlist,
+            language=language,
+            min_bits=min_bits,
+            policy=policy,
+            rules=rules,
+            stats=stats,
+        )
+    )
+
+
+def _iter_passwords(
+    type_: str,
+    length: int,
+    number: Optional[int],
+    lower: bool,
+    no_sep: bool,
+    separator: Optional[str],
+    word_count: int,
+    capitalize: bool,
+    pattern: Optional[str],
+    workers: int = 1,
+    ordered: bool = True,
+    seed: Optional[str] = None,
+    wordlist: Optional[pathlib.Path] = None,
+    language: Optional[str] = None,
+    min_bits: Optional[float] = None,
+    policy: Optional[str] = None,
+    rules: Optional[str] = None,
+    stats: Optional[GeneratorStats] = None,
+) -> Iterator[str]:
+    """Lazily yield passwords from the appropriate registry generator.
+
+    Accepts the same parameters as :func:`_generate_passwords`, except that
+    ``number`` may be ``None`` to yield indefinitely. Invalid parameters are
+    reported immediately, before the first password is requested.
+
+    Parameters
+    ----------
+    workers : int, default 1
+        Number of worker processes. Values above 1 shard the batch across a
+        process pool.
+    ordered : bool, default True
+        Keep chunk submission order when using several workers.
+    seed : str | None, default None
+        Draw from a deterministic source seeded with this value instead of
+        the OS CSPRNG. Reproducible output, never for real credentials.
+    wordlist : pathlib.Path | None, default None
+        Custom wordlist file for passphrases, indexed on first use.
+    language : str | None, default None
+        Language pack of syllable types, compiled on first use and cached.
+    min_bits : float | None, default None
+        Minimum entropy in bits. The length or word count is raised to the
+        smallest value reaching it, computed from the generator's keyspace.
+    policy : str | None, default None
+        Built-in ("nist", "owasp") or configured compliance policy. Its
+        character classes are placed during generation, so no password is
+        ever regenerated.
+    rules : str | None, default None
+        Site password rules (``passwordrules`` syntax) for the pattern
+        type, compiled once and cached by rule string. ``length`` is
+        clamped to their ``minlength`` and ``maxlength``.
+    stats : GeneratorStats | None, default None
+        Collector the generator fills with hot-path counters and timings.
+        Single-process runs only.
+
+    Returns
+    -------
+    Iterator[str]
+        Lazy iterator over generated passwords.
+
+    Raises
+    ------
+    click.BadParameter
+        If pattern type is used without pattern template or rules, rules,
+        a wordlist or a language are given for another type, the rules are
+        malformed, min_bits cannot be reached, the policy is
+        unknown or cannot be met, or stats are requested with workers.
+    """
     # Get generator class from registry
     generator_class = registry.get(type_)
-    generator = generator_class()
+
+    if rules is not None and type_ != "pattern":
+        raise click.BadParameter(
+            "Site rules only apply to the pattern type (-t pattern).",
+            param_hint="--rules",
+        )
+    if wordlist is not None and type_ != "passphrase":
+        raise click.BadParameter(
+            "Custom wordlists only apply to the passphrase type (-t passphrase).",
+            param_hint="--wordlist",
+        )
+    if language is not None and type_ not in ("normal", "strong", "super_strong"):
+        raise click.BadParameter(
+            "Languages only apply to the normal, strong and super_strong types.",
+            param_hint="--language",
+        )
 
     # Build kwargs based on generator type
+    options: dict[str, Any] = {}
+    kwargs: dict[str, Any]
     if type_ == "passphrase":
+        if wordlist is not None:
+            from clinkey_cli.wordlists.custom import build_index
+
+            # Index once up front, so worker processes only map it
+            try:
+                build_index(wordlist)
+            except ValueError as exc:
+                raise click.BadParameter(str(exc), param_hint="--wordlist") from exc
+            options["wordlist"] = str(wordlist)
         kwargs = {
             "word_count": word_count,
             "separator": separator or "-",
             "capitalize": capitalize,
         }
+    elif type_ == "pattern" and rules:
+        from clinkey_cli.generators.rules import compile_rules
+
+        try:
+            compile_rules(rules, length)
+        except ValueError as exc:
+            raise click.BadParameter(str(exc), param_hint="--rules") from exc
+        kwargs = {"rules": rules, "length": length}
     elif type_ == "pattern":
         if not pattern:
             raise click.BadParameter(
                 "Pattern template required for pattern type. "
-                "Example: --pattern 'Cvvc-9999'",
+                "Example: --pattern 'Cvvc-9999', or --rules 'required: digit'",
                 param_hint="--pattern",
             )
         kwargs = {"pattern": pattern}
-    else:  # syllable types (normal, strong, super_strong)
+    elif type_ in ("normal", "strong", "super_strong"):
+        if language is not None:
+            options["language"] = language
         kwargs = {
             "length": length,
             "password_type": type_,
@@ -607,14 +830,163 @@ def _generate_passwords(
         }
         if separator:
             kwargs["separator"] = separator
+    else:  # plugin generators receive the generic BaseGenerator options
+        kwargs = {"length": length, "lower": lower, "no_separator": no_sep}
+        if separator:
+            kwargs["separator"] = separator
 
-    # Generate batch
-    passwords = []
-    for _ in range(number):
-        password = generator.generate(**kwargs)
-        passwords.append(password)
+    if min_bits is not None:
+        # Sized up front from the generator's closed-form keyspace
+        try:
+            kwargs = registry.create(type_, **options).params_for_bits(
+                min_bits, **kwargs
+            )
+        except (NotImplementedError, ValueError) as exc:
+            raise click.BadParameter(str(exc), param_hint="--min-bits") from exc
+
+    if policy is not None:
+        kwargs["policy"] = _compile_policy(type_, policy, kwargs)
+
+    if workers > 1 and stats is not None:
+        raise click.BadParameter(
+            "--stats only instruments single-process runs.",
+            param_hint="--workers",
+        )
+
+    if workers > 1 or seed is not None:
+        # Deferred: the process pool machinery is costly to import
+        from clinkey_cli.generators.parallel import generate_parallel
+
+        # Seeded runs draw each chunk from its own derived seed, in this
+        # process or in a pool alike, so the output ignores --workers
+        return generate_parallel(
+            type_,
+            number,
+            workers=workers,
+            ordered=ordered,
+            seed=seed,
+            options=options,
+            stats=stats,
+            **kwargs,
+        )
+
+    if stats is not None:
+        # Instrument a private instance: cached ones are shared read-only
+        generator = generator_class(**options)
+        generator.enable_stats(stats)
+    else:
+        generator = registry.create(type_, **options)
+    return generator.iter_generate(number, **kwargs)
+
+
+def _print_stats(stats: GeneratorStats) -> None:
+    """Print collected generator statistics on stderr.
+
+    Parameters
+    ----------
+    stats : GeneratorStats
+        Collector filled during the run.
+    """
+    snapshot = stats.snapshot()
+    click.echo("Generator stats:", err=True)
+    for name, timer in snapshot["timers"].items():
+        calls = timer["calls"]
+        average = timer["seconds"] / calls * 1e6 if calls else 0.0
+        click.echo(
+            f"  {name}: {calls} call(s), {timer['seconds'] * 1e3:.3f} ms total, "
+            f"{average:.2f} us/call",
+            err=True,
+        )
+    for name, value in snapshot["counters"].items():
+        click.echo(f"  {name}: {value}", err=True)
 
-    return passwords
+
+def _compile_policy(type_: str, name: str, kwargs: dict) -> "CompliancePolicy":
+    """Compile a ``--policy`` and fit the generation options to it.
+
+    Syllable passwords are lengthened to the policy's minimum length when
+    needed; patterns too short for it are rejected up front.
+
+    Parameters
+    ----------
+    type_ : str
+        Generator type.
+    name : str
+        Built-in policy name, or the name of a ``compliance.custom_policies``
+        entry of the configuration.
+    kwargs : dict
+        Generation options, updated in place.
+
+    Returns
+    -------
+    CompliancePolicy
+        Compiled policy to pass to the generator.
+
+    Raises
+    ------
+    click.BadParameter
+        If the policy is unknown or invalid, the generator is a plugin, or
+        the pattern is shorter than the policy allows.
+    """
+    from clinkey_cli.security.compliance import POLICIES, compile_policy
+
+    if type_ not in ("normal", "strong", "super_strong", "passphrase", "pattern"):
+        raise click.BadParameter(
+            f"'{type_}' generators do not support policies.", param_hint="--policy"
+        )
+
+    custom_policies = ()
+    if name not in POLICIES:
+        from clinkey_cli.config.manager import ConfigManager
+
+        custom_policies = ConfigManager().get("compliance.custom_policies", [])
+    try:
+        compiled = compile_policy(name, custom_policies)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--policy") from exc
+
+    if "length" in kwargs:
+        kwargs["length"] = max(kwargs["length"], compiled.min_length)
+    elif type_ == "pattern":
+        try:
+            pattern_length = PatternGenerator.compile(kwargs["pattern"]).length
+        except ValueError:
+            pattern_length = None  # Reported by the generator
+        if pattern_length is not None and pattern_length < compiled.min_length:
+            raise click.BadParameter(
+                f"policy '{name}' requires at least {compiled.min_length} "
+                f"characters, the pattern produces {pattern_length}.",
+                param_hint="--policy",
+            )
+    return compiled
+
+
+class GeneratorChoice(click.Choice):
+    """``--type`` parameter type whose choices come from the generator registry.
+
+    Registered names are accepted without scanning installed packages. The
+    full list, including plugin generators, is only resolved for help text,
+    shell completion or an unrecognized value.
+    """
+
+    def __init__(self) -> None:
+        super().__init__((), case_sensitive=False)
+
+    @property
+    def choices(self) -> tuple[str, ...]:
+        return tuple(registry.list_generators())
+
+    @choices.setter
+    def choices(self, value) -> None:
+        # Set by click.Choice.__init__; the registry is the source of truth.
+        pass
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, str):
+            for name in registry.known_names():
+                if value.lower() == name.lower():
+                    return name
+        return super().convert(value, param, ctx)
 
 
 @click.command(context_settings={"help_option_names": ["-h", "--help"]})
@@ -629,12 +1001,12 @@ def _generate_passwords(
     "-t",
     "--type",
     "type_",
-    type=click.Choice(
-        ["normal", "strong", "super_strong", "passphrase", "pattern"],
-        case_sensitive=False
-    ),
+    type=GeneratorChoice(),
     default=None,
-    help="Password type: normal, strong, super_strong, passphrase, or pattern.",
+    help=(
+        "Password type: normal, strong, super_strong, passphrase, pattern, "
+        "or an installed plugin generator."
+    ),
 )
 @click.option(
     "-n",
@@ -691,7 +1063,90 @@ def _generate_passwords(
     "--pattern",
     type=str,
     default=None,
-    help="Pattern template for password generation (required for pattern type).",
+    help=(
+        "Pattern template for password generation (required for pattern type), "
+        "e.g. 'Cvvc-D{4}' or 'tok_[[:hex:]]{32}'."
+    ),
+)
+@click.option(
+    "--rules",
+    type=str,
+    default=None,
+    help=(
+        "Site password rules in passwordrules syntax, e.g. "
+        "'required: upper; required: digit; maxlength: 20' (pattern type only)."
+    ),
+)
+@click.option(
+    "--wordlist",
+    type=click.Path(
+        exists=True,
+        dir_okay=False,
+        resolve_path=True,
+        path_type=pathlib.Path,
+    ),
+    default=None,
+    help="Custom wordlist file, one word per line or JSON (passphrase type only).",
+)
+@click.option(
+    "--language",
+    type=click.Choice(("english", *available_languages())),
+    default=None,
+    help="Syllable language of normal, strong and super_strong passwords.",
+)
+@click.option(
+    "--min-bits",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Minimum entropy in bits; raises the length or word count to reach it.",
+)
+@click.option(
+    "--policy",
+    type=str,
+    default=None,
+    help="Compliance policy every password meets: nist, owasp or a configured one.",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Write passwords one per line as they are generated (no batch limit).",
+)
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes used to generate large batches.",
+)
+@click.option(
+    "--unordered",
+    is_flag=True,
+    help="With --workers, emit chunks as soon as any worker finishes one.",
+)
+@click.option(
+    "-u",
+    "--unique",
+    is_flag=True,
+    help="Guarantee no duplicates in the batch (implies --stream).",
+)
+@click.option(
+    "--unique-memory",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MEMORY_LIMIT_MB,
+    show_default=True,
+    help="Memory budget in MiB for --unique before spilling to disk.",
+)
+@click.option(
+    "--stats",
+    "show_stats",
+    is_flag=True,
+    help="Print generator counters and timings on stderr after the run.",
+)
+@click.option(
+    "--seed",
+    type=str,
+    default=None,
+    help="Reproducible output for benchmarks and tests. UNSAFE for real passwords.",
 )
 def main(
     length: Optional[int],
@@ -704,6 +1159,18 @@ def main(
     word_count: int,
     capitalize: bool,
     pattern: Optional[str],
+    rules: Optional[str],
+    wordlist: Optional[pathlib.Path],
+    language: Optional[str],
+    min_bits: Optional[float],
+    policy: Optional[str],
+    stream: bool,
+    workers: int,
+    unordered: bool,
+    unique: bool,
+    unique_memory: int,
+    show_stats: bool,
+    seed: Optional[str],
 ) -> None:
     """Generate secure, pronounceable passwords from the command line.
 
@@ -735,14 +1202,82 @@ def main(
     pattern : str | None
         Pattern template for pattern-based generation. Required when
         ``type_`` is ``"pattern"``. Example: ``"Cvvc-9999-Cvvc"``.
+    rules : str | None
+        Site password rules in ``passwordrules`` syntax, used by the
+        ``"pattern"`` type instead of a template. Passwords are sampled
+        directly from the compiled rules, with ``length`` clamped to their
+        bounds.
+    wordlist : pathlib.Path | None
+        Custom wordlist for passphrases. Its words are normalized and
+        deduplicated into a cached ``.clkidx`` index on first use, which
+        later runs memory-map directly.
+    language : str | None
+        Syllable language pack ("english" by default). Packs are compiled
+        once and cached on disk.
+    min_bits : float | None
+        Minimum entropy in bits. The smallest length (syllable types) or
+        word count (passphrase) reaching it is computed up front from the
+        generator's keyspace; a pattern below it is rejected.
+    policy : str | None
+        Compliance policy ("nist", "owasp" or a ``compliance.custom_policies``
+        name). Required character classes are placed while generating, so
+        every password complies on the first attempt.
+    stream : bool
+        Write passwords to ``output`` (or stdout) as they are generated,
+        through a bounded buffer, instead of collecting them first.
+    workers : int
+        Number of worker processes. Values above 1 shard generation across
+        a process pool.
+    unordered : bool
+        With several workers, yield chunks in completion order rather than
+        submission order.
+    unique : bool
+        Stream exactly ``number`` distinct passwords, rejecting duplicates.
+        The number of rejected duplicates is reported on stderr.
+    unique_memory : int
+        Memory budget in MiB for duplicate tracking before it moves to a
+        temporary on-disk index.
+    show_stats : bool
+        Collect the generator's hot-path counters (retries, truncated
+        characters, policy adjustments) and ``generate`` timings, and print
+        them on stderr once the passwords are written.
+    seed : str | None
+        Generate from a deterministic DRBG seeded with this value, so the
+        same command always prints the same passwords. Intended for
+        benchmarks and tests only; a warning is printed on stderr.
 
     Raises
     ------
     click.BadParameter
         If ``new_separator`` is provided but is not exactly one non-space
         character.
+    click.ClickException
+        If ``unique`` is set and the generator cannot produce enough
+        distinct passwords.
     """
-    interactive = length is None and type_ is None and number is None
+    interactive = (
+        length is None
+        and type_ is None
+        and number is None
+        and not stream
+        and not unique
+        and seed is None
+        and min_bits is None
+        and policy is None
+        and rules is None
+        and wordlist is None
+        and language is None
+        and workers == 1
+        and not unordered
+        and not show_stats
+    )
+
+    if seed is not None:
+        click.echo(
+            "Warning: --seed makes the output reproducible. "
+            "Never use these passwords as real credentials.",
+            err=True,
+        )
 
     if interactive:
         view.intro_logo()
@@ -800,6 +1335,57 @@ def main(
                 param_hint="--separator",
             )
 
+    stats = GeneratorStats() if show_stats else None
+
+    if stream or unique:
+        source = _iter_passwords(
+            type_=type_,
+            length=length,
+            number=None if unique else number,
+            lower=lower,
+            no_sep=no_sep,
+            separator=new_separator,
+            word_count=word_count,
+            capitalize=capitalize,
+            pattern=pattern,
+            workers=workers,
+            ordered=not unordered,
+            seed=seed,
+            wordlist=wordlist,
+            language=language,
+            min_bits=min_bits,
+            policy=policy,
+            rules=rules,
+            stats=stats,
+        )
+        unique_filter = None
+        passwords: Iterable[str] = source
+        if unique:
+            unique_filter = UniqueFilter(memory_limit_mb=unique_memory)
+            passwords = islice(unique_filter.filter(source), number)
+        try:
+            if output:
+                _write_passwords(output, passwords)
+                click.echo(f"Passwords saved to {output}")
+            else:
+                _stream_to_stdout(passwords)
+        except ValueError as exc:
+            raise click.ClickException(str(exc)) from exc
+        finally:
+            # Generators and pools expose close(); plain iterators need none
+            close = getattr(source, "close", None)
+            if close is not None:
+                close()
+            if unique_filter:
+                unique_filter.close()
+        if unique_filter:
+            click.echo(
+                f"Rejected {unique_filter.rejected} duplicate password(s).", err=True
+            )
+        if stats is not None:
+            _print_stats(stats)
+        return
+
     passwords = _generate_passwords(
         type_=type_,
         length=length,
@@ -810,6 +1396,15 @@ def main(
         word_count=word_count,
         capitalize=capitalize,
         pattern=pattern,
+        workers=workers,
+        ordered=not unordered,
+        seed=seed,
+        wordlist=wordlist,
+        language=language,
+        min_bits=min_bits,
+        policy=policy,
+        rules=rules,
+        stats=stats,
     )
 
     if output:
@@ -817,6 +1412,8 @@ def main(
         click.echo(f"Passwords saved to {output}")
     else:
         view.display_passwords(passwords, interactive=interactive)
+    if stats is not None:
+        _print_stats(stats)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -2,19 +2,57 @@
 
 This module provides the base generator interface and concrete implementations
 for different password generation strategies.
+
+Exports are resolved lazily on first access (PEP 562), so importing one
+generator module does not load the others or their data files.
 """
 
-from clinkey_cli.generators.base import BaseGenerator
-from clinkey_cli.generators.passphrase import PassphraseGenerator
-from clinkey_cli.generators.pattern import PatternGenerator
-from clinkey_cli.generators.registry import GeneratorRegistry, registry
-from clinkey_cli.generators.syllable import SyllableGenerator
+from importlib import import_module
+from typing import Any
+
+# Public name -> module defining it
+_EXPORTS = {
+    "BaseGenerator": "clinkey_cli.generators.base",
+    "SyllableGenerator": "clinkey_cli.generators.syllable",
+    "PassphraseGenerator": "clinkey_cli.generators.passphrase",
+    "PatternGenerator": "clinkey_cli.generators.pattern",
+    "RandomSource": "clinkey_cli.generators.random_source",
+    "DeterministicSource": "clinkey_cli.generators.random_source",
+    "default_source": "clinkey_cli.generators.random_source",
+    "GeneratorRegistry": "clinkey_cli.generators.registry",
+    "registry": "clinkey_cli.generators.registry",
+    "generate_parallel": "clinkey_cli.generators.parallel",
+    "UniqueFilter": "clinkey_cli.generators.unique",
+    "GeneratorStats": "clinkey_cli.generators.stats",
+}
 
 __all__ = [
     "BaseGenerator",
     "SyllableGenerator",
     "PassphraseGenerator",
     "PatternGenerator",
+    "RandomSource",
+    "DeterministicSource",
+    "default_source",
     "GeneratorRegistry",
     "registry",
+    "generate_parallel",
+    "UniqueFilter",
+    "GeneratorStats",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module defining ``name`` on first access."""
+
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,89 @@
+"""Asyncio adapters for password generation.
+
+Generation is CPU-bound, so running it directly in a coroutine would block
+the event loop. These helpers move the work to an executor in bounded
+chunks and hand results back through an async iterator, keeping the loop
+responsive while large batches are produced.
+"""
+
+from collections.abc import AsyncIterator, Iterable, Iterator
+from itertools import islice
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# Number of passwords generated per executor job when streaming a batch
+ASYNC_CHUNK_SIZE = 256
+
+
+def _next_chunk(iterator: Iterator[str], size: int) -> list[str]:
+    """Pull up to ``size`` items from ``iterator`` (run in the executor)."""
+
+    return list(islice(iterator, size))
+
+
+def aiter_chunks(
+    passwords: Iterable[str],
+    executor: "Executor | None" = None,
+    chunk_size: int = ASYNC_CHUNK_SIZE,
+) -> AsyncIterator[str]:
+    """Consume a synchronous password iterable from an executor.
+
+    Parameters
+    ----------
+    passwords : Iterable[str]
+        Lazy source, typically from ``iter_generate`` or ``iter_passwords``.
+        It is only ever advanced by one executor job at a time.
+    executor : concurrent.futures.Executor | None, default None
+        Executor running the generation. ``None`` uses the event loop's
+        default thread pool. The source is shared with the job, so it must
+        be a thread-based executor.
+    chunk_size : int, default 256
+        Passwords generated per executor job. Smaller chunks react faster
+        to cancellation; larger ones amortize scheduling overhead.
+
+    Returns
+    -------
+    AsyncIterator[str]
+        Async iterator over the passwords. The next chunk is generated
+        while the current one is consumed. Cancelling the consuming task or
+        closing the iterator stops generation; at most the chunk already
+        running completes, and its result is discarded.
+
+    Raises
+    ------
+    ValueError
+        If chunk_size is not strictly positive.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    return _stream_chunks(iter(passwords), executor, chunk_size)
+
+
+async def _stream_chunks(
+    iterator: Iterator[str], executor: "Executor | None", chunk_size: int
+) -> AsyncIterator[str]:
+    """Yield chunks from the executor, keeping one chunk in flight."""
+
+    # Imported on first use: asyncio is costly to import for CLI runs
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+
+    def submit() -> "asyncio.Future[list[str]]":
+        return loop.run_in_executor(executor, _next_chunk, iterator, chunk_size)
+
+    pending: "asyncio.Future[list[str]] | None" = submit()
+    try:
+        while pending is not None:
+            chunk = await pending
+            # A short chunk means the iterator is exhausted
+            pending = submit() if len(chunk) == chunk_size else None
+            for password in chunk:
+                yield password
+    finally:
+        if pending is not None:
+            # Drops a queued job; one already running finishes in the
+            # background and its chunk is discarded.
+            pending.cancel()
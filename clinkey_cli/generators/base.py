@@ -4,7 +4,23 @@ Defines the common interface that all password generators must implement,
 along with shared utility methods for password transformation.
 """
 
+import math
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
+from functools import partial
+from typing import TYPE_CHECKING, Any
+from itertools import count as _count
+from itertools import repeat
+
+from clinkey_cli.generators.aio import ASYNC_CHUNK_SIZE, aiter_chunks
+from clinkey_cli.generators.random_source import RandomSource, default_source
+from clinkey_cli.generators.spec import compile_translation
+from clinkey_cli.generators.stats import GeneratorStats, timed
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from clinkey_cli.security.compliance import CompliancePolicy
 
 
 class BaseGenerator(ABC):
@@ -14,16 +30,55 @@ class BaseGenerator(ABC):
     the `generate` method. This ensures a consistent API across all
     generator types.
 
+    Parameters
+    ----------
+    random_source : RandomSource | None, default None
+        Source of randomness. Defaults to the shared buffered OS source.
+
     Methods
     -------
     generate(length: int, **kwargs) -> str
         Generate a password of specified length with optional parameters.
+    iter_generate(count: int | None, **kwargs) -> Iterator[str]
+        Lazily yield passwords generated with the same parameters.
+    agenerate(executor: Executor | None, **kwargs) -> str
+        Coroutine generating one password off the event loop.
+    agenerate_batch(count: int | None, **kwargs) -> AsyncIterator[str]
+        Async iterator streaming passwords generated off the event loop.
+    keyspace(**kwargs) -> int
+        Number of equally likely passwords for the given parameters.
+    entropy_bits(**kwargs) -> float
+        Entropy in bits of passwords generated with the given parameters.
+    params_for_bits(min_bits: float, **kwargs) -> dict
+        Smallest parameters reaching a target entropy.
+    enable_stats(stats: GeneratorStats | None) -> GeneratorStats
+        Start collecting hot-path counters and ``generate`` timings.
+    disable_stats() -> None
+        Stop collecting statistics.
+    stats() -> dict
+        Snapshot of the collected counters and timers.
     fit_to_length(password: str, target_length: int) -> str
         Fit password to exact target length by truncating or padding.
     transform(password: str, lower: bool, no_separator: bool, separator: str | None) -> str
         Apply transformations to generated password.
     """
 
+    # Attached by enable_stats(); hot paths only pay for an ``is None`` check
+    _stats: GeneratorStats | None = None
+
+    # Set on instances cached by GeneratorRegistry.create(), which callers share
+    _shared: bool = False
+
+    def __init__(self, random_source: RandomSource | None = None) -> None:
+        """Initialize generator with its randomness source.
+
+        Parameters
+        ----------
+        random_source : RandomSource | None, default None
+            Source of randomness. Defaults to the shared buffered OS source.
+        """
+        self._random = random_source if random_source is not None else default_source
+
     @abstractmethod
     def generate(self, length: int, **kwargs) -> str:
         """Generate a password of specified length.
@@ -47,6 +102,270 @@ class BaseGenerator(ABC):
         """
         pass
 
+    def iter_generate(self, count: int | None = None, **kwargs) -> Iterator[str]:
+        """Lazily yield passwords generated with the same parameters.
+
+        Passwords are produced one at a time, so memory use stays constant
+        regardless of how many are requested.
+
+        Parameters
+        ----------
+        count : int | None, default None
+            Number of passwords to yield. ``None`` yields indefinitely.
+        **kwargs : dict
+            Arguments forwarded to :meth:`generate` for every password.
+
+        Returns
+        -------
+        Iterator[str]
+            Lazy iterator over generated passwords.
+
+        Raises
+        ------
+        ValueError
+            If count is negative.
+
+        Examples
+        --------
+        >>> gen = PatternGenerator()
+        >>> len(list(gen.iter_generate(3, pattern="DDDD")))
+        3
+        """
+        if count is not None and count < 0:
+            raise ValueError(f"count must be non-negative, got {count}")
+
+        ticks = _count() if count is None else repeat(None, count)
+        return (self.generate(**kwargs) for _ in ticks)
+
+    async def agenerate(self, executor: "Executor | None" = None, **kwargs) -> str:
+        """Generate one password without blocking the event loop.
+
+        Parameters
+        ----------
+        executor : concurrent.futures.Executor | None, default None
+            Executor running :meth:`generate`. ``None`` uses the event
+            loop's default thread pool.
+        **kwargs : dict
+            Arguments forwarded to :meth:`generate`.
+
+        Returns
+        -------
+        str
+            Generated password.
+
+        Examples
+        --------
+        >>> asyncio.run(PatternGenerator().agenerate(pattern="DDDD"))  # doctest: +SKIP
+        '4821'
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(self.generate, **kwargs))
+
+    def agenerate_batch(
+        self,
+        count: int | None = None,
+        executor: "Executor | None" = None,
+        chunk_size: int = ASYNC_CHUNK_SIZE,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """Stream passwords generated in an executor, chunk by chunk.
+
+        Parameters
+        ----------
+        count : int | None, default None
+            Number of passwords to yield. ``None`` yields indefinitely.
+        executor : concurrent.futures.Executor | None, default None
+            Thread-based executor running the generation. ``None`` uses the
+            event loop's default thread pool.
+        chunk_size : int, default 256
+            Passwords generated per executor job.
+        **kwargs : dict
+            Arguments forwarded to :meth:`generate` for every password.
+
+        Returns
+        -------
+        AsyncIterator[str]
+            Async iterator over generated passwords. Cancelling the consumer
+            or closing the iterator stops generation.
+
+        Raises
+        ------
+        ValueError
+            If count is negative or chunk_size is not strictly positive.
+
+        Examples
+        --------
+        >>> async def collect():
+        ...     gen = PatternGenerator()
+        ...     return [p async for p in gen.agenerate_batch(3, pattern="DD")]
+        >>> len(asyncio.run(collect()))
+        3
+        """
+        return aiter_chunks(self.iter_generate(count, **kwargs), executor, chunk_size)
+
+    def keyspace(self, length: int = 0, **kwargs: Any) -> int:
+        """Count the passwords :meth:`generate` can produce, in closed form.
+
+        Computed from the generator's own tables, without generating or
+        analyzing any password.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            Arguments that would be passed to :meth:`generate`.
+
+        Returns
+        -------
+        int
+            Number of equally likely outcomes.
+
+        Raises
+        ------
+        NotImplementedError
+            If the generator does not model its keyspace.
+        ValueError
+            If the arguments are invalid for :meth:`generate`.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not report its keyspace")
+
+    def entropy_bits(self, **kwargs: Any) -> float:
+        """Entropy in bits of one password generated with ``kwargs``.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            Arguments that would be passed to :meth:`generate`.
+
+        Returns
+        -------
+        float
+            ``log2`` of :meth:`keyspace`.
+
+        Raises
+        ------
+        NotImplementedError
+            If the generator does not model its keyspace.
+        ValueError
+            If the arguments are invalid for :meth:`generate`.
+        """
+        return math.log2(self.keyspace(**kwargs))
+
+    def params_for_bits(self, min_bits: float, **kwargs: Any) -> dict[str, Any]:
+        """Return :meth:`generate` arguments reaching ``min_bits`` of entropy.
+
+        Generators with a size parameter (length, word count) raise it to the
+        smallest value that reaches the target; it is never lowered. The
+        base implementation only checks the given arguments.
+
+        Parameters
+        ----------
+        min_bits : float
+            Required entropy in bits.
+        **kwargs : dict
+            Arguments that would be passed to :meth:`generate`.
+
+        Returns
+        -------
+        dict[str, Any]
+            Arguments for :meth:`generate`.
+
+        Raises
+        ------
+        NotImplementedError
+            If the generator does not model its keyspace.
+        ValueError
+            If the target cannot be reached.
+        """
+        bits = self.entropy_bits(**kwargs)
+        if bits < min_bits:
+            raise ValueError(
+                f"cannot reach {min_bits:g} bits: these parameters give {bits:.1f}"
+            )
+        return kwargs
+
+    def enable_stats(self, stats: GeneratorStats | None = None) -> GeneratorStats:
+        """Start collecting statistics on this instance.
+
+        Counters are updated on the hot paths and every :meth:`generate`
+        call is timed under ``"generate"``. Disabled generators pay nothing
+        for timing and a single ``None`` check per counter site.
+
+        Parameters
+        ----------
+        stats : GeneratorStats | None, default None
+            Collector to fill, possibly shared with other generators. A new
+            one is created when omitted.
+
+        Returns
+        -------
+        GeneratorStats
+            Collector in use.
+
+        Raises
+        ------
+        RuntimeError
+            If the instance is shared, i.e. returned by
+            :meth:`GeneratorRegistry.create
+            <clinkey_cli.generators.registry.GeneratorRegistry.create>`.
+
+        Examples
+        --------
+        >>> gen = PatternGenerator()
+        >>> _ = gen.enable_stats()
+        >>> _ = gen.generate(pattern="DDDD")
+        >>> gen.stats()["timers"]["generate"]["calls"]
+        1
+        """
+        if self._shared:
+            raise RuntimeError(
+                f"Cannot instrument a shared {type(self).__name__} from "
+                "registry.create(); enable stats on a private instance"
+            )
+        if stats is None:
+            stats = GeneratorStats()
+        self._stats = stats
+        # Shadow the method on this instance only, so other instances and
+        # disabled generators run the plain method; mypy rejects assigning to
+        # a method, but the instance attribute is exactly what we want here
+        self.generate = timed(  # type: ignore[method-assign]
+            "generate", type(self).generate.__get__(self), stats
+        )
+        return stats
+
+    def disable_stats(self) -> None:
+        """Stop collecting statistics and drop the collector."""
+
+        self.__dict__.pop("_stats", None)
+        self.__dict__.pop("generate", None)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the statistics collected since :meth:`enable_stats`.
+
+        Returns
+        -------
+        dict[str, Any]
+            ``{"counters": {...}, "timers": {...}}`` (see
+            :meth:`GeneratorStats.snapshot`), empty if stats are disabled.
+        """
+        if self._stats is None:
+            return {"counters": {}, "timers": {}}
+        return self._stats.snapshot()
+
+    def _apply_policy(
+        self,
+        password: str,
+        policy: "CompliancePolicy",
+        fixed: frozenset[int] = frozenset(),
+    ) -> str:
+        """Apply a compliance policy, counting the passwords it adjusts."""
+
+        compliant = policy.apply(password, self._random, fixed)
+        if self._stats is not None and compliant != password:
+            self._stats.add("policy.adjusted")
+        return compliant
+
     def fit_to_length(self, password: str, target_length: int) -> str:
         """Fit password to exact target length.
 
@@ -62,6 +381,13 @@ class BaseGenerator(ABC):
         str
             Password adjusted to exact target length.
         """
+        if self._stats is not None:
+            difference = len(password) - target_length
+            if difference > 0:
+                self._stats.add("fit_to_length.truncated_chars", difference)
+            elif difference < 0:
+                self._stats.add("fit_to_length.padded_chars", -difference)
+
         if len(password) == target_length:
             return password
         elif len(password) > target_length:
@@ -96,18 +422,6 @@ class BaseGenerator(ABC):
         str
             Transformed password.
         """
-        result = password
-
-        # Apply separator transformations first
-        if no_separator:
-            # Remove common separators
-            result = result.replace("-", "").replace("_", "")
-        elif separator is not None:
-            # Replace separators with custom character
-            result = result.replace("-", separator).replace("_", separator)
-
-        # Apply case transformation
-        if lower:
-            result = result.lower()
-
-        return result
+        # One translate pass instead of chained replace() and lower() calls
+        table = compile_translation(lower, no_separator, separator)
+        return password.translate(table) if table else password
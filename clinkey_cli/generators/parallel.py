@@ -0,0 +1,283 @@
+"""Multi-process sharded batch generation.
+
+Splits a large batch into fixed-size chunks, generates each chunk in a
+``ProcessPoolExecutor`` worker and streams the results back, so generation
+scales with the number of CPU cores instead of running on a single one.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import chain, repeat
+from typing import Any, Iterator
+
+from clinkey_cli.generators.random_source import (
+    RandomSource,
+    default_source,
+    derive_seed,
+)
+from clinkey_cli.generators.registry import registry
+from clinkey_cli.generators.stats import GeneratorStats
+from clinkey_cli.preload import preload
+
+# Number of passwords generated per task and sent back in one message
+DEFAULT_CHUNK_SIZE = 1000
+
+# Chunks queued per worker so that no worker idles while results are consumed
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+
+def _init_worker() -> None:
+    """Give the worker process its own independently seeded randomness."""
+
+    default_source.reset()
+    registry.clear_instances()
+
+
+def _iter_chunk(
+    name: str,
+    size: int,
+    kwargs: dict[str, Any],
+    seed: bytes | None = None,
+    options: dict[str, Any] | None = None,
+    stats: GeneratorStats | None = None,
+) -> Iterator[str]:
+    """Return a lazy iterator over one chunk of passwords.
+
+    Parameters
+    ----------
+    name : str
+        Registry name of the generator to use.
+    size : int
+        Number of passwords in the chunk.
+    kwargs : dict[str, Any]
+        Arguments forwarded to the generator's ``generate`` method.
+    seed : bytes | None, default None
+        Seed of a deterministic source dedicated to this chunk.
+    options : dict[str, Any] | None, default None
+        Arguments forwarded to the generator's constructor.
+    stats : GeneratorStats | None, default None
+        Collector filled by a private, instrumented generator instance.
+
+    Returns
+    -------
+    Iterator[str]
+        Lazy iterator over the chunk's passwords.
+    """
+    options = options or {}
+    if seed is not None:
+        source = RandomSource.deterministic(seed)
+        generator = registry.get(name)(random_source=source, **options)
+    elif stats is not None:
+        generator = registry.get(name)(**options)
+    else:
+        generator = registry.create(name, **options)
+    if stats is not None:
+        generator.enable_stats(stats)
+    return generator.iter_generate(size, **kwargs)
+
+
+def _generate_chunk(
+    name: str,
+    size: int,
+    kwargs: dict[str, Any],
+    seed: bytes | None = None,
+    options: dict[str, Any] | None = None,
+) -> list[str]:
+    """Generate one chunk of passwords inside a worker process.
+
+    Parameters
+    ----------
+    name : str
+        Registry name of the generator to use.
+    size : int
+        Number of passwords in the chunk.
+    kwargs : dict[str, Any]
+        Arguments forwarded to the generator's ``generate`` method.
+    seed : bytes | None, default None
+        Seed of a deterministic source dedicated to this chunk.
+    options : dict[str, Any] | None, default None
+        Arguments forwarded to the generator's constructor.
+
+    Returns
+    -------
+    list[str]
+        Generated passwords.
+    """
+    return list(_iter_chunk(name, size, kwargs, seed, options))
+
+
+def _chunk_sizes(count: int | None, chunk_size: int) -> Iterator[int]:
+    """Split ``count`` passwords into chunk sizes (unbounded if ``None``)."""
+
+    if count is None:
+        return repeat(chunk_size)
+
+    full, remainder = divmod(count, chunk_size)
+    sizes = [chunk_size] * full
+    if remainder:
+        sizes.append(remainder)
+    return iter(sizes)
+
+
+def generate_parallel(
+    name: str,
+    count: int | None,
+    workers: int,
+    ordered: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: int | str | bytes | None = None,
+    options: dict[str, Any] | None = None,
+    stats: GeneratorStats | None = None,
+    **kwargs: Any,
+) -> Iterator[str]:
+    """Generate passwords across several worker processes.
+
+    Parameters
+    ----------
+    name : str
+        Registry name of the generator to use (e.g. ``"strong"``).
+    count : int | None
+        Number of passwords to yield. ``None`` yields indefinitely.
+    workers : int
+        Number of worker processes. With 1, the chunks are generated one
+        after another in this process, without a pool.
+    ordered : bool, default True
+        Yield chunks in submission order. When False, chunks are yielded as
+        soon as any worker finishes one, which avoids waiting on stragglers.
+    chunk_size : int, default 1000
+        Number of passwords generated per task.
+    seed : int | str | bytes | None, default None
+        Make the output reproducible (unsafe for real credentials). Each
+        chunk draws from its own seed derived from ``seed`` and the chunk
+        number, so ordered output does not depend on ``workers``.
+    options : dict[str, Any] | None, default None
+        Arguments forwarded to the generator's constructor in each worker
+        (e.g. ``{"wordlist": path}``). Must be picklable.
+    stats : GeneratorStats | None, default None
+        Collector filled with the generators' counters and timings.
+        Requires ``workers=1``.
+    **kwargs
+        Arguments forwarded to the generator's ``generate`` method.
+
+    Returns
+    -------
+    Iterator[str]
+        Lazy iterator over generated passwords. At most
+        ``workers * CHUNKS_IN_FLIGHT_PER_WORKER`` chunks are pending at once,
+        so memory stays bounded however many passwords are requested.
+
+    Raises
+    ------
+    ValueError
+        If the generator name is unknown, count, workers or chunk_size are
+        out of range, or stats are requested with several workers.
+
+    Examples
+    --------
+    >>> stream = generate_parallel("pattern", 10000, workers=4, pattern="DDDD")
+    >>> len(list(stream))
+    10000
+    """
+    registry.get(name)
+
+    if count is not None and count < 0:
+        raise ValueError(f"count must be non-negative, got {count}")
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    if stats is not None and workers > 1:
+        raise ValueError("stats can only be collected with workers=1")
+
+    if workers == 1:
+        return _run_serial(
+            name, _chunk_sizes(count, chunk_size), kwargs, seed, options, stats
+        )
+
+    # Forked workers then share the datasets instead of each building them
+    language = (options or {}).get("language")
+    preload(languages=[language] if language else ())
+
+    return _run_pool(
+        name,
+        _chunk_sizes(count, chunk_size),
+        workers,
+        ordered,
+        kwargs,
+        seed,
+        options,
+    )
+
+
+def _run_serial(
+    name: str,
+    sizes: Iterator[int],
+    kwargs: dict[str, Any],
+    seed: int | str | bytes | None = None,
+    options: dict[str, Any] | None = None,
+    stats: GeneratorStats | None = None,
+) -> Iterator[str]:
+    """Generate the chunks in this process, with the pool's chunk seeds.
+
+    The first chunk is set up immediately, so invalid generator arguments
+    are reported before the first password is requested.
+    """
+    chunks = (
+        _iter_chunk(
+            name,
+            size,
+            kwargs,
+            None if seed is None else derive_seed(seed, index),
+            options,
+            stats,
+        )
+        for index, size in enumerate(sizes)
+    )
+    first = next(chunks, ())
+    return (password for chunk in chain([first], chunks) for password in chunk)
+
+
+def _run_pool(
+    name: str,
+    sizes: Iterator[int],
+    workers: int,
+    ordered: bool,
+    kwargs: dict[str, Any],
+    seed: int | str | bytes | None = None,
+    options: dict[str, Any] | None = None,
+) -> Iterator[str]:
+    """Drive the process pool, keeping a bounded number of chunks in flight."""
+
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    pending: deque[Future] = deque()
+    chunks = enumerate(sizes)
+
+    def submit() -> None:
+        item = next(chunks, None)
+        if item is None:
+            return
+        index, size = item
+        chunk_seed = None if seed is None else derive_seed(seed, index)
+        pending.append(
+            executor.submit(_generate_chunk, name, size, kwargs, chunk_seed, options)
+        )
+
+    try:
+        for _ in range(workers * CHUNKS_IN_FLIGHT_PER_WORKER):
+            submit()
+
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                done = [future for future in pending if future in finished]
+                for future in done:
+                    pending.remove(future)
+
+            for future in done:
+                chunk = future.result()
+                submit()
+                yield from chunk
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
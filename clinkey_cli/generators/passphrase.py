@@ -4,16 +4,25 @@ Generates memorable passphrases by combining randomly selected words
 from curated wordlists like the EFF large wordlist.
 """
 
-import secrets
-from typing import Any
+import math
+import os
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from clinkey_cli.generators.base import BaseGenerator
-from clinkey_cli.wordlists import EFF_LARGE_WORDLIST
+from clinkey_cli.generators.random_source import HAS_NUMPY, RandomSource
+from clinkey_cli.wordlists.custom import load_wordlist
+from clinkey_cli.wordlists.eff_large import load_eff_large
+from clinkey_cli.wordlists.packed import PackedWordlist
 
+if TYPE_CHECKING:
+    from clinkey_cli.security.compliance import CompliancePolicy
 
-# Wordlist registry
+
+# Wordlist registry: loaders of the bundled lists, mapped on first use
 WORDLISTS = {
-    "eff_large": EFF_LARGE_WORDLIST,
+    "eff_large": load_eff_large,
 }
 
 # Validation constants
@@ -21,6 +30,42 @@ MIN_WORD_COUNT = 3
 MAX_WORD_COUNT = 10
 DEFAULT_WORD_COUNT = 4
 
+# Batch size (in words) from which generate_many samples through NumPy
+NUMPY_MIN_WORDS = 4096
+
+
+@lru_cache(maxsize=8)
+def _cased_wordlist(words: Sequence[str], capitalize: bool) -> Sequence[str]:
+    """Return the capitalized or uppercase variant of a wordlist.
+
+    Parameters
+    ----------
+    words : Sequence[str]
+        Loaded wordlist.
+    capitalize : bool
+        Capitalize words when True, uppercase them otherwise.
+
+    Returns
+    -------
+    Sequence[str]
+        Variant index-aligned with ``words`` so one index draw serves any
+        casing. Packed wordlists are recased blob-wide (or per selected
+        word for large lists) and still decode words on demand.
+    """
+    if isinstance(words, PackedWordlist):
+        return words.capitalized() if capitalize else words.upper()
+    method = str.capitalize if capitalize else str.upper
+    return tuple(method(word) for word in words)
+
+
+def _select(words: Sequence[str], indices: list[int]) -> list[str]:
+    """Return the words at ``indices``, in bulk for packed wordlists."""
+
+    take = getattr(words, "take", None)
+    if take is not None:
+        return take(indices)
+    return [words[index] for index in indices]
+
 
 class PassphraseGenerator(BaseGenerator):
     """Generate passphrases from word lists.
@@ -30,15 +75,18 @@ class PassphraseGenerator(BaseGenerator):
 
     Parameters
     ----------
-    wordlist : str, default "eff_large"
-        Wordlist to use. Options: "eff_large".
+    wordlist : str | os.PathLike, default "eff_large"
+        Wordlist to use: a bundled name ("eff_large") or the path of a
+        custom wordlist file, indexed on first use.
+    random_source : RandomSource | None, default None
+        Source of randomness. Defaults to the shared buffered OS source.
 
     Attributes
     ----------
     wordlist_name : str
-        Name of the loaded wordlist.
-    _wordlist : list[str]
-        Loaded wordlist.
+        Name (or path) of the loaded wordlist.
+    _wordlist : Sequence[str]
+        Loaded wordlist (memory-mapped for the bundled lists).
 
     Examples
     --------
@@ -48,27 +96,53 @@ class PassphraseGenerator(BaseGenerator):
     4
     """
 
-    def __init__(self, wordlist: str = "eff_large"):
+    def __init__(
+        self,
+        wordlist: str | os.PathLike = "eff_large",
+        random_source: RandomSource | None = None,
+    ):
         """Initialize passphrase generator with wordlist.
 
         Parameters
         ----------
-        wordlist : str, default "eff_large"
-            Name of wordlist to use.
+        wordlist : str | os.PathLike, default "eff_large"
+            Name of a bundled wordlist, or path of a wordlist file.
+        random_source : RandomSource | None, default None
+            Source of randomness. Defaults to the shared buffered OS source.
 
         Raises
         ------
         ValueError
-            If wordlist name is not recognized.
+            If wordlist is neither a bundled name nor an existing file, or
+            the file contains no words.
         """
-        if wordlist not in WORDLISTS:
+        if wordlist in WORDLISTS:
+            words = WORDLISTS[wordlist]()
+        elif os.path.isfile(wordlist):
+            words = load_wordlist(wordlist)
+        else:
             available = ", ".join(WORDLISTS.keys())
             raise ValueError(
-                f"Unknown wordlist: '{wordlist}'. Available: {available}"
+                f"Unknown wordlist: '{wordlist}'. "
+                f"Available: {available}, or the path of a wordlist file"
             )
 
-        self.wordlist_name = wordlist
-        self._wordlist = WORDLISTS[wordlist]
+        super().__init__(random_source)
+        self.wordlist_name = os.fspath(wordlist)
+        self._wordlist = words
+
+    @staticmethod
+    def _validate_word_count(word_count: int) -> None:
+        """Raise ValueError if word_count is outside the supported range."""
+
+        if word_count < MIN_WORD_COUNT:
+            raise ValueError(
+                f"word_count must be at least {MIN_WORD_COUNT}, got {word_count}"
+            )
+        if word_count > MAX_WORD_COUNT:
+            raise ValueError(
+                f"word_count cannot exceed {MAX_WORD_COUNT}, got {word_count}"
+            )
 
     def generate(
         self,
@@ -76,6 +150,7 @@ class PassphraseGenerator(BaseGenerator):
         word_count: int = DEFAULT_WORD_COUNT,
         separator: str = "-",
         capitalize: bool = True,
+        policy: "CompliancePolicy | None" = None,
         **kwargs: Any,
     ) -> str:
         """Generate a passphrase.
@@ -90,6 +165,9 @@ class PassphraseGenerator(BaseGenerator):
             Separator between words. Use "" for no separator.
         capitalize : bool, default True
             Capitalize first letter of each word.
+        policy : CompliancePolicy | None, default None
+            Compiled policy whose character classes are placed in the
+            passphrase, so it complies without regeneration.
         **kwargs
             Additional arguments (ignored).
 
@@ -110,24 +188,191 @@ class PassphraseGenerator(BaseGenerator):
         >>> "-" in passphrase
         True
         """
-        # Validate word count
-        if word_count < MIN_WORD_COUNT:
-            raise ValueError(
-                f"word_count must be at least {MIN_WORD_COUNT}, got {word_count}"
-            )
-        if word_count > MAX_WORD_COUNT:
+        self._validate_word_count(word_count)
+
+        # Select random words from the precomputed casing variant
+        table = _cased_wordlist(self._wordlist, capitalize)
+        indices = self._random.indices(len(table), word_count)
+        passphrase = separator.join(_select(table, indices))
+        if policy is not None:
+            passphrase = self._apply_policy(passphrase, policy)
+        return passphrase
+
+    def keyspace(
+        self,
+        length: int = 0,
+        word_count: int = DEFAULT_WORD_COUNT,
+        **kwargs: Any,
+    ) -> int:
+        """Count the word sequences a passphrase can be built from.
+
+        Parameters
+        ----------
+        length : int, default 0
+            Ignored for passphrases.
+        word_count : int, default 4
+            Number of words in the passphrase.
+        **kwargs
+            Additional arguments (ignored: casing and separators do not
+            change the number of choices).
+
+        Returns
+        -------
+        int
+            ``len(wordlist) ** word_count``. With an empty separator, distinct
+            sequences may concatenate to the same text.
+
+        Raises
+        ------
+        ValueError
+            If word_count is out of valid range.
+
+        Examples
+        --------
+        >>> PassphraseGenerator().keyspace(word_count=3)
+        470184984576
+        """
+        self._validate_word_count(word_count)
+        return len(self._wordlist) ** word_count
+
+    def entropy_bits(
+        self,
+        length: int = 0,
+        word_count: int = DEFAULT_WORD_COUNT,
+        **kwargs: Any,
+    ) -> float:
+        """Entropy in bits of a passphrase of ``word_count`` words.
+
+        Parameters
+        ----------
+        length : int, default 0
+            Ignored for passphrases.
+        word_count : int, default 4
+            Number of words in the passphrase.
+        **kwargs
+            Additional arguments (ignored).
+
+        Returns
+        -------
+        float
+            ``word_count * log2(len(wordlist))``.
+
+        Raises
+        ------
+        ValueError
+            If word_count is out of valid range.
+
+        Examples
+        --------
+        >>> round(PassphraseGenerator().entropy_bits(word_count=6), 1)
+        77.5
+        """
+        self._validate_word_count(word_count)
+        return word_count * math.log2(len(self._wordlist))
+
+    def params_for_bits(self, min_bits: float, **kwargs: Any) -> dict[str, Any]:
+        """Raise ``word_count`` to the smallest value reaching ``min_bits``.
+
+        Parameters
+        ----------
+        min_bits : float
+            Required entropy in bits.
+        **kwargs : dict
+            Arguments that would be passed to :meth:`generate`.
+
+        Returns
+        -------
+        dict[str, Any]
+            ``kwargs`` with ``word_count`` set, never below the given value.
+
+        Raises
+        ------
+        ValueError
+            If even ``MAX_WORD_COUNT`` words fall short of ``min_bits``.
+
+        Examples
+        --------
+        >>> PassphraseGenerator().params_for_bits(70)["word_count"]
+        6
+        """
+        word_count = kwargs.get("word_count", DEFAULT_WORD_COUNT)
+        self._validate_word_count(word_count)
+        word_bits = math.log2(len(self._wordlist))
+        needed = max(word_count, math.ceil(min_bits / word_bits))
+        if needed > MAX_WORD_COUNT:
             raise ValueError(
-                f"word_count cannot exceed {MAX_WORD_COUNT}, got {word_count}"
+                f"cannot reach {min_bits:g} bits: {MAX_WORD_COUNT} words from "
+                f"'{self.wordlist_name}' give {MAX_WORD_COUNT * word_bits:.1f}"
             )
+        return {**kwargs, "word_count": needed}
+
+    def generate_many(
+        self,
+        n: int,
+        word_count: int = DEFAULT_WORD_COUNT,
+        separator: str = "-",
+        capitalize: bool = True,
+        policy: "CompliancePolicy | None" = None,
+    ) -> list[str]:
+        """Generate ``n`` passphrases from a single batch of word indices.
+
+        All ``n * word_count`` indices are drawn in one operation from the
+        random buffer, with unbiased rejection sampling before reduction
+        modulo the wordlist size. Large batches use NumPy when installed.
+
+        Parameters
+        ----------
+        n : int
+            Number of passphrases to generate.
+        word_count : int, default 4
+            Number of words per passphrase.
+        separator : str, default "-"
+            Separator between words.
+        capitalize : bool, default True
+            Capitalize first letter of each word.
+        policy : CompliancePolicy | None, default None
+            Compiled policy applied to every passphrase.
+
+        Returns
+        -------
+        list[str]
+            Generated passphrases, identical in format to :meth:`generate`.
+
+        Raises
+        ------
+        ValueError
+            If n is negative or word_count is out of valid range.
+
+        Examples
+        --------
+        >>> gen = PassphraseGenerator()
+        >>> len(gen.generate_many(100, word_count=5))
+        100
+        """
+        if n < 0:
+            raise ValueError(f"n must be non-negative, got {n}")
+        self._validate_word_count(word_count)
+
+        table = _cased_wordlist(self._wordlist, capitalize)
+        total = n * word_count
 
-        # Select random words
-        words = [secrets.choice(self._wordlist) for _ in range(word_count)]
+        if self._stats is not None:
+            self._stats.add("generate_many.words", total)
 
-        # Apply capitalization (or enforce lowercase when disabled)
-        if capitalize:
-            words = [word.capitalize() for word in words]
+        if HAS_NUMPY and total >= NUMPY_MIN_WORDS:
+            if self._stats is not None:
+                self._stats.add("generate_many.numpy_batches")
+            indices = self._random.indices_array(len(table), total).tolist()
         else:
-            words = [word.upper() for word in words]
+            indices = self._random.indices(len(table), total)
 
-        # Join with separator
-        return separator.join(words)
+        words = _select(table, indices)
+        join = separator.join
+        passphrases = [
+            join(words[start : start + word_count])
+            for start in range(0, total, word_count)
+        ]
+        if policy is not None:
+            apply = self._apply_policy
+            passphrases = [apply(phrase, policy) for phrase in passphrases]
+        return passphrases
@@ -4,10 +4,307 @@ Generates passwords following custom patterns with character class definitions
 like 'Cvvc-9999-Cvvc' for template-based password generation.
 """
 
-import secrets
+import math
+import re
 import string
+from collections import Counter
+from collections.abc import Iterator
+from functools import lru_cache
+from itertools import repeat
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from clinkey_cli.generators.base import BaseGenerator
+from clinkey_cli.generators.random_source import HAS_NUMPY, RandomSource
+
+if TYPE_CHECKING:
+    from clinkey_cli.generators.rules import RulesProgram
+    from clinkey_cli.security.compliance import CompliancePolicy
+
+# Maximum number of distinct compiled patterns kept in memory
+PATTERN_CACHE_SIZE = 256
+
+# Longest password a pattern may expand to, quantifiers included
+MAX_PATTERN_LENGTH = 4096
+
+# Passwords assembled per column-wise pass, bounding temporary memory
+COLUMN_CHUNK_SIZE = 1 << 16
+
+# Smallest chunk, in drawn characters, worth the NumPy backend
+NUMPY_MIN_CHARS = 4096
+
+# Passwords generated per column-wise pass when streaming
+STREAM_CHUNK_SIZE = 1024
+
+# Character sets
+_CONSONANTS = "bcdfghjklmnpqrstvwxz"
+_VOWELS = "aeiouy"
+_SPECIALS = "!@#$%^&*()-_=+[]{}|;:,.<>?"
+
+# Precomputed output tables for each character class
+_CLASS_TABLES: dict[str, tuple[str, ...]] = {
+    "C": tuple(_CONSONANTS.upper()),
+    "V": tuple(_VOWELS.upper()),
+    "L": tuple(string.ascii_uppercase),
+    "l": tuple(string.ascii_lowercase),
+    "D": tuple(string.digits),
+    "S": tuple(_SPECIALS),
+}
+
+# Characters of the named classes usable in sets, as in ``[[:hex:]_]``
+_NAMED_CLASSES = {
+    "alpha": string.ascii_letters,
+    "alnum": string.ascii_letters + string.digits,
+    "digit": string.digits,
+    "hex": "0123456789abcdef",
+    "lower": string.ascii_lowercase,
+    "upper": string.ascii_uppercase,
+    "punct": string.punctuation,
+    "special": _SPECIALS,
+}
+
+# Characters a negated set ``[^...]`` draws from, less the listed ones
+_PRINTABLE = string.ascii_letters + string.digits + string.punctuation
+
+# Run-length quantifier following a class, set or literal, as in ``D{8}``
+_QUANTIFIER = re.compile(r"\{(\d+)\}")
+
+
+class PatternProgram(NamedTuple):
+    """Immutable compiled form of a pattern template.
+
+    Attributes
+    ----------
+    pattern : str
+        Source template the program was compiled from.
+    steps : tuple[str | tuple[str, ...], ...]
+        One step per output character: either a literal ``str`` copied as-is,
+        or a ``tuple`` charset table to draw one character from.
+    runs : tuple[tuple[str | tuple[str, ...], int], ...]
+        The same steps run-length encoded: ``(table, count)`` draws ``count``
+        characters from one table at once, and consecutive literals are
+        joined into one ``(str, 1)`` run.
+    """
+
+    pattern: str
+    steps: tuple[str | tuple[str, ...], ...]
+    runs: tuple[tuple[str | tuple[str, ...], int], ...]
+
+    @classmethod
+    def from_steps(
+        cls, pattern: str, steps: tuple[str | tuple[str, ...], ...]
+    ) -> "PatternProgram":
+        """Build a program from per-character steps, encoding their runs.
+
+        Parameters
+        ----------
+        pattern : str
+            Source the steps were compiled from.
+        steps : tuple[str | tuple[str, ...], ...]
+            One literal or charset table per output character.
+
+        Returns
+        -------
+        PatternProgram
+            Program with its run-length encoded steps.
+        """
+        runs: list[list[Any]] = []
+        for step in steps:
+            if runs and step.__class__ is str and runs[-1][0].__class__ is str:
+                runs[-1][0] += step
+            elif runs and step.__class__ is not str and runs[-1][0] == step:
+                runs[-1][1] += 1
+            else:
+                runs.append([step, 1])
+        return cls(pattern, steps, tuple((step, count) for step, count in runs))
+
+    @property
+    def length(self) -> int:
+        """Length of every password produced by this program."""
+        return len(self.steps)
+
+    @property
+    def literals(self) -> frozenset[int]:
+        """Positions of the literal characters in produced passwords."""
+        return frozenset(
+            position
+            for position, step in enumerate(self.steps)
+            if step.__class__ is str
+        )
+
+    @property
+    def keyspace(self) -> int:
+        """Number of distinct passwords this program can produce."""
+        return math.prod(
+            len(set(step)) ** count
+            for step, count in self.runs
+            if step.__class__ is not str
+        )
+
+    @property
+    def entropy_bits(self) -> float:
+        """Exact Shannon entropy in bits of one produced password.
+
+        Equals ``log2(keyspace)`` unless a custom set repeats characters
+        (``[aab]``), which skews its draws.
+        """
+        return sum(
+            _table_entropy(step) * count
+            for step, count in self.runs
+            if step.__class__ is not str
+        )
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _table_entropy(table: tuple[str, ...]) -> float:
+    """Shannon entropy in bits of one uniform draw from ``table``."""
+
+    size = len(table)
+    return -sum(
+        count / size * math.log2(count / size) for count in Counter(table).values()
+    )
+
+
+def _closing_bracket(pattern: str, opening: int) -> int:
+    """Index of the ``]`` closing the set opened at ``opening``, or -1.
+
+    Named classes such as ``[:hex:]`` inside the set are skipped over.
+    """
+    i = opening + 1
+    while i < len(pattern):
+        if pattern.startswith("[:", i):
+            end = pattern.find(":]", i + 2)
+            if end != -1:
+                i = end + 2
+                continue
+        if pattern[i] == "]":
+            return i
+        i += 1
+    return -1
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _set_table(body: str) -> tuple[str, ...]:
+    """Expand the body of a ``[...]`` set into its charset table.
+
+    Characters are listed in order, ``a-z`` expands to a range, ``[:name:]``
+    to a named class, and a leading ``^`` negates the set against printable
+    ASCII. A ``-`` at either end is literal. Listed duplicates are kept, as
+    in ``[aab]``. Tables are cached, so equal sets share one tuple.
+    """
+    negated = body.startswith("^") and len(body) > 1
+    if negated:
+        body = body[1:]
+
+    chars: list[str] = []
+    i = 0
+    while i < len(body):
+        if body.startswith("[:", i):
+            end = body.find(":]", i + 2)
+            name = body[i + 2:end]
+            if end == -1 or name not in _NAMED_CLASSES:
+                valid = ", ".join(_NAMED_CLASSES)
+                raise ValueError(
+                    f"Unknown named class '[{body[i + 1:end + 1]}]'. "
+                    f"Valid classes: {valid}"
+                )
+            chars.extend(_NAMED_CLASSES[name])
+            i = end + 2
+        elif i + 2 < len(body) and body[i + 1] == "-":
+            first, last = body[i], body[i + 2]
+            if first > last:
+                raise ValueError(f"Invalid range '{first}-{last}' in pattern")
+            chars.extend(chr(code) for code in range(ord(first), ord(last) + 1))
+            i += 3
+        else:
+            chars.append(body[i])
+            i += 1
+
+    if negated:
+        excluded = set(chars)
+        chars = [char for char in _PRINTABLE if char not in excluded]
+        if not chars:
+            raise ValueError(f"Negated set '[^{body}]' excludes every character")
+    return tuple(chars)
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern: str) -> PatternProgram:
+    """Parse and validate a pattern template once.
+
+    Results are cached by pattern string, so generating a batch from the same
+    template only parses it on the first call. Quantifiers, ranges and named
+    classes are expanded here, so executing a program never parses anything.
+
+    Parameters
+    ----------
+    pattern : str
+        Pattern template to compile.
+
+    Returns
+    -------
+    PatternProgram
+        Compiled, immutable program.
+
+    Raises
+    ------
+    ValueError
+        If the pattern is empty, has an unclosed or empty ``[...]`` set, an
+        invalid range or unknown named class, uses an unknown uppercase
+        class, expands beyond ``MAX_PATTERN_LENGTH`` characters, or
+        contains no character class.
+
+    Examples
+    --------
+    >>> compile_pattern("D-[ab]").steps
+    (('0', '1', '2', '3', '4', '5', '6', '7', '8', '9'), '-', ('a', 'b'))
+    >>> compile_pattern("tok_[[:hex:]]{32}").runs[1][1]
+    32
+    """
+    steps: list[str | tuple[str, ...]] = []
+    has_valid_class = False
+    i = 0
+
+    while i < len(pattern):
+        char = pattern[i]
+
+        if char == "[":
+            # Custom character set [abc], [a-z0-9], [^0O1l], [[:hex:]]
+            close = _closing_bracket(pattern, i)
+            if close == -1 or close == i + 1:
+                raise ValueError(f"Invalid pattern: '{pattern}'")
+            step: str | tuple[str, ...] = _set_table(pattern[i + 1:close])
+            has_valid_class = True
+            i = close + 1
+        elif char in _CLASS_TABLES:
+            # Character classes
+            step = _CLASS_TABLES[char]
+            has_valid_class = True
+            i += 1
+        elif char.isupper() and char.isalpha():
+            # Uppercase letter that's not a valid class = invalid
+            raise ValueError(f"Invalid pattern: '{pattern}'")
+        else:
+            # Other characters (lowercase, digits, special) are literals
+            step = char
+            i += 1
+
+        times = 1
+        quantifier = _QUANTIFIER.match(pattern, i)
+        if quantifier is not None:
+            times = int(quantifier.group(1))
+            if times < 1:
+                raise ValueError(f"Quantifier must be at least 1 in '{pattern}'")
+            i = quantifier.end()
+        if len(steps) + times > MAX_PATTERN_LENGTH:
+            raise ValueError(
+                f"pattern expands beyond {MAX_PATTERN_LENGTH} characters"
+            )
+        steps.extend([step] * times)
+
+    if not has_valid_class:
+        raise ValueError(f"Invalid pattern: '{pattern}'")
+
+    return PatternProgram.from_steps(pattern, tuple(steps))
 
 
 class PatternGenerator(BaseGenerator):
@@ -20,12 +317,19 @@ class PatternGenerator(BaseGenerator):
     - l = any letter (lowercase)
     - D = digit
     - S = special character
-    - [abc] = custom character set
+    - [abc] = custom character set, with ranges ([a-z0-9]), negation
+      ([^0O1l]) and named classes ([[:hex:]], [[:alnum:]_])
+    - {n} after a class, set or literal = repeat it n times (D{8})
     - Any other character = literal
 
+    Templates are compiled once into a :class:`PatternProgram` and cached,
+    so repeated generation from the same template skips parsing entirely.
+    Each run of one class draws all its characters in a single call.
+
     Parameters
     ----------
-    None
+    random_source : RandomSource | None, default None
+        Source of randomness. Defaults to the shared buffered OS source.
 
     Examples
     --------
@@ -35,13 +339,23 @@ class PatternGenerator(BaseGenerator):
     9
     """
 
-    def __init__(self) -> None:
-        """Initialize pattern generator."""
+    def __init__(self, random_source: RandomSource | None = None) -> None:
+        """Initialize pattern generator.
+
+        Parameters
+        ----------
+        random_source : RandomSource | None, default None
+            Source of randomness. Defaults to the shared buffered OS source.
+        """
+        super().__init__(random_source)
         # Character sets
-        self._consonants = list("bcdfghjklmnpqrstvwxz")
-        self._vowels = list("aeiouy")
+        self._consonants = list(_CONSONANTS)
+        self._vowels = list(_VOWELS)
         self._digits = list(string.digits)
-        self._specials = list("!@#$%^&*()-_=+[]{}|;:,.<>?")
+        self._specials = list(_SPECIALS)
+
+    # Compiled programs are shared by every instance
+    compile = staticmethod(compile_pattern)
 
     def validate_pattern(self, pattern: str) -> bool:
         """Validate pattern syntax.
@@ -67,42 +381,11 @@ class PatternGenerator(BaseGenerator):
         if not pattern:
             return False
 
-        # Parse pattern and check for valid character classes
-        # Valid classes: C, V, L, l, D, S
-        # Also accept: [custom], literals (-, @, etc.)
-        i = 0
-        has_valid_class = False
-
-        while i < len(pattern):
-            char = pattern[i]
-
-            # Custom character set
-            if char == "[":
-                close = pattern.find("]", i)
-                if close == -1:
-                    return False  # Unclosed bracket
-                has_valid_class = True
-                i = close + 1
-                continue
-
-            # Character classes
-            if char in "CVLlDS":
-                has_valid_class = True
-                i += 1
-                continue
-
-            # Check if it's a literal character
-            # (not alphanumeric uppercase like X, Y, Z)
-            # We accept lowercase letters, digits, and special chars
-            # But uppercase letters that aren't C, V, L, D, S are invalid
-            if char.isupper() and char.isalpha():
-                # Uppercase letter that's not a valid class = invalid
-                return False
-
-            # Other characters (lowercase, digits, special) are valid literals
-            i += 1
-
-        return has_valid_class
+        try:
+            self.compile(pattern)
+        except ValueError:
+            return False
+        return True
 
     def get_pattern_length(self, pattern: str) -> int:
         """Calculate final password length from pattern.
@@ -117,59 +400,58 @@ class PatternGenerator(BaseGenerator):
         int
             Final password length.
 
+        Raises
+        ------
+        ValueError
+            If the pattern is invalid.
+
         Examples
         --------
         >>> gen = PatternGenerator()
         >>> gen.get_pattern_length("LLLL-DDDD")
         9
+        >>> gen.get_pattern_length("[a-f0-9]{32}")
+        32
         """
-        length = 0
-        i = 0
-
-        while i < len(pattern):
-            char = pattern[i]
-
-            # Custom character set [abc]
-            if char == "[":
-                close = pattern.find("]", i)
-                if close != -1:
-                    length += 1
-                    i = close + 1
-                    continue
-
-            # All characters contribute 1 to length
-            length += 1
-            i += 1
-
-        return length
+        return self.compile(pattern).length
 
     def generate(
         self,
         length: int = 0,
         pattern: str | None = None,
+        policy: "CompliancePolicy | None" = None,
+        rules: str | None = None,
         **kwargs,
     ) -> str:
-        """Generate password from pattern.
+        """Generate password from pattern or site password rules.
 
         Parameters
         ----------
         length : int, default 0
             Ignored if pattern is provided
-            (kept for BaseGenerator compatibility).
+            (kept for BaseGenerator compatibility). With ``rules``, the
+            requested length, clamped to the rules' bounds (0 for the
+            default).
         pattern : str | None, default None
             Pattern template for password generation.
+        policy : CompliancePolicy | None, default None
+            Compiled policy whose character classes are placed at random
+            class positions; literals are kept.
+        rules : str | None, default None
+            Site rules in ``passwordrules`` syntax, used instead of a
+            pattern (see :mod:`clinkey_cli.generators.rules`).
         **kwargs
             Additional arguments (ignored).
 
         Returns
         -------
         str
-            Generated password matching pattern.
+            Generated password matching pattern or rules.
 
         Raises
         ------
         ValueError
-            If pattern is invalid or missing.
+            If pattern is invalid or missing, or the rules are malformed.
 
         Examples
         --------
@@ -177,8 +459,217 @@ class PatternGenerator(BaseGenerator):
         >>> password = gen.generate(pattern="LLLL-DDDD")
         >>> len(password)
         9
+        >>> len(gen.generate(rules="required: digit; maxlength: 12", length=20))
+        12
         """
-        # Validate inputs
+        if rules is not None:
+            password = self._execute_rules(self._rules_program(length, rules))
+            literals: frozenset[int] = frozenset()
+        else:
+            program = self._program(length, pattern)
+            password = self._execute(program)
+            literals = program.literals
+        if policy is not None:
+            password = self._apply_policy(password, policy, literals)
+        return password
+
+    def generate_many(
+        self,
+        n: int,
+        pattern: str | None = None,
+        policy: "CompliancePolicy | None" = None,
+        rules: str | None = None,
+        length: int = 0,
+        **kwargs,
+    ) -> list[str]:
+        """Generate ``n`` passwords from one pattern, column by column.
+
+        Every password of a pattern has the same structure, so instead of
+        running the program ``n`` times, each run of the program draws the
+        characters of all ``n`` passwords in one bulk operation, maps them
+        through its charset table, and the columns are then assembled into
+        strings. Large chunks use NumPy when installed; both backends draw
+        the same values from the same random stream.
+
+        Parameters
+        ----------
+        n : int
+            Number of passwords to generate.
+        pattern : str | None, default None
+            Pattern template for password generation.
+        policy : CompliancePolicy | None, default None
+            Compiled policy applied to every password.
+        rules : str | None, default None
+            Site rules used instead of a pattern. Their required positions
+            are random per password, so they are generated one at a time.
+        length : int, default 0
+            Requested length with ``rules`` (0 for the default).
+        **kwargs
+            Additional arguments (ignored, as by :meth:`generate`).
+
+        Returns
+        -------
+        list[str]
+            Generated passwords, distributed exactly like :meth:`generate`.
+
+        Raises
+        ------
+        ValueError
+            If n is negative, or the pattern or rules are invalid.
+
+        Examples
+        --------
+        >>> gen = PatternGenerator()
+        >>> codes = gen.generate_many(1000, pattern="vch-[A-Z0-9]{10}")
+        >>> len(codes), len(codes[0])
+        (1000, 14)
+        """
+        if n < 0:
+            raise ValueError(f"n must be non-negative, got {n}")
+        if rules is not None:
+            rules_program = self._rules_program(length, rules)
+            passwords = [self._execute_rules(rules_program) for _ in range(n)]
+            literals: frozenset[int] = frozenset()
+        else:
+            program = self._program(length, pattern)
+            passwords = []
+            for start in range(0, n, COLUMN_CHUNK_SIZE):
+                passwords += self._execute_columns(
+                    program, min(COLUMN_CHUNK_SIZE, n - start)
+                )
+            literals = program.literals
+        if policy is not None:
+            apply = self._apply_policy
+            passwords = [apply(password, policy, literals) for password in passwords]
+        return passwords
+
+    def iter_generate(self, count: int | None = None, **kwargs) -> Iterator[str]:
+        """Lazily yield passwords, generated column-wise in small chunks.
+
+        Parameters
+        ----------
+        count : int | None, default None
+            Number of passwords to yield. ``None`` yields indefinitely.
+        **kwargs : dict
+            Arguments of :meth:`generate_many`.
+
+        Returns
+        -------
+        Iterator[str]
+            Lazy iterator over generated passwords.
+
+        Raises
+        ------
+        ValueError
+            If count is negative, or the pattern or rules are invalid.
+        """
+        if count is not None and count < 0:
+            raise ValueError(f"count must be non-negative, got {count}")
+        if self._stats is not None:
+            # Keeps the per-call ``generate`` timer of enable_stats()
+            return super().iter_generate(count, **kwargs)
+
+        # Validate eagerly, before the first password is requested
+        self.generate_many(0, **kwargs)
+        return self._stream_columns(count, kwargs)
+
+    def _stream_columns(
+        self, count: int | None, kwargs: dict[str, Any]
+    ) -> Iterator[str]:
+        """Yield ``count`` passwords (``None``: forever) chunk by chunk."""
+
+        remaining = count
+        while remaining is None or remaining > 0:
+            size = STREAM_CHUNK_SIZE
+            if remaining is not None:
+                size = min(remaining, size)
+            yield from self.generate_many(size, **kwargs)
+            if remaining is not None:
+                remaining -= size
+
+    def keyspace(
+        self,
+        length: int = 0,
+        pattern: str | None = None,
+        rules: str | None = None,
+        **kwargs: Any,
+    ) -> int:
+        """Count the distinct passwords a pattern can produce.
+
+        Parameters
+        ----------
+        length : int, default 0
+            Ignored if pattern is provided.
+        pattern : str | None, default None
+            Pattern template.
+        rules : str | None, default None
+            Site rules used instead of a pattern. Their keyspace is a floor
+            when ``max-consecutive`` is set.
+        **kwargs
+            Additional arguments (ignored).
+
+        Returns
+        -------
+        int
+            Product of the distinct characters of every class in the pattern.
+
+        Raises
+        ------
+        ValueError
+            If pattern is invalid or missing.
+
+        Examples
+        --------
+        >>> PatternGenerator().keyspace(pattern="DD-[ab]")
+        200
+        """
+        if rules is not None:
+            return self._rules_program(length, rules).keyspace
+        return self._program(length, pattern).keyspace
+
+    def entropy_bits(
+        self,
+        length: int = 0,
+        pattern: str | None = None,
+        rules: str | None = None,
+        **kwargs: Any,
+    ) -> float:
+        """Exact entropy in bits of a password generated from ``pattern``.
+
+        Parameters
+        ----------
+        length : int, default 0
+            Ignored if pattern is provided.
+        pattern : str | None, default None
+            Pattern template.
+        rules : str | None, default None
+            Site rules used instead of a pattern (``log2`` of their
+            keyspace).
+        **kwargs
+            Additional arguments (ignored).
+
+        Returns
+        -------
+        float
+            Sum of the entropy of every character class in the pattern.
+
+        Raises
+        ------
+        ValueError
+            If pattern is invalid or missing.
+
+        Examples
+        --------
+        >>> PatternGenerator().entropy_bits(pattern="[ab][ab]")
+        2.0
+        """
+        if rules is not None:
+            return self._rules_program(length, rules).entropy_bits
+        return self._program(length, pattern).entropy_bits
+
+    def _program(self, length: int, pattern: str | None) -> PatternProgram:
+        """Validate ``generate`` arguments and return the compiled program."""
+
         if pattern is None:
             if not length:
                 raise ValueError(
@@ -189,41 +680,133 @@ class PatternGenerator(BaseGenerator):
         if pattern == "":
             raise ValueError("pattern cannot be empty")
 
-        if not self.validate_pattern(pattern):
-            raise ValueError(f"Invalid pattern: '{pattern}'")
+        return self.compile(pattern)
+
+    @staticmethod
+    def _rules_program(length: int, rules: str) -> "RulesProgram":
+        """Return the cached program for ``rules`` at ``length`` (0: default)."""
+
+        # Imported here: the rules module builds on PatternProgram
+        from clinkey_cli.generators.rules import compile_rules
+
+        return compile_rules(rules, length or None)
+
+    def _execute(self, program: PatternProgram) -> str:
+        """Run a compiled program once.
+
+        Parameters
+        ----------
+        program : PatternProgram
+            Compiled pattern to execute.
+
+        Returns
+        -------
+        str
+            Generated password.
+        """
+        randbelow = self._random.randbelow
+        choices = self._random.choices
+        parts: list[str] = []
+        for step, count in program.runs:
+            if step.__class__ is str:
+                parts.append(step)
+            elif count == 1:
+                parts.append(step[randbelow(len(step))])
+            else:
+                parts.extend(choices(step, count))
+        return "".join(parts)
 
-        # Generate password from pattern
-        result = []
-        i = 0
+    def _execute_columns(self, program: PatternProgram, n: int) -> list[str]:
+        """Run a compiled program ``n`` times, one bulk draw per run.
 
-        while i < len(pattern):
-            char = pattern[i]
+        Each run of ``count`` characters draws ``n * count`` indices at once,
+        in password order, so the NumPy and pure-Python backends consume the
+        random stream identically.
+
+        Parameters
+        ----------
+        program : PatternProgram
+            Compiled pattern to execute.
+        n : int
+            Number of passwords.
 
-            # Custom character set [abc]
-            if char == "[":
-                close = pattern.find("]", i)
-                charset = pattern[i + 1:close]
-                result.append(secrets.choice(list(charset)))
-                i = close + 1
+        Returns
+        -------
+        list[str]
+            Generated passwords.
+        """
+        if n and HAS_NUMPY and n * program.length >= NUMPY_MIN_CHARS:
+            if "\0" not in program.pattern:
+                if self._stats is not None:
+                    self._stats.add("generate_many.numpy_batches")
+                return self._execute_columns_numpy(program, n)
+
+        columns: list[Any] = []
+        for step, count in program.runs:
+            if step.__class__ is str:
+                columns.append(repeat(step, n))
                 continue
+            indices = self._random.indices(len(step), n * count)
+            drawn = "".join(map(step.__getitem__, indices))
+            if count == 1:
+                columns.append(drawn)
+            else:
+                columns.append(
+                    [drawn[i:i + count] for i in range(0, n * count, count)]
+                )
+        return list(map("".join, zip(*columns)))
 
-            # Character classes
-            if char == "C":
-                result.append(secrets.choice(self._consonants).upper())
-            elif char == "V":
-                result.append(secrets.choice(self._vowels).upper())
-            elif char == "L":
-                result.append(secrets.choice(string.ascii_uppercase))
-            elif char == "l":
-                result.append(secrets.choice(string.ascii_lowercase))
-            elif char == "D":
-                result.append(secrets.choice(self._digits))
-            elif char == "S":
-                result.append(secrets.choice(self._specials))
+    def _execute_columns_numpy(self, program: PatternProgram, n: int) -> list[str]:
+        """NumPy backend of :meth:`_execute_columns`.
+
+        Code points are written into an ``(n, length)`` array, which is then
+        viewed as ``n`` fixed-width strings.
+        """
+        import numpy as np
+
+        codes = np.empty((n, program.length), dtype=np.uint32)
+        position = 0
+        for step, count in program.runs:
+            width = len(step) if step.__class__ is str else count
+            if step.__class__ is str:
+                codes[:, position:position + width] = [ord(char) for char in step]
             else:
-                # Literal character
-                result.append(char)
+                table = np.array([ord(char) for char in step], dtype=np.uint32)
+                indices = self._random.indices_array(len(step), n * count)
+                codes[:, position:position + width] = table[indices].reshape(
+                    n, count
+                )
+            position += width
+        return codes.view(f"<U{program.length}").ravel().tolist()
 
-            i += 1
+    def _execute_rules(self, compiled: "RulesProgram") -> str:
+        """Run compiled site rules once.
+
+        Each required set is drawn at its own random position (a partial
+        Fisher-Yates shuffle of the positions), every other position from
+        the allowed alphabet.
+
+        Parameters
+        ----------
+        compiled : RulesProgram
+            Compiled rules to execute.
 
-        return "".join(result)
+        Returns
+        -------
+        str
+            Generated password meeting the rules.
+        """
+        from clinkey_cli.generators.rules import draw_limited
+
+        randbelow = self._random.randbelow
+        tables = list(compiled.program.steps)
+        positions = list(range(len(tables)))
+        for i, table in enumerate(compiled.rules.required):
+            j = i + randbelow(len(positions) - i)
+            positions[i], positions[j] = positions[j], positions[i]
+            tables[positions[i]] = table
+
+        limit = compiled.rules.max_consecutive
+        if limit is not None:
+            return draw_limited(tables, limit, randbelow)
+        return "".join([table[randbelow(len(table))] for table in tables])
@@ -0,0 +1,511 @@
+"""Buffered randomness source shared by all password generators.
+
+Reads the operating system CSPRNG in large chunks and extracts unbiased
+indices from that buffer with rejection sampling, so generators pay one
+syscall per chunk instead of one ``secrets`` call per character.
+
+:class:`DeterministicSource` swaps the OS for a seeded HMAC-DRBG so that
+benchmarks and tests can replay identical workloads.
+"""
+
+import os
+import threading
+import weakref
+from functools import lru_cache, partial
+from importlib.util import find_spec
+from typing import Any, Literal, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# memoryview format codes of the unsigned integer widths used for sampling
+_IntegerFormat = Literal["B", "H", "I", "Q"]
+
+# Number of bytes pulled from the OS random source per refill
+DEFAULT_CHUNK_SIZE = 4096
+
+# memoryview formats used to read unsigned integers of increasing width
+_INTEGER_FORMATS: tuple[tuple[_IntegerFormat, int], ...] = (
+    ("B", 1),
+    ("H", 2),
+    ("I", 4),
+    ("Q", 8),
+)
+
+# NumPy dtypes matching the memoryview formats (native byte order)
+_NUMPY_DTYPES = {"B": "=u1", "H": "=u2", "I": "=u4", "Q": "=u8"}
+
+# Whether the optional NumPy-backed sampling paths are available. NumPy
+# itself is imported on first use, as it would dominate CLI start-up time.
+HAS_NUMPY = find_spec("numpy") is not None
+
+# Largest number of bytes an HMAC-DRBG may return per generate call
+_DRBG_MAX_REQUEST = 1 << 16
+
+# Every live source, so forked children can drop buffers inherited from parent
+_sources: "weakref.WeakSet[RandomSource]" = weakref.WeakSet()
+
+
+@lru_cache(maxsize=256)
+def _sampling_plan(n: int) -> tuple[_IntegerFormat, int, int]:
+    """Return the integer format, byte width and rejection limit for ``n``.
+
+    Parameters
+    ----------
+    n : int
+        Exclusive upper bound of the indices to draw.
+
+    Returns
+    -------
+    tuple[str, int, int]
+        memoryview format code, width in bytes, and the largest multiple
+        of ``n`` representable at that width. Raw values at or above the
+        limit are rejected so that ``value % n`` stays uniform.
+    """
+    for fmt, width in _INTEGER_FORMATS:
+        span = 1 << (8 * width)
+        if n <= span:
+            return fmt, width, span - span % n
+    raise ValueError(f"n is too large for buffered sampling: {n}")
+
+
+class _Buffer(threading.local):
+    """Per-thread view of the random buffer."""
+
+    def __init__(self) -> None:
+        self.data = b""
+        self.position = 0
+
+
+class RandomSource:
+    """Cryptographically secure randomness read in bulk from ``os.urandom``.
+
+    Each thread keeps its own buffer, so a single source can be shared by
+    every generator and every thread without locking. Buffers are dropped
+    in forked children so that worker processes never replay the bytes
+    their parent already holds.
+
+    Parameters
+    ----------
+    chunk_size : int, default 4096
+        Number of bytes read from the OS on each refill.
+
+    Examples
+    --------
+    >>> source = RandomSource()
+    >>> 0 <= source.randbelow(10) < 10
+    True
+    >>> len(source.choices("abc", 5))
+    5
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """Initialize an empty buffered source.
+
+        Parameters
+        ----------
+        chunk_size : int, default 4096
+            Number of bytes read from the OS on each refill.
+
+        Raises
+        ------
+        ValueError
+            If chunk_size is not strictly positive.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        self.chunk_size = chunk_size
+        self._local = _Buffer()
+        _sources.add(self)
+
+    @classmethod
+    def deterministic(
+        cls, seed: int | str | bytes, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> "DeterministicSource":
+        """Return a reproducible source seeded from ``seed``.
+
+        .. warning::
+            The output is fully determined by the seed. Use it only for
+            benchmarks and tests, never to generate real credentials.
+
+        Parameters
+        ----------
+        seed : int | str | bytes
+            Seed material. Equal seeds always produce the same stream; a
+            string of ASCII digits is equivalent to the integer it spells.
+        chunk_size : int, default 4096
+            Number of bytes generated on each refill.
+
+        Returns
+        -------
+        DeterministicSource
+            Source drawing from an HMAC-DRBG instead of the OS.
+
+        Examples
+        --------
+        >>> a = RandomSource.deterministic(42)
+        >>> b = RandomSource.deterministic(42)
+        >>> a.indices(100, 5) == b.indices(100, 5)
+        True
+        """
+        return DeterministicSource(seed, chunk_size)
+
+    def _read(self, size: int) -> bytes:
+        """Read fresh random bytes from the underlying entropy source."""
+
+        return os.urandom(size)
+
+    def _take(self, size: int) -> bytes:
+        """Consume ``size`` bytes from the current thread's buffer."""
+
+        local = self._local
+        position = local.position
+        end = position + size
+
+        if end > len(local.data):
+            if size >= self.chunk_size:
+                return self._read(size)
+            local.data = local.data[position:] + self._read(self.chunk_size)
+            position, end = 0, size
+
+        local.position = end
+        return local.data[position:end]
+
+    def reset(self) -> None:
+        """Discard the buffered bytes of every thread using this source."""
+
+        self._local = _Buffer()
+
+    def token_bytes(self, size: int) -> bytes:
+        """Return ``size`` random bytes.
+
+        Parameters
+        ----------
+        size : int
+            Number of bytes to return.
+
+        Returns
+        -------
+        bytes
+            Random bytes taken from the buffer.
+        """
+        if size < 0:
+            raise ValueError(f"size must be non-negative, got {size}")
+        return self._take(size)
+
+    def indices(self, n: int, k: int) -> list[int]:
+        """Draw ``k`` independent, uniformly distributed integers in ``[0, n)``.
+
+        Parameters
+        ----------
+        n : int
+            Exclusive upper bound.
+        k : int
+            Number of values to draw.
+
+        Returns
+        -------
+        list[int]
+            ``k`` indices suitable for selecting from a sequence of length ``n``.
+
+        Raises
+        ------
+        ValueError
+            If n is not strictly positive or k is negative.
+        """
+        if n <= 0:
+            raise ValueError(f"n must be positive, got {n}")
+        if k < 0:
+            raise ValueError(f"k must be non-negative, got {k}")
+        if n == 1:
+            return [0] * k
+        if n > 1 << 64:
+            return [self._randbelow_large(n) for _ in range(k)]
+
+        fmt, width, limit = _sampling_plan(n)
+        result: list[int] = []
+
+        while len(result) < k:
+            block = self._take((k - len(result)) * width)
+            values = block if width == 1 else memoryview(block).cast(fmt)
+            result.extend([value % n for value in values if value < limit])
+
+        return result
+
+    def indices_array(self, n: int, k: int) -> Any:
+        """Draw ``k`` indices in ``[0, n)`` as a NumPy array.
+
+        Consumes the buffer exactly like :meth:`indices`, so both methods
+        return the same values for the same byte stream, but filters and
+        reduces whole blocks at once instead of one value at a time.
+
+        Parameters
+        ----------
+        n : int
+            Exclusive upper bound, at most ``2**64``.
+        k : int
+            Number of values to draw.
+
+        Returns
+        -------
+        numpy.ndarray
+            One-dimensional unsigned integer array of length ``k``.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+        ValueError
+            If n is not in ``[1, 2**64]`` or k is negative.
+        """
+        import numpy as np
+
+        if n <= 0:
+            raise ValueError(f"n must be positive, got {n}")
+        if k < 0:
+            raise ValueError(f"k must be non-negative, got {k}")
+        if n > 1 << 64:
+            raise ValueError(f"n is too large for buffered sampling: {n}")
+
+        fmt, width, limit = _sampling_plan(n)
+        dtype = np.dtype(_NUMPY_DTYPES[fmt])
+        if n == 1:
+            return np.zeros(k, dtype=dtype)
+
+        parts = []
+        missing = k
+        while missing:
+            values = np.frombuffer(self._take(missing * width), dtype=dtype)
+            if n < 1 << (8 * width):
+                values = values[values < limit] % n
+            parts.append(values)
+            missing -= len(values)
+
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def _randbelow_large(self, n: int) -> int:
+        """Draw a single index for bounds wider than 64 bits."""
+
+        width = (n.bit_length() + 7) // 8
+        span = 1 << (8 * width)
+        limit = span - span % n
+
+        while True:
+            value = int.from_bytes(self._take(width), "little")
+            if value < limit:
+                return value % n
+
+    def randbelow(self, n: int) -> int:
+        """Return a uniformly distributed integer in ``[0, n)``.
+
+        Parameters
+        ----------
+        n : int
+            Exclusive upper bound.
+
+        Returns
+        -------
+        int
+            Random integer.
+
+        Raises
+        ------
+        ValueError
+            If n is not strictly positive.
+        """
+        if n <= 1 or n > 1 << 64:
+            return self.indices(n, 1)[0]
+
+        _, width, limit = _sampling_plan(n)
+        take = self._take
+
+        while True:
+            value = int.from_bytes(take(width), "little")
+            if value < limit:
+                return value % n
+
+    def choice(self, seq: Sequence[T]) -> T:
+        """Return a random element from a non-empty sequence.
+
+        Parameters
+        ----------
+        seq : Sequence[T]
+            Sequence to choose from.
+
+        Returns
+        -------
+        T
+            Selected element.
+
+        Raises
+        ------
+        IndexError
+            If the sequence is empty.
+        """
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[self.randbelow(len(seq))]
+
+    def choices(self, seq: Sequence[T], k: int) -> list[T]:
+        """Return ``k`` elements drawn independently, with replacement.
+
+        Parameters
+        ----------
+        seq : Sequence[T]
+            Sequence to choose from.
+        k : int
+            Number of elements to draw.
+
+        Returns
+        -------
+        list[T]
+            Selected elements, in draw order.
+
+        Raises
+        ------
+        IndexError
+            If the sequence is empty.
+        """
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return [seq[index] for index in self.indices(len(seq), k)]
+
+
+def _seed_bytes(seed: int | str | bytes) -> bytes:
+    """Encode ``seed`` as the byte string fed to the DRBG.
+
+    Strings of ASCII digits are read as integers, so that ``--seed 7`` on
+    the command line and ``7`` from Python give the same stream.
+    """
+    if isinstance(seed, bytes):
+        return seed
+    if isinstance(seed, str):
+        if not (seed.isascii() and seed.isdigit()):
+            return seed.encode("utf-8")
+        seed = int(seed)
+    if isinstance(seed, int) and not isinstance(seed, bool):
+        if seed < 0:
+            raise ValueError(f"seed must be non-negative, got {seed}")
+        return seed.to_bytes((seed.bit_length() + 7) // 8 or 1, "big")
+    raise TypeError(f"seed must be int, str or bytes, got {type(seed).__name__}")
+
+
+def derive_seed(seed: int | str | bytes, index: int) -> bytes:
+    """Derive an independent child seed for the ``index``-th stream.
+
+    Parameters
+    ----------
+    seed : int | str | bytes
+        Parent seed.
+    index : int
+        Position of the child stream (e.g. a chunk number).
+
+    Returns
+    -------
+    bytes
+        32-byte seed; distinct indices give unrelated streams.
+    """
+    from hashlib import sha256
+
+    return sha256(_seed_bytes(seed) + b"/" + index.to_bytes(8, "big")).digest()
+
+
+class DeterministicSource(RandomSource):
+    """Reproducible source backed by HMAC-DRBG (NIST SP 800-90A, SHA-256).
+
+    Produces the same byte stream for the same seed, so benchmark runs and
+    optimized code paths can be compared byte-for-byte against reference
+    output. Draws are reproducible as long as a single thread consumes the
+    source; concurrent threads share the DRBG and interleave arbitrarily.
+
+    .. warning::
+        Not suitable for production: anyone who knows the seed can
+        regenerate every password.
+
+    Parameters
+    ----------
+    seed : int | str | bytes
+        Seed material.
+    chunk_size : int, default 4096
+        Number of bytes generated on each refill.
+
+    Examples
+    --------
+    >>> source = DeterministicSource(b"benchmark")
+    >>> source.token_bytes(4) == DeterministicSource(b"benchmark").token_bytes(4)
+    True
+    """
+
+    def __init__(
+        self, seed: int | str | bytes, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        """Instantiate the DRBG from ``seed``.
+
+        Parameters
+        ----------
+        seed : int | str | bytes
+            Seed material.
+        chunk_size : int, default 4096
+            Number of bytes generated on each refill.
+
+        Raises
+        ------
+        ValueError
+            If chunk_size is not strictly positive or seed is a negative int.
+        TypeError
+            If seed is not an int, str or bytes.
+        """
+        # Imported here: OpenSSL bindings are slow to load and only the
+        # deterministic mode needs them.
+        import hashlib
+        import hmac
+
+        super().__init__(chunk_size)
+        self.seed = seed
+        self._hmac_new = partial(hmac.new, digestmod=hashlib.sha256)
+        self._lock = threading.Lock()
+        self._key = b"\x00" * 32
+        self._value = b"\x01" * 32
+        self._update(_seed_bytes(seed))
+
+    def _hmac(self, data: bytes) -> bytes:
+        return self._hmac_new(self._key, data).digest()
+
+    def _update(self, provided: bytes = b"") -> None:
+        """HMAC-DRBG update function."""
+
+        self._key = self._hmac(self._value + b"\x00" + provided)
+        self._value = self._hmac(self._value)
+        if provided:
+            self._key = self._hmac(self._value + b"\x01" + provided)
+            self._value = self._hmac(self._value)
+
+    def _read(self, size: int) -> bytes:
+        """Generate ``size`` bytes from the DRBG."""
+
+        output = bytearray()
+        with self._lock:
+            while len(output) < size:
+                request = min(size - len(output), _DRBG_MAX_REQUEST)
+                block = bytearray()
+                while len(block) < request:
+                    self._value = self._hmac(self._value)
+                    block += self._value
+                output += block[:request]
+                self._update()
+        return bytes(output)
+
+
+def _reset_sources_after_fork() -> None:
+    """Drop buffers inherited from the parent process."""
+
+    for source in list(_sources):
+        source.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_sources_after_fork)
+
+
+# Shared source used by generators that are not given one explicitly
+default_source = RandomSource()
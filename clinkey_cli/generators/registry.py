@@ -1,13 +1,56 @@
 """Generator registry for managing password generator types.
 
 Provides central registry for discovering and instantiating different
-password generator types dynamically.
+password generator types dynamically. Generators may be registered as
+``"module.path:ClassName"`` references, imported on first lookup, so that
+using one generator never pays for loading the others.
+
+Third-party packages add generators through the ``clinkey.generators``
+entry point group::
+
+    [project.entry-points."clinkey.generators"]
+    token = "my_package.generators:TokenGenerator"
+
+Entry points are only scanned when a name is not built in or when the full
+list is requested, and plugin modules are imported on first use.
 """
 
-from typing import Type
+import inspect
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache, reduce
+from importlib import import_module
+from typing import Any, Hashable, Type, cast
 
 from clinkey_cli.generators.base import BaseGenerator
 
+# Maximum number of configured generator instances kept by create()
+INSTANCE_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=None)
+def _constructor_signature(generator_class: type) -> inspect.Signature:
+    """Return the constructor signature of a generator class."""
+
+    return inspect.signature(generator_class)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn a configuration value into a stable, hashable cache key part."""
+
+    if isinstance(value, os.PathLike):
+        return os.fspath(value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = (_freeze(item) for item in value)
+        if isinstance(value, (set, frozenset)):
+            # Ordered by repr: frozen items need not be comparable together
+            return tuple(sorted(items, key=repr))
+        return tuple(items)
+    return value
+
 
 class GeneratorRegistry:
     """Registry for password generator types.
@@ -15,6 +58,12 @@ class GeneratorRegistry:
     Manages registration and retrieval of generator classes,
     enabling dynamic generator discovery and plugin architecture.
 
+    Parameters
+    ----------
+    entry_point_group : str | None, default None
+        Entry point group scanned for plugin generators. ``None`` disables
+        discovery.
+
     Examples
     --------
     >>> registry = GeneratorRegistry()
@@ -22,26 +71,90 @@ class GeneratorRegistry:
     >>> gen_class = registry.get("test")
     """
 
-    def __init__(self):
-        """Initialize empty registry."""
-        self._generators: dict[str, Type[BaseGenerator]] = {}
+    def __init__(self, entry_point_group: str | None = None):
+        """Initialize empty registry.
+
+        Parameters
+        ----------
+        entry_point_group : str | None, default None
+            Entry point group scanned for plugin generators.
+        """
+        self._generators: dict[str, type[BaseGenerator] | str] = {}
+        self.entry_point_group = entry_point_group
+        self._discovered = entry_point_group is None
+        self._instances: OrderedDict[tuple, BaseGenerator] = OrderedDict()
+        self._instances_lock = threading.Lock()
+
+    def discover(self) -> None:
+        """Register generators advertised through entry points, once.
 
-    def register(self, name: str, generator_class: Type[BaseGenerator]):
+        Plugins are registered as lazy references, so no plugin module is
+        imported here. Names already registered are kept, so a plugin
+        cannot shadow a built-in generator.
+        """
+        group = self.entry_point_group
+        if self._discovered or group is None:
+            return
+        self._discovered = True
+
+        # Deferred: importlib.metadata is slow to import and rarely needed
+        from importlib.metadata import entry_points
+
+        for entry_point in entry_points(group=group):
+            reference = f"{entry_point.module}:{entry_point.attr}"
+            self._generators.setdefault(entry_point.name, reference)
+
+    def __contains__(self, name: object) -> bool:
+        if name in self._generators:
+            return True
+        self.discover()
+        return name in self._generators
+
+    def register(self, name: str, generator_class: Type[BaseGenerator] | str):
         """Register a generator class.
 
         Parameters
         ----------
         name : str
             Name to register generator under.
-        generator_class : Type[BaseGenerator]
-            Generator class to register.
+        generator_class : Type[BaseGenerator] | str
+            Generator class to register, or a lazy ``"module:ClassName"``
+            reference imported on first :meth:`get`.
+
+        Raises
+        ------
+        ValueError
+            If a lazy reference is not of the form ``"module:ClassName"``.
 
         Examples
         --------
         >>> registry = GeneratorRegistry()
         >>> registry.register("syllable", SyllableGenerator)
+        >>> registry.register("lazy", "clinkey_cli.generators.pattern:PatternGenerator")
         """
+        if isinstance(generator_class, str):
+            module_name, _, class_name = generator_class.partition(":")
+            if not module_name or not class_name:
+                raise ValueError(
+                    f"Invalid generator reference: '{generator_class}'. "
+                    "Expected 'module.path:ClassName'"
+                )
+        self._generators[name] = generator_class
+
+    def _resolve(self, name: str) -> Type[BaseGenerator]:
+        """Import a lazily registered generator and cache the class."""
+
+        reference = self._generators[name]
+        if not isinstance(reference, str):
+            return reference
+
+        module_name, _, class_name = reference.partition(":")
+        generator_class = cast(
+            type[BaseGenerator],
+            reduce(getattr, class_name.split("."), import_module(module_name)),
+        )
         self._generators[name] = generator_class
+        return generator_class
 
     def get(self, name: str) -> Type[BaseGenerator]:
         """Get generator class by name.
@@ -67,13 +180,85 @@ class GeneratorRegistry:
         >>> registry.register("syllable", SyllableGenerator)
         >>> gen_class = registry.get("syllable")
         """
-        if name not in self._generators:
+        if name not in self:
             available = ", ".join(sorted(self._generators.keys()))
             raise ValueError(
                 f"Unknown generator: '{name}'. "
                 f"Available: {available if available else 'none'}"
             )
-        return self._generators[name]
+        generator_class = self._generators[name]
+        if isinstance(generator_class, str):
+            return self._resolve(name)
+        return generator_class
+
+    def create(self, name: str, **config: Any) -> BaseGenerator:
+        """Return a shared, ready-to-use generator instance.
+
+        Instances are cached by generator class and normalized constructor
+        arguments (defaults filled in, paths and containers made hashable),
+        so ``create("normal")`` and ``create("strong")`` share one warm
+        syllable generator. The least recently used instance is evicted
+        beyond ``INSTANCE_CACHE_SIZE`` configurations.
+
+        Generators keep no per-call state, so a shared instance may be used
+        from several threads at once. Treat it as read-only: mutating its
+        attributes would affect every caller, and
+        :meth:`~clinkey_cli.generators.base.BaseGenerator.enable_stats`
+        refuses it. Instantiate ``get(name)`` for a private instance.
+
+        Parameters
+        ----------
+        name : str
+            Generator name.
+        **config
+            Constructor arguments (e.g. ``wordlist="eff_large"``).
+
+        Returns
+        -------
+        BaseGenerator
+            Cached generator instance.
+
+        Raises
+        ------
+        ValueError
+            If generator name not found.
+        TypeError
+            If config does not match the generator's constructor, or holds
+            unhashable values.
+
+        Examples
+        --------
+        >>> gen = registry.create("passphrase")
+        >>> gen is registry.create("passphrase", wordlist="eff_large")
+        True
+        """
+        generator_class = self.get(name)
+        bound = _constructor_signature(generator_class).bind(**config)
+        bound.apply_defaults()
+        key = (generator_class, _freeze(bound.arguments))
+
+        with self._instances_lock:
+            instance = self._instances.get(key)
+            if instance is not None:
+                self._instances.move_to_end(key)
+                return instance
+
+        # Built outside the lock: setup may be slow (e.g. indexing a wordlist)
+        instance = generator_class(**config)
+        instance._shared = True
+
+        with self._instances_lock:
+            instance = self._instances.setdefault(key, instance)
+            self._instances.move_to_end(key)
+            while len(self._instances) > INSTANCE_CACHE_SIZE:
+                self._instances.popitem(last=False)
+        return instance
+
+    def clear_instances(self) -> None:
+        """Drop every cached instance returned by :meth:`create`."""
+
+        with self._instances_lock:
+            self._instances.clear()
 
     def list_generators(self) -> list[str]:
         """List all registered generator names.
@@ -90,22 +275,31 @@ class GeneratorRegistry:
         >>> registry.list_generators()
         ['syllable']
         """
+        self.discover()
         return list(self._generators.keys())
 
+    def known_names(self) -> list[str]:
+        """List registered names without scanning entry points.
 
-# Global default registry with pre-registered generators
-registry = GeneratorRegistry()
+        Returns
+        -------
+        list[str]
+            Names registered so far, in registration order.
+        """
+        return list(self._generators.keys())
 
-# Import generators for registration
-from clinkey_cli.generators.passphrase import PassphraseGenerator
-from clinkey_cli.generators.pattern import PatternGenerator
-from clinkey_cli.generators.syllable import SyllableGenerator
+
+# Entry point group scanned for third-party generators
+ENTRY_POINT_GROUP = "clinkey.generators"
+
+# Global default registry with pre-registered generators
+registry = GeneratorRegistry(entry_point_group=ENTRY_POINT_GROUP)
 
 # Register syllable-based generators (backward compatible)
-registry.register("normal", SyllableGenerator)
-registry.register("strong", SyllableGenerator)
-registry.register("super_strong", SyllableGenerator)
+registry.register("normal", "clinkey_cli.generators.syllable:SyllableGenerator")
+registry.register("strong", "clinkey_cli.generators.syllable:SyllableGenerator")
+registry.register("super_strong", "clinkey_cli.generators.syllable:SyllableGenerator")
 
 # Register new generator types
-registry.register("passphrase", PassphraseGenerator)
-registry.register("pattern", PatternGenerator)
+registry.register("passphrase", "clinkey_cli.generators.passphrase:PassphraseGenerator")
+registry.register("pattern", "clinkey_cli.generators.pattern:PatternGenerator")
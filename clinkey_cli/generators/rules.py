@@ -0,0 +1,369 @@
+"""Site password rules compiled into pattern programs.
+
+Parses the ``passwordrules`` attribute syntax used by browsers and password
+managers, for example::
+
+    minlength: 12; maxlength: 24; required: upper; required: digit;
+    required: [-_.]; allowed: lower; max-consecutive: 2;
+
+into a :class:`RulesProgram`. Its steps are the same charset tables a
+:class:`~clinkey_cli.generators.pattern.PatternProgram` uses: every position
+draws from the allowed alphabet, except one random position per ``required``
+set, which draws from that set. Runs of identical characters are broken
+while drawing. Every password therefore complies on the first attempt, at
+the cost of a plain pattern.
+
+Supported properties are ``required``, ``allowed``, ``max-consecutive``,
+``minlength`` and ``maxlength``; unknown properties are ignored, as the
+syntax specifies. Classes are ``upper``, ``lower``, ``digit``, ``special``,
+``ascii-printable`` and ``unicode`` (generated as ``ascii-printable``), or a
+custom set such as ``[-().&@?'#,/"+]``. In a custom set every character is
+literal; a ``]`` right after the opening bracket is part of the set.
+"""
+
+import math
+import re
+import string
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from typing import NamedTuple
+
+from clinkey_cli.generators.pattern import PatternProgram
+
+# Maximum number of distinct rule strings kept parsed and compiled in memory
+RULES_CACHE_SIZE = 256
+
+# Password length used when the rules allow it
+DEFAULT_RULES_LENGTH = 16
+
+# Characters of each named class
+_ASCII_PRINTABLE = (
+    string.ascii_uppercase + string.ascii_lowercase + string.digits + string.punctuation
+)
+_RULE_CLASSES = {
+    "upper": string.ascii_uppercase,
+    "lower": string.ascii_lowercase,
+    "digit": string.digits,
+    "special": string.punctuation,
+    "ascii-printable": _ASCII_PRINTABLE,
+    "unicode": _ASCII_PRINTABLE,
+}
+
+
+class PasswordRules(NamedTuple):
+    """Parsed, normalized password rules.
+
+    Attributes
+    ----------
+    required : tuple[tuple[str, ...], ...]
+        Character sets each password must draw at least one character from.
+    allowed : tuple[str, ...]
+        Alphabet of every position, including the required characters.
+    max_consecutive : int | None
+        Longest allowed run of one character.
+    min_length : int
+        Minimum password length.
+    max_length : int | None
+        Maximum password length.
+    """
+
+    required: tuple[tuple[str, ...], ...]
+    allowed: tuple[str, ...]
+    max_consecutive: int | None
+    min_length: int
+    max_length: int | None
+
+
+class RulesProgram(NamedTuple):
+    """Rules compiled for one password length.
+
+    Attributes
+    ----------
+    rules : PasswordRules
+        Parsed rules.
+    program : PatternProgram
+        One step drawing from the allowed alphabet per output character.
+    """
+
+    rules: PasswordRules
+    program: PatternProgram
+
+    @property
+    def length(self) -> int:
+        """Length of every password produced by this program."""
+        return self.program.length
+
+    @property
+    def keyspace(self) -> int:
+        """Guaranteed number of distinct passwords this program can produce.
+
+        Each position counts its table size, less the (at most two)
+        characters excluded to break runs when ``max-consecutive`` is set.
+        """
+        excluded = 2 if self.rules.max_consecutive is not None else 0
+        free = self.length - len(self.rules.required)
+        keyspace = max(len(self.rules.allowed) - excluded, 1) ** free
+        for table in self.rules.required:
+            keyspace *= max(len(table) - excluded, 1)
+        return keyspace
+
+    @property
+    def entropy_bits(self) -> float:
+        """``log2`` of :attr:`keyspace`."""
+        return math.log2(self.keyspace)
+
+
+def _split_properties(rules: str) -> list[tuple[str, str]]:
+    """Split rules into ``(name, value)`` pairs, honouring ``[...]`` sets."""
+
+    properties = []
+    for chunk in _split_outside_brackets(rules, ";"):
+        if not chunk.strip():
+            continue
+        name, colon, value = chunk.partition(":")
+        if not colon:
+            raise ValueError(f"Invalid password rule: '{chunk.strip()}'")
+        properties.append((name.strip().lower(), value.strip()))
+    return properties
+
+
+def _split_outside_brackets(text: str, delimiter: str) -> list[str]:
+    """Split ``text`` on ``delimiter`` characters outside custom sets."""
+
+    parts = []
+    start = 0
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char == "[":
+            i = _closing_bracket(text, i)
+        elif char == delimiter:
+            parts.append(text[start:i])
+            start = i + 1
+        i += 1
+    parts.append(text[start:])
+    return parts
+
+
+def _closing_bracket(text: str, opening: int) -> int:
+    """Index of the ``]`` closing the custom set opened at ``opening``."""
+
+    search_from = opening + 2 if text.startswith("[]", opening) else opening + 1
+    close = text.find("]", search_from)
+    if close == -1:
+        raise ValueError(f"Unclosed character set in password rules: '{text}'")
+    return close
+
+
+def _parse_classes(value: str) -> set[str]:
+    """Union of the classes and custom sets listed in a property value."""
+
+    characters: set[str] = set()
+    for token in _split_outside_brackets(value, ","):
+        token = token.strip()
+        if token.startswith("["):
+            members = {char for char in token[1:-1] if char in _ASCII_PRINTABLE}
+            if not token.endswith("]") or not members:
+                raise ValueError(f"Invalid character set in password rules: {token}")
+            characters |= members
+        elif token.lower() in _RULE_CLASSES:
+            characters |= set(_RULE_CLASSES[token.lower()])
+        else:
+            valid = ", ".join(_RULE_CLASSES)
+            raise ValueError(
+                f"Unknown character class: '{token}'. Valid classes: {valid}, [...]"
+            )
+    return characters
+
+
+def _parse_int(name: str, value: str, minimum: int) -> int:
+    """Parse an integer property, raising ValueError below ``minimum``."""
+
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got '{value}'") from None
+    if number < minimum:
+        raise ValueError(f"{name} must be at least {minimum}, got {number}")
+    return number
+
+
+@lru_cache(maxsize=RULES_CACHE_SIZE)
+def parse_rules(rules: str) -> PasswordRules:
+    """Parse a ``passwordrules`` string once.
+
+    Repeated properties combine as the syntax specifies: every ``required``
+    adds a set, ``allowed`` sets are merged, and the strictest
+    ``max-consecutive``, ``minlength`` and ``maxlength`` win.
+
+    Parameters
+    ----------
+    rules : str
+        Rules in ``passwordrules`` syntax.
+
+    Returns
+    -------
+    PasswordRules
+        Normalized rules, cached by rule string.
+
+    Raises
+    ------
+    ValueError
+        If a property value is malformed, or the rules cannot be met.
+
+    Examples
+    --------
+    >>> rules = parse_rules("required: [-_]; allowed: digit; max-consecutive: 2")
+    >>> rules.required, len(rules.allowed), rules.max_consecutive
+    ((('-', '_'),), 12, 2)
+    """
+    required: list[tuple[str, ...]] = []
+    allowed: set[str] = set()
+    max_consecutive = None
+    min_length = 0
+    max_length = None
+
+    for name, value in _split_properties(rules):
+        if name == "required":
+            table = tuple(sorted(_parse_classes(value)))
+            if table not in required:
+                required.append(table)
+        elif name == "allowed":
+            allowed |= _parse_classes(value)
+        elif name == "max-consecutive":
+            number = _parse_int(name, value, 1)
+            max_consecutive = min(max_consecutive or number, number)
+        elif name == "minlength":
+            min_length = max(min_length, _parse_int(name, value, 0))
+        elif name == "maxlength":
+            number = _parse_int(name, value, 1)
+            max_length = min(max_length or number, number)
+        # Unknown properties are ignored, as the syntax specifies
+
+    alphabet = allowed.union(*required) if allowed or required else _ASCII_PRINTABLE
+    if max_length is not None and max_length < max(min_length, len(required)):
+        raise ValueError(
+            f"maxlength {max_length} leaves no room for minlength {min_length} "
+            f"and {len(required)} required set(s)"
+        )
+    if max_consecutive is not None and len(set(alphabet)) == 1:
+        raise ValueError("max-consecutive cannot be met with a single character")
+    if (
+        max_consecutive is not None
+        and len(set(alphabet)) == 2
+        and any(len(table) == 1 for table in required)
+    ):
+        # Breaking runs could then exclude both characters from one draw
+        raise ValueError(
+            "max-consecutive with a two-character alphabet cannot also "
+            "require a single character"
+        )
+
+    return PasswordRules(
+        required=tuple(required),
+        allowed=tuple(sorted(alphabet)),
+        max_consecutive=max_consecutive,
+        min_length=min_length,
+        max_length=max_length,
+    )
+
+
+@lru_cache(maxsize=RULES_CACHE_SIZE)
+def compile_rules(rules: str, length: int | None = None) -> RulesProgram:
+    """Compile password rules for a given length, once per process.
+
+    Parameters
+    ----------
+    rules : str
+        Rules in ``passwordrules`` syntax.
+    length : int | None, default None
+        Requested password length, clamped to the rules' ``minlength`` and
+        ``maxlength``. ``None`` uses ``DEFAULT_RULES_LENGTH``, clamped too.
+
+    Returns
+    -------
+    RulesProgram
+        Compiled program, cached by ``(rules, length)``.
+
+    Raises
+    ------
+    ValueError
+        If the rules are malformed or cannot be met.
+
+    Examples
+    --------
+    >>> compile_rules("required: upper; maxlength: 10", 16).length
+    10
+    """
+    parsed = parse_rules(rules)
+    length = DEFAULT_RULES_LENGTH if length is None else length
+    length = max(length, parsed.min_length, len(parsed.required), 1)
+    if parsed.max_length is not None:
+        length = min(length, parsed.max_length)
+
+    steps = (parsed.allowed,) * length
+    return RulesProgram(parsed, PatternProgram.from_steps(rules, steps))
+
+
+@lru_cache(maxsize=None)
+def _run_finder(limit: int) -> re.Pattern[str]:
+    """Regex matching a run of more than ``limit`` identical characters."""
+
+    return re.compile(r"(.)\1{%d}" % limit, re.DOTALL)
+
+
+def draw_limited(
+    tables: Sequence[Sequence[str]], limit: int, randbelow: Callable[[int], int]
+) -> str:
+    """Draw one character per table, never repeating one more than ``limit`` times.
+
+    Every position is drawn first. Positions that extend a run past
+    ``limit`` are then redrawn from their table without the repeated
+    character, which is distributed exactly like excluding it up front. A
+    position followed by a single-character table also avoids that
+    character when the next position would otherwise be forced past the
+    limit.
+
+    Parameters
+    ----------
+    tables : Sequence[Sequence[str]]
+        Alphabet of every position.
+    limit : int
+        Longest allowed run of one character.
+    randbelow : Callable[[int], int]
+        Uniform integer source, ``randbelow(n)`` in ``[0, n)``.
+
+    Returns
+    -------
+    str
+        Drawn characters.
+    """
+    chars = [table[randbelow(len(table))] for table in tables]
+    if 1 not in map(len, tables) and not _run_finder(limit).search("".join(chars)):
+        return "".join(chars)
+
+    run = 0
+    last = len(tables) - 1
+    for position, table in enumerate(tables):
+        excluded = []
+        if run >= limit:
+            excluded.append(chars[position - 1])
+        if position < last and len(tables[position + 1]) == 1:
+            forced = tables[position + 1][0]
+            prior = run if position and chars[position - 1] == forced else 0
+            if prior + 2 > limit:
+                excluded.append(forced)
+
+        if chars[position] in excluded:
+            candidates = [char for char in table if char not in excluded]
+            if not candidates:
+                candidates = [char for char in table if char not in excluded[:1]]
+            if candidates:
+                chars[position] = candidates[randbelow(len(candidates))]
+
+        if position and chars[position] == chars[position - 1]:
+            run += 1
+        else:
+            run = 1
+
+    return "".join(chars)
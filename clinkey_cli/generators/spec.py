@@ -0,0 +1,155 @@
+"""Generation specs: validate options once, then generate many passwords.
+
+A :class:`GenerationSpec` is built after a generator has validated its
+options. It binds the raw password source to the post-processing those
+options need. Edge stripping is one ``str.strip``. Separator removal or
+replacement and lowercasing are folded into one ``str.translate`` table.
+Generating a password is then a fixed sequence of calls, with no option
+checks or repeated ``str.replace`` passes.
+"""
+
+import string
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from itertools import count as _count
+from itertools import repeat
+from typing import NamedTuple
+
+# Maximum number of distinct translation tables kept in memory
+SPEC_CACHE_SIZE = 256
+
+# Separators generators join words with by default
+DEFAULT_SEPARATORS = "-_"
+
+
+@lru_cache(maxsize=SPEC_CACHE_SIZE)
+def compile_translation(
+    lower: bool = False,
+    no_separator: bool = False,
+    separator: str | None = None,
+    removed: str = "",
+) -> dict[int, str | None]:
+    """Fold separator and case transforms into one ``str.translate`` table.
+
+    The table gives the same result as replacing or removing the default
+    separators first, then lowercasing.
+
+    Parameters
+    ----------
+    lower : bool, default False
+        Lowercase ASCII letters.
+    no_separator : bool, default False
+        Remove the default separators and ``removed``.
+    separator : str | None, default None
+        Replace the default separators with this string. Ignored when
+        ``no_separator`` is set.
+    removed : str, default ""
+        Extra characters removed along with the default separators.
+
+    Returns
+    -------
+    dict[int, str | None]
+        Translation table, cached by arguments; empty if nothing changes.
+        Callers must not modify it.
+
+    Examples
+    --------
+    >>> table = compile_translation(lower=True, separator=".")
+    >>> "AB-CD_EF".translate(table)
+    'ab.cd.ef'
+    """
+    table: dict[int, str | None] = {}
+    if lower:
+        table.update((ord(char), char.lower()) for char in string.ascii_uppercase)
+    if no_separator:
+        table.update((ord(char), None) for char in DEFAULT_SEPARATORS + removed)
+    elif separator is not None:
+        replacement = separator.lower() if lower else separator
+        table.update((ord(char), replacement) for char in DEFAULT_SEPARATORS)
+    return table
+
+
+class GenerationSpec(NamedTuple):
+    """Validated generation options compiled into a fixed pipeline.
+
+    Built by :meth:`SyllableGenerator.compile
+    <clinkey_cli.generators.syllable.SyllableGenerator.compile>` and by
+    :class:`~clinkey_cli.main.Clinkey`. Calling the spec generates one
+    password.
+
+    Attributes
+    ----------
+    produce : Callable[[], str]
+        Source of raw passwords at the requested length.
+    table : dict[int, str | None]
+        ``str.translate`` table from :func:`compile_translation`; skipped
+        when empty.
+    strip : str
+        Characters stripped from both ends before translating.
+    finish : Callable[[str], str] | None
+        Last step, such as placing a compliance policy's character classes.
+    """
+
+    produce: Callable[[], str]
+    table: dict[int, str | None]
+    strip: str = ""
+    finish: Callable[[str], str] | None = None
+
+    def __call__(self) -> str:
+        """Generate one password."""
+
+        password = self.produce()
+        if self.strip:
+            password = password.strip(self.strip)
+        if self.table:
+            password = password.translate(self.table)
+        if self.finish is not None:
+            password = self.finish(password)
+        return password
+
+    def execute(self, n: int) -> list[str]:
+        """Generate ``n`` passwords.
+
+        Parameters
+        ----------
+        n : int
+            Number of passwords.
+
+        Returns
+        -------
+        list[str]
+            Generated passwords.
+
+        Raises
+        ------
+        ValueError
+            If n is negative.
+        """
+        if n < 0:
+            raise ValueError(f"count must be non-negative, got {n}")
+        generate = self.__call__
+        return [generate() for _ in repeat(None, n)]
+
+    def stream(self, count: int | None = None) -> Iterator[str]:
+        """Lazily generate passwords.
+
+        Parameters
+        ----------
+        count : int | None, default None
+            Number of passwords to yield. ``None`` yields indefinitely.
+
+        Returns
+        -------
+        Iterator[str]
+            Lazy iterator over generated passwords.
+
+        Raises
+        ------
+        ValueError
+            If count is negative.
+        """
+        if count is not None and count < 0:
+            raise ValueError(f"count must be non-negative, got {count}")
+        generate = self.__call__
+        ticks = _count() if count is None else repeat(None, count)
+        return (generate() for _ in ticks)
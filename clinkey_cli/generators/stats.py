@@ -0,0 +1,84 @@
+"""Opt-in instrumentation for password generators.
+
+Generators collect nothing by default: their hot paths only check whether a
+:class:`GeneratorStats` is attached. :meth:`BaseGenerator.enable_stats`
+attaches one, after which counters (retries, truncated characters, policy
+adjustments) and the time spent in ``generate`` are recorded.
+"""
+
+import threading
+from collections import Counter
+from collections.abc import Callable
+from time import perf_counter_ns
+from typing import Any
+
+
+class GeneratorStats:
+    """Thread-safe counters and timers filled by an instrumented generator.
+
+    One instance can be shared by several generators to aggregate them.
+
+    Examples
+    --------
+    >>> stats = GeneratorStats()
+    >>> stats.add("unique_word.retries", 2)
+    >>> stats.snapshot()["counters"]
+    {'unique_word.retries': 2}
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Counter[str] = Counter()
+        # Timer name -> [calls, total nanoseconds]
+        self._timers: dict[str, list[int]] = {}
+
+    def add(self, name: str, value: int = 1) -> None:
+        """Increase counter ``name`` by ``value``."""
+
+        with self._lock:
+            self._counters[name] += value
+
+    def record(self, name: str, elapsed_ns: int) -> None:
+        """Record one timed call of ``name`` lasting ``elapsed_ns``."""
+
+        with self._lock:
+            timer = self._timers.setdefault(name, [0, 0])
+            timer[0] += 1
+            timer[1] += elapsed_ns
+
+    def reset(self) -> None:
+        """Clear every counter and timer."""
+
+        with self._lock:
+            self._counters.clear()
+            self._timers.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a consistent copy of the collected values.
+
+        Returns
+        -------
+        dict[str, Any]
+            ``{"counters": {name: value}, "timers": {name: {"calls": int,
+            "seconds": float}}}``, sorted by name.
+        """
+        with self._lock:
+            counters = dict(sorted(self._counters.items()))
+            timers = {
+                name: {"calls": calls, "seconds": elapsed / 1e9}
+                for name, (calls, elapsed) in sorted(self._timers.items())
+            }
+        return {"counters": counters, "timers": timers}
+
+
+def timed(name: str, function: Callable[..., Any], stats: GeneratorStats):
+    """Wrap ``function`` so each call is recorded under timer ``name``."""
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stats.record(name, perf_counter_ns() - start)
+
+    return wrapper
@@ -5,16 +5,170 @@ This is the original Clinkey generation method, refactored into the new
 generator architecture while maintaining 100% backward compatibility.
 """
 
-import secrets
 import string
-from typing import Callable
+from bisect import bisect_left
+from collections.abc import Iterator
+from functools import lru_cache, partial
+from itertools import chain, product, repeat
+from typing import TYPE_CHECKING, Any, Callable
 
 from clinkey_cli.generators.base import BaseGenerator
+from clinkey_cli.generators.random_source import RandomSource
+from clinkey_cli.generators.spec import GenerationSpec, compile_translation
+
+if TYPE_CHECKING:
+    from clinkey_cli.security.compliance import CompliancePolicy
 
 # Security and validation constants
 MAX_PASSWORD_LENGTH = 128
 MIN_PASSWORD_LENGTH = 16
 
+# Character sets
+_CONSONANTS = tuple("bcdfghjklmnpqrstvwxz")
+_VOWELS = tuple("aeiouy")
+_DIGITS = tuple(string.digits)
+_SPECIALS = tuple("!@#$%^€£-_;:,.?")
+
+# Consonant-vowel pairs for basic pronounceability
+_SIMPLE_SYLLABLES = tuple(c + v for c in _CONSONANTS for v in _VOWELS)
+
+# More complex consonant clusters
+_COMPLEX_SYLLABLES: tuple[str, ...] = (
+    "TRE", "TRI", "TRO", "TRA", "TRU", "TRY", "TSA", "TSE",
+    "TSI", "TSO", "TSU", "TSY", "DRE", "DRI", "DRO", "DRA",
+    "DRU", "DRY", "BRE", "BRI", "BRO", "BRA", "BRU", "BRY",
+    "BLA", "BLE", "BLI", "BLO", "BLU", "BLY", "CRE", "CRI",
+    "CRO", "CRA", "CRU", "CRY", "CHA", "CHE", "CHI", "CHO",
+    "CHU", "CHY", "FRE", "FRI", "FRO", "FRA", "FRY", "FLA",
+    "FLE", "FLI", "FLO", "FLU", "FLY", "GRE", "GRI", "GRO",
+    "GRA", "GRU", "GRY", "GLA", "GLE", "GLI", "GLO", "GLU",
+    "GLY", "GNA", "GNE", "GNI", "GNO", "GNU", "GNY", "PRE",
+    "PRI", "PRO", "PRA", "PRU", "PRY", "PLA", "PLE", "PLI",
+    "PLO", "PLU", "PLY", "QUA", "QUE", "QUI", "QUO", "QUY",
+    "SRE", "SRI", "SRO", "SRA", "SRU", "SRY", "SLA", "SLE",
+    "SLI", "SLO", "SLU", "SLY", "STA", "STE", "STI", "STO",
+    "STU", "STY", "SNA", "SNE", "SNI", "SNO", "SNU", "SNY",
+    "SMA", "SME", "SMI", "SMO", "SMU", "SMY", "SHA", "SHE",
+    "SHI", "SHO", "SHU", "SHY", "SPY", "SPA", "SPE", "SPI",
+    "SPO", "SPU", "VRE", "VRI", "VRO", "VRA", "VRU", "VRY",
+    "VLA", "VLE", "VLI", "VLO", "VLU", "VLY", "VNA", "VNE",
+    "VNI", "VNO", "VNU", "VNY", "VHA", "VHE", "VHI", "VHO",
+    "VHU", "VHY", "VJA", "VJE", "VJI", "VJO", "VJU", "VJY",
+    "WHA", "WHE", "WHI", "WHO", "WHU", "ZRE", "ZRU", "ZRI",
+    "ZRO", "ZRA", "ABD", "ABF", "ABG", "ABH", "ABJ", "ABK",
+    "ABL", "ABN", "ABR", "ABS", "ABT", "ABV", "ABZ", "ACD",
+    "ACF", "ACH", "ACJ", "ACK", "ACL", "ACM", "ACN", "ACP",
+    "ACR", "ACS", "ACT", "ACV", "ACZ", "EBD", "EBF", "EBH",
+    "EBJ", "EBK", "EBL", "EBN", "EBR", "EBS", "EBT", "EBV",
+    "EBZ", "ECF", "ECH", "ECJ", "ECK", "ECL", "ECM", "ECN",
+    "ECP", "ECR", "ECS", "ECT", "ECV", "ECZ", "EDF", "EDH",
+    "EDJ", "EDK", "EDL", "EDN", "EDR", "EDS", "EDT", "EDV",
+    "EDZ", "EFF", "EFH", "EFJ", "EFK", "EFL", "EFN", "EFP",
+    "EFR", "EFS", "EFT", "EFV", "EFZ", "EGF", "EGH", "EGJ",
+    "EGK", "EGL", "EGN", "EGP", "EGR", "EGS", "EGT", "EGV",
+    "EGZ", "EHF", "EHJ", "EHK", "EHL", "EHN", "EHP", "EHR",
+)
+
+# Combined pool sampled by every word, uppercased once up front
+# simple: 120 combinations (consonant + vowel)
+# complex: 264 combinations (clusters)
+_ALL_SYLLABLES: tuple[str, ...] = tuple(
+    syllable.upper() for syllable in _SIMPLE_SYLLABLES + _COMPLEX_SYLLABLES
+)
+
+# Syllable counts a single word may use
+_SYLLABLE_COUNTS = (1, 2, 3, 4)
+
+
+def _is_valid_word_length_shape(lengths: tuple[int, ...]) -> bool:
+    """Check a four-word syllable-count shape against the variety rules.
+
+    Avoid devolving into uniform or overly short words. We want mostly
+    multi-syllable words with at least one 3–4 syllable word and at most one
+    single-syllable segment.
+    """
+    return (
+        lengths.count(1) <= 1
+        and max(lengths) >= 3
+        and len(set(lengths)) > 1
+        and sum(1 for length in lengths if length >= 2) >= 3
+    )
+
+
+# Every acceptable shape, enumerated once. Drawing one uniformly is
+# equivalent to rejection-sampling uniform shapes until one is accepted.
+_WORD_LENGTH_SHAPES = tuple(
+    shape
+    for shape in product(_SYLLABLE_COUNTS, repeat=4)
+    if _is_valid_word_length_shape(shape)
+)
+
+
+# Extra single characters prefixed to words, by word index, for each type
+_TYPE_PREFIXES: dict[str, dict[int, tuple[str, ...]]] = {
+    "normal": {},
+    "strong": {0: ("digit", "digit")},
+    "super_strong": {0: ("digit", "digit"), 1: ("special",)},
+}
+
+
+@lru_cache(maxsize=None)
+def _layout_keyspace(
+    shape: tuple[int, ...],
+    length: int,
+    prefixes: tuple[tuple[int, ...], ...],
+    pool: int,
+    syllable_length: int,
+) -> int:
+    """Count the choices fixed by one word layout, every syllable a cluster.
+
+    The four words of ``shape`` are followed by one-syllable words until
+    ``length`` characters are covered, each word after a separator.
+    ``prefixes[i]`` lists the alphabet sizes of the characters prefixed to
+    word ``i``. Every syllable is one of ``pool`` clusters, counted as
+    ``syllable_length`` characters long. Syllables cut by truncation are
+    not counted, and each word loses one choice per earlier word it must
+    differ from.
+    """
+    keyspace = 1
+    position = -1  # No separator before the first word
+
+    for index, syllables in enumerate(chain(shape, repeat(1))):
+        position += 1
+        for size in prefixes[index] if index < len(prefixes) else ():
+            if position >= length:
+                return keyspace
+            keyspace *= size
+            position += 1
+
+        word = 1
+        for _ in range(syllables):
+            position += syllable_length
+            if position > length:
+                break
+            word *= pool
+        keyspace *= max(word - index, 1)
+
+        if position >= length:
+            return keyspace
+
+    raise AssertionError("unreachable: the word sequence is unbounded")
+
+
+@lru_cache(maxsize=None)
+def _syllable_keyspace(
+    length: int,
+    prefixes: tuple[tuple[int, ...], ...],
+    pool: int,
+    syllable_length: int,
+) -> int:
+    """Keyspace of the least favourable word layout for ``length``."""
+
+    return min(
+        _layout_keyspace(shape, length, prefixes, pool, syllable_length)
+        for shape in _WORD_LENGTH_SHAPES
+    )
+
 
 class SyllableGenerator(BaseGenerator):
     """Generate pronounceable passwords using syllable patterns.
@@ -25,86 +179,78 @@ class SyllableGenerator(BaseGenerator):
     Parameters
     ----------
     language : str, default "english"
-        Syllable set language (currently only "english" supported).
+        Syllable set language: "english" (built in) or a bundled language
+        pack (see :mod:`clinkey_cli.languages`).
+    random_source : RandomSource | None, default None
+        Source of randomness. Defaults to the shared buffered OS source.
 
     Attributes
     ----------
-    _consonants : list[str]
+    _consonants : tuple[str, ...]
         Consonants used to build syllables.
-    _vowels : list[str]
+    _vowels : tuple[str, ...]
         Vowels used to build syllables.
-    _digits : list[str]
+    _digits : tuple[str, ...]
         Digits used in strong/super_strong passwords.
-    _specials : list[str]
+    _specials : tuple[str, ...]
         Special characters used in super_strong passwords.
-    _simple_syllables : list[str]
+    _simple_syllables : tuple[str, ...]
         Consonant-vowel pairs for basic pronounceability.
-    _complex_syllables : list[str]
+    _complex_syllables : tuple[str, ...]
         More complex consonant clusters.
-    _separators : list[str]
-        Default separator characters.
+    _all_syllables : tuple[str, ...]
+        Uppercased union of simple and complex syllables.
+    _separators : tuple[str, ...]
+        Default separator characters. Never mutated: per-call separators are
+        passed explicitly, so one instance can be shared across threads.
     language : str
         Current language setting.
+
+    Notes
+    -----
+    English syllable tables are frozen tuples built once at import time.
+    Other languages are compiled once per process on first use. Either way,
+    every instance of a language shares the same tables.
     """
 
-    def __init__(self, language: str = "english"):
+    _consonants = _CONSONANTS
+    _vowels = _VOWELS
+    _digits = _DIGITS
+    _specials = _SPECIALS
+    _simple_syllables = _SIMPLE_SYLLABLES
+    _complex_syllables = _COMPLEX_SYLLABLES
+    _all_syllables = _ALL_SYLLABLES
+    _separators = ("-",)
+
+    def __init__(
+        self, language: str = "english", random_source: RandomSource | None = None
+    ):
         """Initialize syllable generator with specified language.
 
         Parameters
         ----------
         language : str, default "english"
             Language for syllable patterns.
+        random_source : RandomSource | None, default None
+            Source of randomness. Defaults to the shared buffered OS source.
+
+        Raises
+        ------
+        ValueError
+            If no language pack is named ``language``.
         """
+        super().__init__(random_source)
         self.language = language
+        if language != "english":
+            # Imported here: English needs no pack
+            from clinkey_cli.languages import load_language
 
-        # Character sets
-        self._consonants = list("bcdfghjklmnpqrstvwxz")
-        self._vowels = list("aeiouy")
-        self._digits = list(string.digits)
-        self._specials = list("!@#$%^€£-_;:,.?")
-
-        # Build syllable sets
-        self._simple_syllables = [
-            c + v for c in self._consonants for v in self._vowels
-        ]
-        self._complex_syllables = [
-            "TRE", "TRI", "TRO", "TRA", "TRU", "TRY", "TSA", "TSE",
-            "TSI", "TSO", "TSU", "TSY", "DRE", "DRI", "DRO", "DRA",
-            "DRU", "DRY", "BRE", "BRI", "BRO", "BRA", "BRU", "BRY",
-            "BLA", "BLE", "BLI", "BLO", "BLU", "BLY", "CRE", "CRI",
-            "CRO", "CRA", "CRU", "CRY", "CHA", "CHE", "CHI", "CHO",
-            "CHU", "CHY", "FRE", "FRI", "FRO", "FRA", "FRY", "FLA",
-            "FLE", "FLI", "FLO", "FLU", "FLY", "GRE", "GRI", "GRO",
-            "GRA", "GRU", "GRY", "GLA", "GLE", "GLI", "GLO", "GLU",
-            "GLY", "GNA", "GNE", "GNI", "GNO", "GNU", "GNY", "PRE",
-            "PRI", "PRO", "PRA", "PRU", "PRY", "PLA", "PLE", "PLI",
-            "PLO", "PLU", "PLY", "QUA", "QUE", "QUI", "QUO", "QUY",
-            "SRE", "SRI", "SRO", "SRA", "SRU", "SRY", "SLA", "SLE",
-            "SLI", "SLO", "SLU", "SLY", "STA", "STE", "STI", "STO",
-            "STU", "STY", "SNA", "SNE", "SNI", "SNO", "SNU", "SNY",
-            "SMA", "SME", "SMI", "SMO", "SMU", "SMY", "SHA", "SHE",
-            "SHI", "SHO", "SHU", "SHY", "SPY", "SPA", "SPE", "SPI",
-            "SPO", "SPU", "VRE", "VRI", "VRO", "VRA", "VRU", "VRY",
-            "VLA", "VLE", "VLI", "VLO", "VLU", "VLY", "VNA", "VNE",
-            "VNI", "VNO", "VNU", "VNY", "VHA", "VHE", "VHI", "VHO",
-            "VHU", "VHY", "VJA", "VJE", "VJI", "VJO", "VJU", "VJY",
-            "WHA", "WHE", "WHI", "WHO", "WHU", "ZRE", "ZRU", "ZRI",
-            "ZRO", "ZRA", "ABD", "ABF", "ABG", "ABH", "ABJ", "ABK",
-            "ABL", "ABN", "ABR", "ABS", "ABT", "ABV", "ABZ", "ACD",
-            "ACF", "ACH", "ACJ", "ACK", "ACL", "ACM", "ACN", "ACP",
-            "ACR", "ACS", "ACT", "ACV", "ACZ", "EBD", "EBF", "EBH",
-            "EBJ", "EBK", "EBL", "EBN", "EBR", "EBS", "EBT", "EBV",
-            "EBZ", "ECF", "ECH", "ECJ", "ECK", "ECL", "ECM", "ECN",
-            "ECP", "ECR", "ECS", "ECT", "ECV", "ECZ", "EDF", "EDH",
-            "EDJ", "EDK", "EDL", "EDN", "EDR", "EDS", "EDT", "EDV",
-            "EDZ", "EFF", "EFH", "EFJ", "EFK", "EFL", "EFN", "EFP",
-            "EFR", "EFS", "EFT", "EFV", "EFZ", "EGF", "EGH", "EGJ",
-            "EGK", "EGL", "EGN", "EGP", "EGR", "EGS", "EGT", "EGV",
-            "EGZ", "EHF", "EHJ", "EHK", "EHL", "EHN", "EHP", "EHR"
-        ]
-
-        # Default separators
-        self._separators = ["-"]
+            pack = load_language(language)
+            self._consonants = pack.consonants
+            self._vowels = pack.vowels
+            self._simple_syllables = pack.simple_syllables
+            self._complex_syllables = pack.complex_syllables
+            self._all_syllables = pack.all_syllables
 
         # Generator method mapping
         self._generators: dict[str, Callable[[], list[str]]] = {
@@ -121,6 +267,7 @@ class SyllableGenerator(BaseGenerator):
         lower: bool = False,
         no_separator: bool = False,
         separator: str | None = None,
+        policy: "CompliancePolicy | None" = None,
     ) -> str:
         """Generate syllable-based password.
 
@@ -136,6 +283,9 @@ class SyllableGenerator(BaseGenerator):
             Remove separators if True.
         separator : str | None, default None
             Custom separator to use instead of default.
+        policy : CompliancePolicy | None, default None
+            Compiled policy whose character classes are placed in the
+            password, so it complies without regeneration.
 
         Returns
         -------
@@ -147,7 +297,104 @@ class SyllableGenerator(BaseGenerator):
         ValueError
             If length is invalid or password_type is unsupported.
         """
-        # Validate length
+        return self.compile(
+            length, password_type, lower, no_separator, separator, policy
+        )()
+
+    def compile(
+        self,
+        length: int,
+        # This is a preset label, not a hardcoded password.
+        password_type: str = "normal",  # nosec B107
+        lower: bool = False,
+        no_separator: bool = False,
+        separator: str | None = None,
+        policy: "CompliancePolicy | None" = None,
+    ) -> GenerationSpec:
+        """Validate options once and compile them into a generation spec.
+
+        Parameters
+        ----------
+        length : int
+            Target password length.
+        password_type : str, default "normal"
+            Password complexity: "normal", "strong", or "super_strong".
+        lower : bool, default False
+            Convert to lowercase if True.
+        no_separator : bool, default False
+            Remove separators if True.
+        separator : str | None, default None
+            Custom separator to use instead of default.
+        policy : CompliancePolicy | None, default None
+            Compiled policy applied to every password.
+
+        Returns
+        -------
+        GenerationSpec
+            Spec generating passwords from this instance, with separator and
+            case transforms folded into one translation table.
+
+        Raises
+        ------
+        ValueError
+            If length is invalid or password_type is unsupported.
+
+        Examples
+        --------
+        >>> spec = SyllableGenerator().compile(20, "strong", lower=True)
+        >>> [len(password) for password in spec.execute(3)]
+        [20, 20, 20]
+        """
+        self._validate(length, password_type)
+        words_for = self._generators[password_type]
+        finish = None if policy is None else partial(self._apply_policy, policy=policy)
+        return GenerationSpec(
+            produce=partial(self._raw_password, words_for, length),
+            table=compile_translation(lower, no_separator, separator),
+            finish=finish,
+        )
+
+    def iter_generate(self, count: int | None = None, **kwargs) -> Iterator[str]:
+        """Lazily yield passwords, validating the options only once.
+
+        Parameters
+        ----------
+        count : int | None, default None
+            Number of passwords to yield. ``None`` yields indefinitely.
+        **kwargs : dict
+            Arguments of :meth:`generate`.
+
+        Returns
+        -------
+        Iterator[str]
+            Lazy iterator over generated passwords.
+
+        Raises
+        ------
+        ValueError
+            If count is negative or any option is invalid.
+        """
+        spec = self.compile(**kwargs)
+        if self._stats is not None:
+            # Keeps the per-call ``generate`` timer of enable_stats()
+            return super().iter_generate(count, **kwargs)
+        return spec.stream(count)
+
+    def _raw_password(self, words_for: Callable[[], list[str]], length: int) -> str:
+        """Build one untransformed password of exactly ``length`` characters."""
+
+        separator = self._random.choice(self._separators)
+        words = words_for()
+
+        # Extend with new unique words instead of repeating patterns to reach
+        # the desired length safely.
+        words = self._extend_words_to_length(words, length, separator)
+
+        return self.fit_to_length(self._join_words(words, separator), length)
+
+    def _validate(self, length: int, password_type: str) -> None:
+        """Raise ValueError if length or password_type is unsupported."""
+
         if length < MIN_PASSWORD_LENGTH:
             raise ValueError(
                 f"length must be at least {MIN_PASSWORD_LENGTH}, got {length}"
@@ -157,7 +404,6 @@ class SyllableGenerator(BaseGenerator):
                 f"length cannot exceed {MAX_PASSWORD_LENGTH}, got {length}"
             )
 
-        # Validate password type
         if password_type not in self._generators:
             valid_types = ", ".join(sorted(self._generators.keys()))
             raise ValueError(
@@ -165,63 +411,136 @@ class SyllableGenerator(BaseGenerator):
                 f"Valid types: {valid_types}"
             )
 
-        # Generate base password
-        generator = self._generators[password_type]
-        separator_to_use = secrets.choice(self._separators)
-        words = generator()
+    def keyspace(
+        self,
+        length: int = 0,
+        # This is a preset label, not a hardcoded password.
+        password_type: str = "normal",  # nosec B107
+        lower: bool = False,
+        no_separator: bool = False,
+        separator: str | None = None,
+        **kwargs: Any,
+    ) -> int:
+        """Count the passwords guaranteed to be reachable with these options.
+
+        The count comes from the syllable, digit and special tables, for the
+        least favourable layout: every syllable a three-letter cluster, words
+        as short as allowed, and syllables cut by truncation ignored. It is a
+        floor, so :meth:`entropy_bits` never overstates strength.
 
-        # Extend with new unique words instead of repeating patterns to reach
-        # the desired length safely.
-        words = self._extend_words_to_length(words, length, separator_to_use)
+        Parameters
+        ----------
+        length : int, default 0
+            Target password length; required, as 0 is below the minimum.
+        password_type : str, default "normal"
+            Password complexity: "normal", "strong", or "super_strong".
+        lower : bool, default False
+            Convert to lowercase if True.
+        no_separator : bool, default False
+            Remove separators if True.
+        separator : str | None, default None
+            Custom separator to use instead of default.
+        **kwargs
+            Additional arguments (ignored: a policy filters passwords but
+            does not widen the guaranteed count).
+
+        Returns
+        -------
+        int
+            Guaranteed number of equally likely passwords.
+
+        Raises
+        ------
+        ValueError
+            If length is invalid or password_type is unsupported.
 
-        password = self._join_words(words, separator_to_use)
+        Examples
+        --------
+        >>> gen = SyllableGenerator()
+        >>> gen.keyspace(16) < gen.keyspace(16, "strong") < gen.keyspace(24)
+        True
+        """
+        self._validate(length, password_type)
+
+        # Specials equal to a separator collapse once separators are replaced
+        sizes = {
+            "digit": len(set(self._digits)),
+            "special": len(
+                {
+                    self.transform(special, lower, no_separator, separator)
+                    for special in self._specials
+                }
+            ),
+        }
+        layout = _TYPE_PREFIXES[password_type]
+        prefixes = tuple(
+            tuple(sizes[kind] for kind in layout.get(index, ()))
+            for index in range(max(layout, default=-1) + 1)
+        )
+        # The longest clusters fit the fewest syllables into ``length``
+        longest = max(map(len, self._complex_syllables))
+        return _syllable_keyspace(
+            length, prefixes, len(self._complex_syllables), longest
+        )
+
+    def params_for_bits(self, min_bits: float, **kwargs: Any) -> dict[str, Any]:
+        """Raise ``length`` to the smallest value reaching ``min_bits``.
 
-        # Fit to target length
-        password = self.fit_to_length(password, length)
+        Parameters
+        ----------
+        min_bits : float
+            Required entropy in bits.
+        **kwargs : dict
+            Arguments that would be passed to :meth:`generate`.
 
-        # Apply transformations
-        password = self.transform(password, lower, no_separator, separator)
+        Returns
+        -------
+        dict[str, Any]
+            ``kwargs`` with ``length`` set, never below the given value.
 
-        return password
+        Raises
+        ------
+        ValueError
+            If even ``MAX_PASSWORD_LENGTH`` falls short of ``min_bits``.
+
+        Examples
+        --------
+        >>> SyllableGenerator().params_for_bits(100, length=16)["length"]
+        47
+        """
+        options = {**kwargs, "length": kwargs.get("length", MIN_PASSWORD_LENGTH)}
+        self._validate(options["length"], options.get("password_type", "normal"))
+
+        def bits(length: int) -> float:
+            return self.entropy_bits(**{**options, "length": length})
+
+        # Entropy never decreases with length, so the minimum is bisected
+        lengths = range(options["length"], MAX_PASSWORD_LENGTH + 1)
+        found = bisect_left(lengths, min_bits, key=bits)
+        if found == len(lengths):
+            raise ValueError(
+                f"cannot reach {min_bits:g} bits: {MAX_PASSWORD_LENGTH} "
+                f"characters give {bits(MAX_PASSWORD_LENGTH):.1f}"
+            )
+        options["length"] = lengths[found]
+        return options
 
     def _random_word_lengths(self) -> list[int]:
         """Pick random syllable counts for the four words.
 
         Guarantees at least one word uses multiple CV pairs so we never fall
-        back to a CV-CV-CV-CV-CV pattern.
+        back to a CV-CV-CV-CV-CV pattern. A single draw from the precomputed
+        valid shapes replaces the former generate-and-reject loop.
         """
 
-        while True:
-            lengths = [secrets.choice((1, 2, 3, 4)) for _ in range(4)]
-
-            # Avoid devolving into uniform or overly short words. We want
-            # mostly multi-syllable words with at least one 3–4 syllable word
-            # and at most one single-syllable segment.
-            if lengths.count(1) > 1:
-                continue
-            if max(lengths) < 3:
-                continue
-            if len(set(lengths)) == 1:
-                continue
-            if sum(1 for length in lengths if length >= 2) < 3:
-                continue
-
-            return lengths
+        return list(self._random.choice(_WORD_LENGTH_SHAPES))
 
     def _generate_word(self, syllable_count: int) -> str:
         """Generate a word with random selection of simple/complex syllables."""
 
-        syllables = []
-        # Combine pools of syllables
-        # simple: ~120 combinations (consonant + vowel)
-        # complex: ~170 combinations (clusters)
-        all_syllables = self._simple_syllables + self._complex_syllables
-
-        for _ in range(syllable_count):
-            syllable = secrets.choice(all_syllables)
-            syllables.append(syllable)
+        syllables = self._random.choices(self._all_syllables, syllable_count)
 
-        return "".join(syllables).upper()
+        return "".join(syllables)
 
     def _build_word_list(self) -> list[str]:
         """Create the four-word base used by all variants."""
@@ -232,6 +551,8 @@ class SyllableGenerator(BaseGenerator):
         for count in self._random_word_lengths():
             word = self._generate_word(count)
             while word in seen:
+                if self._stats is not None:
+                    self._stats.add("base_word.retries")
                 word = self._generate_word(count)
             seen.add(word)
             words.append(word)
@@ -243,33 +564,83 @@ class SyllableGenerator(BaseGenerator):
 
         return "".join(ch for ch in word if ch.isalpha())
 
-    def _generate_unique_word(self, seen: set[str]) -> str:
-        """Generate a new word that does not duplicate prior words."""
+    def _generate_unique_word(
+        self, seen: set[str], max_chars: int | None = None
+    ) -> str:
+        """Generate a new word that does not duplicate prior words.
+
+        Parameters
+        ----------
+        seen : set[str]
+            Letter-only forms of the words already used.
+        max_chars : int | None, default None
+            Number of characters of the word that will survive truncation.
+            When given, syllables are only drawn until that many characters
+            are covered; the remaining syllables would be cut off anyway.
 
+        Returns
+        -------
+        str
+            New word made of uppercase letters only.
+        """
         while True:
-            count = secrets.choice((1, 2, 3, 4))
-            candidate = self._generate_word(count)
-            if self._letters_only(candidate) not in seen:
+            count = self._random.choice(_SYLLABLE_COUNTS)
+            if max_chars is not None:
+                # Syllables are at least two characters long
+                count = min(count, -(-max_chars // 2))
+            syllables = self._random.choices(self._all_syllables, count)
+
+            if max_chars is not None:
+                covered = 0
+                for used, syllable in enumerate(syllables, start=1):
+                    covered += len(syllable)
+                    if covered >= max_chars:
+                        del syllables[used:]
+                        break
+
+            # Generated words hold letters only, no need to strip them
+            candidate = "".join(syllables)
+            if candidate not in seen:
                 return candidate
+            if self._stats is not None:
+                self._stats.add("unique_word.retries")
 
     def _extend_words_to_length(
         self, words: list[str], target_length: int, separator: str
     ) -> list[str]:
-        """Extend word list with new unique words until assembled length fits."""
+        """Extend word list with new unique words until assembled length fits.
 
-        seen_letters = {self._letters_only(w) for w in words}
+        The assembled length is tracked incrementally, and the final word only
+        receives the syllables needed to reach ``target_length``. Each syllable
+        is drawn independently, so the kept prefix is distributed exactly as
+        if the whole word had been generated and then truncated.
+        """
 
-        while len(separator.join(words)) < target_length:
-            new_word = self._generate_unique_word(seen_letters)
+        seen_letters = {self._letters_only(w) for w in words}
+        total = sum(len(word) for word in words) + len(separator) * (len(words) - 1)
+
+        while total < target_length:
+            remaining = target_length - total - len(separator)
+            if remaining <= 0:
+                # Only the separator survives truncation: no syllables needed
+                words.append("")
+                break
+
+            new_word = self._generate_unique_word(seen_letters, remaining)
+            if self._stats is not None:
+                self._stats.add("extension_words")
             words.append(new_word)
-            seen_letters.add(self._letters_only(new_word))
+            seen_letters.add(new_word)
+            total += len(separator) + len(new_word)
 
         return words
 
     def _join_words(self, words: list[str], separator: str | None = None) -> str:
         """Join words with a consistent separator."""
 
-        return (separator or secrets.choice(self._separators)).join(words)
+        if separator is None:
+            separator = self._random.choice(self._separators)
+        return separator.join(words)
 
     def _normal_words(self) -> list[str]:
         """Generate normal password words: letters and separators only."""
@@ -280,7 +651,7 @@ class SyllableGenerator(BaseGenerator):
         """Generate strong password words: letters, digits, and separators."""
 
         words = self._build_word_list()
-        digit_block = "".join(secrets.choice(self._digits) for _ in range(2))
+        digit_block = "".join(self._random.choices(self._digits, 2))
 
         # Prefix digits to the first word so they survive truncation
         words[0] = digit_block + words[0]
@@ -291,8 +662,8 @@ class SyllableGenerator(BaseGenerator):
         """Generate super strong password words: letters, digits, specials, separators."""
 
         words = self._build_word_list()
-        digit_block = "".join(secrets.choice(self._digits) for _ in range(2))
-        special_char = secrets.choice(self._specials)
+        digit_block = "".join(self._random.choices(self._digits, 2))
+        special_char = self._random.choice(self._specials)
 
         # Place digits and special characters at the start of early words to
         # avoid losing them when trimming to the requested length.
@@ -302,32 +673,47 @@ class SyllableGenerator(BaseGenerator):
         return words
 
     # Backward compatibility methods (called by Clinkey adapter)
-    def normal(self) -> str:
+    def normal(self, separator: str | None = None) -> str:
         """Generate normal password (backward compatibility).
 
+        Parameters
+        ----------
+        separator : str | None, default None
+            Separator joining the words. Defaults to a random default separator.
+
         Returns
         -------
         str
             Normal password.
         """
-        return self._join_words(self._normal_words())
+        return self._join_words(self._normal_words(), separator)
 
-    def strong(self) -> str:
+    def strong(self, separator: str | None = None) -> str:
         """Generate strong password (backward compatibility).
 
+        Parameters
+        ----------
+        separator : str | None, default None
+            Separator joining the words. Defaults to a random default separator.
+
         Returns
         -------
         str
             Strong password.
         """
-        return self._join_words(self._strong_words())
+        return self._join_words(self._strong_words(), separator)
 
-    def super_strong(self) -> str:
+    def super_strong(self, separator: str | None = None) -> str:
         """Generate super strong password (backward compatibility).
 
+        Parameters
+        ----------
+        separator : str | None, default None
+            Separator joining the words. Defaults to a random default separator.
+
         Returns
         -------
         str
             Super strong password.
         """
-        return self._join_words(self._super_strong_words())
+        return self._join_words(self._super_strong_words(), separator)
@@ -0,0 +1,226 @@
+"""Memory-bounded deduplication for large password batches.
+
+Tracks keyed BLAKE2b digests of every password seen in a stream. Digests
+stay in an in-memory set until a configurable memory budget is reached,
+then move to a temporary on-disk SQLite index, so batches of any size can
+be guaranteed duplicate-free without unbounded memory growth.
+"""
+
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import sqlite3
+
+# Default memory budget for the in-memory digest set, in mebibytes
+DEFAULT_MEMORY_LIMIT_MB = 256
+
+# Size of the keyed digest stored per password (128 bits)
+DIGEST_SIZE = 16
+
+# Approximate memory used by one digest held in a Python set
+_BYTES_PER_ENTRY = 128
+
+# Number of inserts between commits once digests live on disk
+_COMMIT_INTERVAL = 10_000
+
+# Consecutive duplicates tolerated before the keyspace is declared exhausted
+DEFAULT_MAX_CONSECUTIVE_REJECTIONS = 10_000
+
+
+class UniqueFilter:
+    """Reject passwords that were already seen in the same stream.
+
+    Passwords are never stored: only 128-bit BLAKE2b digests keyed with a
+    random per-filter secret, so the spill file cannot be matched against
+    candidate passwords once the key is gone.
+
+    Parameters
+    ----------
+    memory_limit_mb : int, default 256
+        Memory budget for the in-memory digest set. When it is exceeded,
+        digests are moved to an on-disk index.
+    directory : str | pathlib.Path | None, default None
+        Directory for the on-disk index. Defaults to the system temp dir.
+
+    Attributes
+    ----------
+    accepted : int
+        Number of unique passwords let through.
+    rejected : int
+        Number of duplicate passwords rejected.
+
+    Examples
+    --------
+    >>> with UniqueFilter() as seen:
+    ...     list(seen.filter(["a", "b", "a"]))
+    ['a', 'b']
+    """
+
+    def __init__(
+        self,
+        memory_limit_mb: int = DEFAULT_MEMORY_LIMIT_MB,
+        directory: str | Path | None = None,
+    ) -> None:
+        """Initialize an empty filter.
+
+        Parameters
+        ----------
+        memory_limit_mb : int, default 256
+            Memory budget for the in-memory digest set.
+        directory : str | pathlib.Path | None, default None
+            Directory for the on-disk index.
+
+        Raises
+        ------
+        ValueError
+            If memory_limit_mb is not strictly positive.
+        """
+        if memory_limit_mb <= 0:
+            raise ValueError(f"memory_limit_mb must be positive, got {memory_limit_mb}")
+
+        self.max_memory_entries = max(
+            1, memory_limit_mb * 1024 * 1024 // _BYTES_PER_ENTRY
+        )
+        self.directory = directory
+        self.accepted = 0
+        self.rejected = 0
+
+        # Deferred so that importing this module (e.g. for the CLI option
+        # defaults) stays cheap when --unique is not used.
+        from hashlib import blake2b
+
+        self._blake2b = partial(blake2b, digest_size=DIGEST_SIZE, key=os.urandom(32))
+        self._seen: set[bytes] = set()
+        self._tempdir: tempfile.TemporaryDirectory | None = None
+        self._db: "sqlite3.Connection | None" = None
+        self._pending_commits = 0
+
+    @property
+    def spilled(self) -> bool:
+        """Whether digests have moved to the on-disk index."""
+        return self._db is not None
+
+    def _digest(self, password: str) -> bytes:
+        """Return the keyed digest identifying ``password``."""
+
+        return self._blake2b(password.encode("utf-8")).digest()
+
+    def _spill(self) -> None:
+        """Move the in-memory digests to a fresh on-disk index."""
+
+        import sqlite3
+
+        self._tempdir = tempfile.TemporaryDirectory(
+            prefix="clinkey-unique-", dir=self.directory
+        )
+        path = Path(self._tempdir.name) / "seen.db"
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode = OFF")
+        self._db.execute("PRAGMA synchronous = OFF")
+        self._db.execute("CREATE TABLE seen (digest BLOB PRIMARY KEY) WITHOUT ROWID")
+        self._db.executemany(
+            "INSERT INTO seen (digest) VALUES (?)",
+            ((digest,) for digest in self._seen),
+        )
+        self._db.commit()
+        self._seen.clear()
+
+    def add(self, password: str) -> bool:
+        """Record ``password`` and report whether it is new.
+
+        Parameters
+        ----------
+        password : str
+            Password to record.
+
+        Returns
+        -------
+        bool
+            True if the password had not been seen before.
+        """
+        digest = self._digest(password)
+
+        if self._db is None:
+            if digest in self._seen:
+                self.rejected += 1
+                return False
+            self._seen.add(digest)
+            if len(self._seen) > self.max_memory_entries:
+                self._spill()
+            self.accepted += 1
+            return True
+
+        cursor = self._db.execute(
+            "INSERT OR IGNORE INTO seen (digest) VALUES (?)", (digest,)
+        )
+        self._pending_commits += 1
+        if self._pending_commits >= _COMMIT_INTERVAL:
+            self._db.commit()
+            self._pending_commits = 0
+
+        if cursor.rowcount == 0:
+            self.rejected += 1
+            return False
+        self.accepted += 1
+        return True
+
+    def filter(
+        self,
+        passwords: Iterable[str],
+        max_consecutive_rejections: int = DEFAULT_MAX_CONSECUTIVE_REJECTIONS,
+    ) -> Iterator[str]:
+        """Yield only the passwords not seen before.
+
+        Parameters
+        ----------
+        passwords : Iterable[str]
+            Source stream, typically unbounded.
+        max_consecutive_rejections : int, default 10000
+            Give up once this many duplicates arrive in a row, which means
+            the generator's keyspace is (nearly) exhausted.
+
+        Yields
+        ------
+        str
+            Unique passwords, in source order.
+
+        Raises
+        ------
+        ValueError
+            If too many consecutive duplicates are produced.
+        """
+        streak = 0
+        for password in passwords:
+            if self.add(password):
+                streak = 0
+                yield password
+                continue
+
+            streak += 1
+            if streak >= max_consecutive_rejections:
+                raise ValueError(
+                    f"keyspace exhausted: {streak} consecutive duplicates after "
+                    f"{self.accepted} unique passwords"
+                )
+
+    def close(self) -> None:
+        """Release the in-memory set and delete the on-disk index."""
+
+        self._seen.clear()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        if self._tempdir is not None:
+            self._tempdir.cleanup()
+            self._tempdir = None
+
+    def __enter__(self) -> "UniqueFilter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
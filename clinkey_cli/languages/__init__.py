@@ -0,0 +1,225 @@
+"""Syllable language packs for pronounceable passwords.
+
+Each pack is a JSON data file in this package, for example::
+
+    {
+      "consonants": "bcdfgjlmnprstvz",
+      "vowels": "aeiou",
+      "onsets": ["bl", "br", "ch"],
+      "codas": ["l", "nt"],
+      "clusters": ["eau", "oui"]
+    }
+
+On first use, a pack is compiled into a :class:`SyllablePack` of frozen
+tuples. Its simple syllables are every consonant followed by a vowel. Its
+complex syllables are every onset followed by a vowel, every vowel followed
+by a coda, and the listed clusters. Packs are ASCII-only, so passwords can
+be typed on any keyboard.
+
+Compiled packs are cached per process and on disk under
+``~/.clinkey/cache/languages``. A disk cache records the size,
+modification time and change time of its data file, and is rebuilt as
+soon as any of them differs. English is built into
+:class:`~clinkey_cli.generators.syllable.SyllableGenerator` and needs no
+pack.
+"""
+
+import marshal
+import string
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, NamedTuple
+
+# Directory holding the bundled ``<language>.json`` packs
+PACKS_DIR = Path(__file__).parent
+
+# Directory of compiled packs
+CACHE_DIR = Path.home() / ".clinkey" / "cache" / "languages"
+
+# Bumped whenever the compiled layout changes, invalidating older caches
+CACHE_FORMAT_VERSION = 2
+
+# Keys of a pack data file, and whether each lists several strings
+_PACK_KEYS = {
+    "consonants": False,
+    "vowels": False,
+    "onsets": True,
+    "codas": True,
+    "clusters": True,
+}
+
+
+class SyllablePack(NamedTuple):
+    """Compiled syllable tables of one language.
+
+    Attributes
+    ----------
+    language : str
+        Pack name.
+    consonants : tuple[str, ...]
+        Lowercase consonants.
+    vowels : tuple[str, ...]
+        Lowercase vowels.
+    simple_syllables : tuple[str, ...]
+        Lowercase consonant-vowel pairs.
+    complex_syllables : tuple[str, ...]
+        Uppercase onset, coda and cluster syllables, without duplicates.
+    all_syllables : tuple[str, ...]
+        Uppercased union of simple and complex syllables, sampled by words.
+    """
+
+    language: str
+    consonants: tuple[str, ...]
+    vowels: tuple[str, ...]
+    simple_syllables: tuple[str, ...]
+    complex_syllables: tuple[str, ...]
+    all_syllables: tuple[str, ...]
+
+
+def available_languages() -> tuple[str, ...]:
+    """Return the names of the bundled language packs.
+
+    Returns
+    -------
+    tuple[str, ...]
+        Sorted pack names, excluding the built-in English tables.
+
+    Examples
+    --------
+    >>> "french" in available_languages()
+    True
+    """
+    return tuple(sorted(path.stem for path in PACKS_DIR.glob("*.json")))
+
+
+def compile_pack(language: str, data: dict[str, Any]) -> SyllablePack:
+    """Compile the decoded data file of a pack into frozen tables.
+
+    Parameters
+    ----------
+    language : str
+        Pack name, used in error messages.
+    data : dict[str, Any]
+        Decoded JSON data file.
+
+    Returns
+    -------
+    SyllablePack
+        Compiled tables.
+
+    Raises
+    ------
+    ValueError
+        If a key is missing or unknown, a value holds anything but ASCII
+        lowercase letters, or a cluster is shorter than two letters.
+
+    Examples
+    --------
+    >>> pack = compile_pack("demo", {"consonants": "bd", "vowels": "a",
+    ...                              "onsets": ["br"], "codas": [],
+    ...                              "clusters": ["oi"]})
+    >>> pack.simple_syllables, pack.complex_syllables
+    (('ba', 'da'), ('BRA', 'OI'))
+    """
+    if set(data) != set(_PACK_KEYS):
+        raise ValueError(
+            f"Invalid language pack '{language}': expected keys "
+            f"{', '.join(_PACK_KEYS)}"
+        )
+    for key, is_list in _PACK_KEYS.items():
+        values = data[key] if is_list else [data[key]]
+        if not isinstance(values, list) or not all(
+            isinstance(value, str)
+            and value
+            and set(value) <= set(string.ascii_lowercase)
+            for value in values
+        ):
+            raise ValueError(
+                f"Invalid language pack '{language}': '{key}' must hold "
+                "ASCII lowercase letters only"
+            )
+    if any(len(cluster) < 2 for cluster in data["clusters"]):
+        raise ValueError(
+            f"Invalid language pack '{language}': clusters need two letters or more"
+        )
+
+    consonants = tuple(dict.fromkeys(data["consonants"]))
+    vowels = tuple(dict.fromkeys(data["vowels"]))
+    simple = tuple(c + v for c in consonants for v in vowels)
+    complex_ = tuple(
+        dict.fromkeys(
+            syllable.upper()
+            for syllable in (
+                *(onset + v for onset in data["onsets"] for v in vowels),
+                *(v + coda for v in vowels for coda in data["codas"]),
+                *data["clusters"],
+            )
+        )
+    )
+    if not complex_:
+        raise ValueError(f"Invalid language pack '{language}': no complex syllables")
+
+    all_syllables = tuple(syllable.upper() for syllable in simple) + complex_
+    return SyllablePack(language, consonants, vowels, simple, complex_, all_syllables)
+
+
+def _cache_path(language: str) -> Path:
+    """Location of the compiled cache of ``language``."""
+
+    return CACHE_DIR / f"{language}.v{CACHE_FORMAT_VERSION}.marshal"
+
+
+@lru_cache(maxsize=None)
+def load_language(language: str) -> SyllablePack:
+    """Return the compiled tables of a bundled pack, compiling it once.
+
+    Per process, the pack is compiled or read from disk only on the first
+    call. Across processes, the compiled tables are reused from the disk
+    cache until the data file changes. Failing to write the cache is not
+    an error.
+
+    Parameters
+    ----------
+    language : str
+        Pack name, as listed by :func:`available_languages`.
+
+    Returns
+    -------
+    SyllablePack
+        Compiled tables, shared by every caller.
+
+    Raises
+    ------
+    ValueError
+        If no such pack exists or its data file is invalid.
+
+    Examples
+    --------
+    >>> load_language("italian").vowels
+    ('a', 'e', 'i', 'o', 'u')
+    """
+    if language not in available_languages():
+        valid = ", ".join(("english", *available_languages()))
+        raise ValueError(f"Unknown language: '{language}'. Valid languages: {valid}")
+
+    # Deferred: only needed once a pack is actually used
+    from clinkey_cli.wordlists.custom import _source_stamp, _write_atomic
+
+    source = PACKS_DIR / f"{language}.json"
+    cache = _cache_path(language)
+    stamp = _source_stamp(source)
+    try:
+        cached_stamp, tables = marshal.loads(cache.read_bytes())
+        if tuple(cached_stamp) == stamp:
+            return SyllablePack(*tables)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass  # Missing or unreadable cache, or stale layout: recompile below
+
+    import json
+
+    pack = compile_pack(language, json.loads(source.read_text(encoding="utf-8")))
+    try:
+        _write_atomic(cache, marshal.dumps((stamp, tuple(pack))))
+    except OSError:
+        pass  # The disk cache only saves start-up time
+    return pack
@@ -10,14 +10,24 @@ generator architecture. The actual generation logic is in generators/syllable.py
 
 import secrets
 import string
-from typing import Callable
-
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterator
+
+from clinkey_cli.generators.aio import ASYNC_CHUNK_SIZE, aiter_chunks
+from clinkey_cli.generators.spec import (
+    SPEC_CACHE_SIZE,
+    GenerationSpec,
+    compile_translation,
+)
 from clinkey_cli.generators.syllable import (
     MAX_PASSWORD_LENGTH,
     MIN_PASSWORD_LENGTH,
     SyllableGenerator,
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 # Re-export constants for backward compatibility
 __all__ = [
     "Clinkey",
@@ -42,6 +52,9 @@ class Clinkey:
     architecture introduced in Clinkey 2.0. It delegates to SyllableGenerator
     while maintaining the exact same API as Clinkey 1.x.
 
+    Generation never mutates the instance: per-call options are passed down
+    explicitly, so a single instance can be shared by many threads.
+
     Attributes
     ----------
     _generator : SyllableGenerator
@@ -58,12 +71,14 @@ class Clinkey:
         Consonant/vowel pairs (for backward compatibility).
     _complex_syllables : list[str]
         Predefined consonant clusters (for backward compatibility).
-    _separators : list[str]
+    _separators : tuple[str, ...]
         Default separators (for backward compatibility).
     _generators : dict[str, Callable[[], str]]
         Mapping of password type to generator method (for backward compatibility).
     new_separator : str | None
-        Custom separator overriding defaults (for backward compatibility).
+        Custom separator stripped from password edges and removed by
+        ``no_separator`` when no per-call separator is given (for backward
+        compatibility). Read-only during generation.
 
     Methods
     -------
@@ -73,10 +88,14 @@ class Clinkey:
         Generate a password made of words, digits, and separators.
     super_strong()
         Generate a password with all character types.
+    compile(...)
+        Validate options once into a reusable generation spec.
     generate_password(...)
         Generate a single password with specified parameters.
     generate_batch(...)
         Generate multiple passwords.
+    iter_passwords(...)
+        Lazily yield any number of passwords.
     """
 
     def __init__(self) -> None:
@@ -87,6 +106,9 @@ class Clinkey:
         # Store custom separator (backward compatibility)
         self.new_separator = None
 
+        # Compiled specs, per instance since they call this instance's methods
+        self._compile_cached = lru_cache(maxsize=SPEC_CACHE_SIZE)(self._compile_spec)
+
         # Expose internal attributes for backward compatibility
         self._consonants = self._generator._consonants
         self._vowels = self._generator._vowels
@@ -101,9 +123,14 @@ class Clinkey:
             "super_strong": self.super_strong,
         }
 
-    def normal(self) -> str:
+    def normal(self, separator: str | None = None) -> str:
         """Generate a pronounceable password made of words and separators.
 
+        Parameters
+        ----------
+        separator : str | None, default None
+            Separator joining the words. Defaults to a random default separator.
+
         Returns
         -------
         str
@@ -116,11 +143,16 @@ class Clinkey:
         >>> len(password) > 0
         True
         """
-        return self._generator.normal()
+        return self._generator.normal(separator)
 
-    def strong(self) -> str:
+    def strong(self, separator: str | None = None) -> str:
         """Generate a password made of words, digits, and separators.
 
+        Parameters
+        ----------
+        separator : str | None, default None
+            Separator joining the words. Defaults to a random default separator.
+
         Returns
         -------
         str
@@ -133,11 +165,16 @@ class Clinkey:
         >>> any(c.isdigit() for c in password)
         True
         """
-        return self._generator.strong()
+        return self._generator.strong(separator)
 
-    def super_strong(self) -> str:
+    def super_strong(self, separator: str | None = None) -> str:
         """Generate a password with all character types.
 
+        Parameters
+        ----------
+        separator : str | None, default None
+            Separator joining the words. Defaults to a random default separator.
+
         Returns
         -------
         str
@@ -150,7 +187,7 @@ class Clinkey:
         >>> any(c.isalpha() for c in password)
         True
         """
-        return self._generator.super_strong()
+        return self._generator.super_strong(separator)
 
     def _fit_to_length(
         self, generator: Callable[[], str], target_length: int
@@ -169,17 +206,143 @@ class Clinkey:
         str
             Generated password whose length exactly matches ``target_length``.
         """
-        # Initializing an accumulator string, not a hardcoded credential.
-        password = ""  # nosec B105
-        while len(password) < target_length:
+        chunks: list[str] = []
+        total = 0
+        while total < target_length:
             chunk = generator()
-            if len(password) + len(chunk) <= target_length:
-                password += chunk
-            else:
-                remaining = target_length - len(password)
-                password += chunk[:remaining]
-                break
-        return password
+            chunks.append(chunk)
+            total += len(chunk)
+        return "".join(chunks)[:target_length]
+
+    def _validate_options(
+        self, length: int, type: str, new_separator: str | None
+    ) -> str:
+        """Validate generation options and return the normalized type key.
+
+        Parameters
+        ----------
+        length : int
+            Requested password length.
+        type : str
+            Requested password preset.
+        new_separator : str | None
+            Requested custom separator.
+
+        Returns
+        -------
+        str
+            Normalized key into ``self._generators``.
+
+        Raises
+        ------
+        ValueError
+            If length, separator or type is invalid.
+        """
+        if length < MIN_PASSWORD_LENGTH:
+            raise ValueError(f"length must be at least {MIN_PASSWORD_LENGTH}")
+        if length > MAX_PASSWORD_LENGTH:
+            raise ValueError(f"length cannot exceed {MAX_PASSWORD_LENGTH}")
+
+        # Validate separator if provided
+        separator_to_use = (
+            new_separator if new_separator is not None else self.new_separator
+        )
+        if separator_to_use:
+            if len(separator_to_use) != 1:
+                raise ValueError("separator must be exactly one character")
+            if separator_to_use not in SAFE_SEPARATOR_CHARS:
+                raise ValueError(
+                    "separator must be a safe printable character (no whitespace)"
+                )
+
+        # Validate type
+        key = type.strip().lower()
+        if key not in self._generators:
+            valid = ", ".join(sorted(self._generators.keys()))
+            raise ValueError(
+                f"Unsupported type '{type}'. Choose among: {valid}."
+            )
+
+        return key
+
+    def compile(
+        self,
+        length: int = 16,
+        type: str = "normal",
+        lower: bool = False,
+        no_separator: bool = False,
+        new_separator: str | None = None,
+    ) -> GenerationSpec:
+        """Validate options once and compile them into a generation spec.
+
+        Specs are cached per instance, keyed by the options and the current
+        ``new_separator``, so repeated calls with the same configuration
+        skip validation entirely.
+
+        Parameters
+        ----------
+        length : int, default 16
+            Length of each password.
+        type : str, default "normal"
+            Password preset to use.
+        lower : bool, default False
+            Convert passwords to lowercase if True.
+        no_separator : bool, default False
+            Remove separator characters if True.
+        new_separator : str | None, default None
+            Custom separator character to use.
+
+        Returns
+        -------
+        GenerationSpec
+            Spec whose ``execute(n)`` generates ``n`` passwords.
+
+        Raises
+        ------
+        ValueError
+            If length, separator or type is invalid.
+
+        Examples
+        --------
+        >>> clinkey = Clinkey()
+        >>> spec = clinkey.compile(length=20, type="strong")
+        >>> len(spec.execute(3))
+        3
+        """
+        return self._compile_cached(
+            length, type, lower, no_separator, new_separator, self.new_separator
+        )
+
+    def _compile_spec(
+        self,
+        length: int,
+        type: str,
+        lower: bool,
+        no_separator: bool,
+        new_separator: str | None,
+        default_separator: str | None,
+    ) -> GenerationSpec:
+        """Build the spec behind :meth:`compile` (cached by ``__init__``)."""
+
+        key = self._validate_options(length, type, new_separator)
+
+        # The separator travels with the spec only: nothing on ``self`` or on
+        # the shared generator is modified, so concurrent calls never interfere.
+        chunk = partial(self._generators[key], new_separator)
+
+        effective_separator = (
+            new_separator if new_separator is not None else default_separator
+        )
+        custom = (
+            effective_separator
+            if effective_separator and effective_separator not in "-_"
+            else ""
+        )
+        return GenerationSpec(
+            produce=partial(self._fit_to_length, chunk, length),
+            table=compile_translation(lower, no_separator, removed=custom),
+            strip="-_" + custom,
+        )
 
     def generate_password(
         self,
@@ -227,63 +390,7 @@ class Clinkey:
         >>> len(password)
         20
         """
-        if length < MIN_PASSWORD_LENGTH:
-            raise ValueError(f"length must be at least {MIN_PASSWORD_LENGTH}")
-        if length > MAX_PASSWORD_LENGTH:
-            raise ValueError(f"length cannot exceed {MAX_PASSWORD_LENGTH}")
-
-        # Validate separator if provided
-        separator_to_use = (
-            new_separator if new_separator is not None else self.new_separator
-        )
-        if separator_to_use:
-            if len(separator_to_use) != 1:
-                raise ValueError("separator must be exactly one character")
-            if separator_to_use not in SAFE_SEPARATOR_CHARS:
-                raise ValueError(
-                    "separator must be a safe printable character (no whitespace)"
-                )
-
-        # Validate type
-        key = type.strip().lower()
-        if key not in self._generators:
-            valid = ", ".join(sorted(self._generators.keys()))
-            raise ValueError(
-                f"Unsupported type '{type}'. Choose among: {valid}."
-            )
-
-        # Temporarily override separator for this generation if provided
-        previous_separator = self.new_separator
-        previous_gen_separators = self._generator._separators.copy()
-        if new_separator is not None:
-            self.new_separator = new_separator
-            self._generator._separators = [new_separator]
-
-        try:
-            raw_password = self._fit_to_length(self._generators[key], length)
-        finally:
-            # Restore previous separator to avoid leaking state between calls
-            self.new_separator = previous_separator
-            self._generator._separators = previous_gen_separators
-
-        separators_to_strip = "-_"
-        effective_separator = (
-            new_separator if new_separator is not None else previous_separator
-        )
-        if effective_separator and effective_separator not in "-_":
-            separators_to_strip += effective_separator
-
-        cleaned = raw_password.strip(separators_to_strip)
-
-        if no_separator:
-            cleaned = cleaned.replace("-", "").replace("_", "")
-            if effective_separator and effective_separator not in "-_":
-                cleaned = cleaned.replace(effective_separator, "")
-
-        if lower:
-            cleaned = cleaned.lower()
-
-        return cleaned
+        return self.compile(length, type, lower, no_separator, new_separator)()
 
     def generate_batch(
         self,
@@ -337,17 +444,127 @@ class Clinkey:
         if count > MAX_BATCH_SIZE:
             raise ValueError(f"count cannot exceed {MAX_BATCH_SIZE}")
 
-        # Generate batch
-        return [
-            self.generate_password(
-                length=length,
-                type=type,
-                lower=lower,
-                no_separator=no_separator,
-                new_separator=new_separator,
-            )
-            for _ in range(count)
-        ]
+        # Validated once for the whole batch
+        spec = self.compile(length, type, lower, no_separator, new_separator)
+        return spec.execute(count)
+
+    def iter_passwords(
+        self,
+        length: int = 16,
+        type: str = "normal",
+        count: int | None = None,
+        lower: bool = False,
+        no_separator: bool = False,
+        new_separator: str | None = None,
+    ) -> Iterator[str]:
+        """Lazily yield passwords with the same configuration.
+
+        Unlike :meth:`generate_batch`, the number of passwords is not capped
+        by ``MAX_BATCH_SIZE``: passwords are produced on demand, so memory
+        stays flat however many are consumed.
+
+        Parameters
+        ----------
+        length : int, default 16
+            Length of each password.
+        type : str, default "normal"
+            Password preset to use.
+        count : int | None, default None
+            Number of passwords to yield. ``None`` yields indefinitely.
+        lower : bool, default False
+            Convert passwords to lowercase if True.
+        no_separator : bool, default False
+            Remove separator characters if True.
+        new_separator : str | None, default None
+            Custom separator character to use.
+
+        Returns
+        -------
+        Iterator[str]
+            Lazy iterator over generated passwords.
+
+        Raises
+        ------
+        ValueError
+            If count is negative or any generation option is invalid.
+
+        Examples
+        --------
+        >>> clinkey = Clinkey()
+        >>> stream = clinkey.iter_passwords(length=20, count=1000000)
+        >>> len(next(stream))
+        20
+        """
+        if count is not None and count < 0:
+            raise ValueError("count must be a non-negative integer")
+        spec = self.compile(length, type, lower, no_separator, new_separator)
+        return spec.stream(count)
+
+    def agenerate_batch(
+        self,
+        length: int = 16,
+        type: str = "normal",
+        count: int | None = None,
+        lower: bool = False,
+        no_separator: bool = False,
+        new_separator: str | None = None,
+        executor: "Executor | None" = None,
+        chunk_size: int = ASYNC_CHUNK_SIZE,
+    ) -> AsyncIterator[str]:
+        """Stream passwords to async code without blocking the event loop.
+
+        Generation runs in ``executor`` in chunks of ``chunk_size`` and is
+        consumed with ``async for``. Like :meth:`iter_passwords`, the number
+        of passwords is not capped by ``MAX_BATCH_SIZE``.
+
+        Parameters
+        ----------
+        length : int, default 16
+            Length of each password.
+        type : str, default "normal"
+            Password preset to use.
+        count : int | None, default None
+            Number of passwords to yield. ``None`` yields indefinitely.
+        lower : bool, default False
+            Convert passwords to lowercase if True.
+        no_separator : bool, default False
+            Remove separator characters if True.
+        new_separator : str | None, default None
+            Custom separator character to use.
+        executor : concurrent.futures.Executor | None, default None
+            Thread-based executor running the generation. ``None`` uses the
+            event loop's default thread pool.
+        chunk_size : int, default 256
+            Passwords generated per executor job.
+
+        Returns
+        -------
+        AsyncIterator[str]
+            Async iterator over generated passwords. Cancelling the consumer
+            or closing the iterator stops generation.
+
+        Raises
+        ------
+        ValueError
+            If count is negative, chunk_size is not strictly positive, or
+            any generation option is invalid.
+
+        Examples
+        --------
+        >>> async def reset_tokens():
+        ...     return [p async for p in clinkey.agenerate_batch(count=3)]
+        >>> len(asyncio.run(reset_tokens()))
+        3
+        """
+        passwords = self.iter_passwords(
+            length=length,
+            type=type,
+            count=count,
+            lower=lower,
+            no_separator=no_separator,
+            new_separator=new_separator,
+        )
+        return aiter_chunks(passwords, executor, chunk_size)
 
 
 clinkey = Clinkey()
@@ -0,0 +1,62 @@
+"""Load the read-only datasets once, before forking worker processes.
+
+The EFF wordlist and the common passwords list are packed files mapped
+read-only, so every process reading them shares the same page cache
+pages. What remains per process is built on the heap: the decoded view of
+each packed list, the recased wordlist variants, the syllable tables and
+the compiled language packs. :func:`preload` builds all of them in the
+parent, so that workers forked afterwards (``ProcessPoolExecutor`` with
+the ``fork`` start method, ``gunicorn --preload``) inherit them
+copy-on-write instead of each building a private copy.
+"""
+
+import gc
+from collections.abc import Iterable, Sequence
+
+
+def preload(languages: Iterable[str] = (), freeze: bool = False) -> None:
+    """Build the shared datasets in the current process.
+
+    Safe to call repeatedly: every dataset is built once per process.
+
+    Parameters
+    ----------
+    languages : Iterable[str], default ()
+        Syllable language packs to compile as well. English is built in
+        and needs no pack.
+    freeze : bool, default False
+        Move every object tracked by the garbage collector to its
+        permanent generation (:func:`gc.freeze`), so that collections in
+        the workers never write to the inherited pages. Only meant for a
+        parent about to fork, such as a gunicorn ``on_starting`` hook.
+
+    Raises
+    ------
+    ValueError
+        If a language has no bundled pack.
+
+    Examples
+    --------
+    >>> preload(languages=["french"])
+    """
+    # Deferred: importing these modules is what builds the tables
+    from clinkey_cli.generators import syllable  # noqa: F401
+    from clinkey_cli.generators.passphrase import WORDLISTS, _cased_wordlist
+    from clinkey_cli.languages import load_language
+    from clinkey_cli.security.dictionary import _COMMON_PASSWORDS
+    from clinkey_cli.wordlists.packed import PackedWordlist
+
+    datasets: list[Sequence[str]] = [_COMMON_PASSWORDS]
+    for load in WORDLISTS.values():
+        words = load()
+        datasets += [words, _cased_wordlist(words, True), _cased_wordlist(words, False)]
+    for dataset in datasets:
+        if isinstance(dataset, PackedWordlist):
+            dataset.materialize()
+
+    for language in languages:
+        if language != "english":
+            load_language(language)
+
+    if freeze:
+        gc.freeze()
@@ -3,8 +3,35 @@
 Provides comprehensive password analysis including entropy calculation,
 pattern detection, dictionary checking, breach detection, and compliance
 validation.
+
+Exports are resolved lazily on first access (PEP 562), so importing a light
+submodule such as :mod:`clinkey_cli.security.compliance` does not load the
+analyzer and its HTTP client.
 """
 
-from clinkey_cli.security.analyzer import SecurityAnalyzer, analyze_password
+from importlib import import_module
+from typing import Any
+
+# Public name -> module defining it
+_EXPORTS = {
+    "SecurityAnalyzer": "clinkey_cli.security.analyzer",
+    "analyze_password": "clinkey_cli.security.analyzer",
+}
 
 __all__ = ["SecurityAnalyzer", "analyze_password"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module defining ``name`` on first access."""
+
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
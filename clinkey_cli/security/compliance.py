@@ -12,9 +12,39 @@ Note: Modern OWASP (2024) guidelines emphasize password length and entropy over
 character composition rules. The 3-of-4 complexity requirement implemented here
 follows OWASP ASVS 4.0 (2019) for compatibility with existing security frameworks.
 For new implementations, consider focusing primarily on length requirements.
+
+Policies can also be compiled with :func:`compile_policy` and handed to the
+generators, which then place the required character classes while
+generating, so every password complies on the first attempt.
 """
 
-from typing import Any
+import string
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from clinkey_cli.generators.random_source import RandomSource
+
+# Character classes, in the order they are reported
+CHARACTER_CLASSES = ("lower", "upper", "digit", "special")
+
+# Alphabet drawn from when a class has to be placed in a password
+_CLASS_ALPHABETS = {
+    "lower": string.ascii_lowercase,
+    "upper": string.ascii_uppercase,
+    "digit": string.digits,
+    "special": "!@#$%^&*-_=+?",
+}
+
+# Built-in policies, as accepted by compile_policy
+POLICIES: dict[str, dict[str, Any]] = {
+    "nist": {"min_length": 8},
+    "owasp": {"min_length": 10, "min_classes": 3},
+}
+
+# Keys a policy specification may use
+_POLICY_KEYS = {"name", "min_length", "min_classes", "require", "specials"}
 
 
 def check_nist_compliance(password: str) -> dict[str, Any]:
@@ -173,3 +203,268 @@ def validate_compliance(password: str) -> dict[str, Any]:
         "standards_met": standards_met,
         "total_standards": 2,
     }
+
+
+def _character_class(char: str) -> str:
+    """Classify a character the same way the compliance checks do."""
+
+    if char.islower():
+        return "lower"
+    if char.isupper():
+        return "upper"
+    if char.isdigit():
+        return "digit"
+    if not char.isalnum():
+        return "special"
+    return "other"
+
+
+def _random_order(random: "RandomSource", size: int) -> Iterator[int]:
+    """Yield ``range(size)`` in random order, shuffling only what is consumed."""
+
+    order = list(range(size))
+    for i in range(size):
+        j = i + random.randbelow(size - i)
+        order[i], order[j] = order[j], order[i]
+        yield order[i]
+
+
+class CompliancePolicy(NamedTuple):
+    """Compiled, immutable password policy.
+
+    Build instances with :func:`compile_policy`. Generators accept one as
+    their ``policy`` argument and call :meth:`apply` on every password.
+
+    Attributes
+    ----------
+    name : str
+        Policy name, for error messages.
+    min_length : int
+        Minimum password length.
+    min_classes : int
+        Minimum number of distinct character classes (OWASP's 3 of 4).
+    require : tuple[tuple[str, int], ...]
+        Minimum count of each character class, e.g. ``(("digit", 2),)``.
+    alphabets : tuple[tuple[str, str], ...]
+        Characters placed for each class.
+    """
+
+    name: str
+    min_length: int
+    min_classes: int
+    require: tuple[tuple[str, int], ...]
+    alphabets: tuple[tuple[str, str], ...]
+
+    def check(self, password: str) -> bool:
+        """Whether ``password`` satisfies the policy.
+
+        Parameters
+        ----------
+        password : str
+            Password to check.
+
+        Returns
+        -------
+        bool
+            True if length, required counts and class variety are met.
+        """
+        counts = dict.fromkeys(CHARACTER_CLASSES, 0)
+        for char in password:
+            kind = _character_class(char)
+            if kind in counts:
+                counts[kind] += 1
+        return (
+            len(password) >= self.min_length
+            and all(counts[kind] >= needed for kind, needed in self.require)
+            and sum(1 for count in counts.values() if count) >= self.min_classes
+        )
+
+    def apply(
+        self,
+        password: str,
+        random: "RandomSource",
+        fixed: Collection[int] = (),
+    ) -> str:
+        """Place the missing character classes at random positions.
+
+        Only characters whose class is present more often than the policy
+        needs are replaced, so placing one class never removes another.
+        The cost is linear in the password length, with no retry.
+
+        Parameters
+        ----------
+        password : str
+            Generated password.
+        random : RandomSource
+            Source drawing positions and placed characters.
+        fixed : Collection[int], default ()
+            Positions that must not be replaced (pattern literals).
+
+        Returns
+        -------
+        str
+            Password meeting the policy, unchanged if it already did.
+
+        Raises
+        ------
+        ValueError
+            If the password is too short to meet the policy.
+        """
+        if len(password) < self.min_length:
+            raise ValueError(
+                f"policy '{self.name}' requires at least {self.min_length} "
+                f"characters, got {len(password)}"
+            )
+
+        classes = [_character_class(char) for char in password]
+        counts = dict.fromkeys(CHARACTER_CLASSES, 0)
+        counts["other"] = 0
+        for kind in classes:
+            counts[kind] += 1
+
+        required = dict(self.require)
+        missing = {
+            kind: needed - counts[kind]
+            for kind, needed in required.items()
+            if counts[kind] < needed
+        }
+        present = [
+            kind for kind in CHARACTER_CLASSES if counts[kind] or kind in missing
+        ]
+        if len(present) < self.min_classes:
+            absent = [kind for kind in CHARACTER_CLASSES if kind not in present]
+            order = _random_order(random, len(absent))
+            for _ in range(self.min_classes - len(present)):
+                missing[absent[next(order)]] = 1
+        if not missing:
+            return password
+
+        # Characters each class can give up without dropping below its floor
+        surplus = {
+            kind: counts[kind] - max(required.get(kind, 0), 1)
+            for kind in CHARACTER_CLASSES
+        }
+        surplus["other"] = counts["other"]
+
+        placements = [kind for kind, count in missing.items() for _ in range(count)]
+        alphabets = dict(self.alphabets)
+        chars = list(password)
+        for position in _random_order(random, len(chars)):
+            if not placements:
+                break
+            kind = classes[position]
+            if position in fixed or surplus[kind] <= 0:
+                continue
+            surplus[kind] -= 1
+            chars[position] = random.choice(alphabets[placements.pop()])
+
+        if placements:
+            raise ValueError(
+                f"password of {len(password)} characters is too short to meet "
+                f"policy '{self.name}'"
+            )
+        return "".join(chars)
+
+
+def _compile(name: str, spec: Mapping[str, Any]) -> CompliancePolicy:
+    """Validate a policy specification and freeze it."""
+
+    unknown = set(spec) - _POLICY_KEYS
+    if unknown:
+        raise ValueError(
+            f"policy '{name}' has unknown keys: {', '.join(sorted(unknown))}"
+        )
+
+    min_length = spec.get("min_length", 0)
+    min_classes = spec.get("min_classes", 0)
+    require = dict(spec.get("require", {}))
+    specials = spec.get("specials", _CLASS_ALPHABETS["special"])
+
+    if not isinstance(min_length, int) or min_length < 0:
+        raise ValueError(f"policy '{name}': min_length must be a non-negative int")
+    if not isinstance(min_classes, int) or not 0 <= min_classes <= 4:
+        raise ValueError(f"policy '{name}': min_classes must be between 0 and 4")
+    for kind, count in require.items():
+        if kind not in CHARACTER_CLASSES:
+            valid = ", ".join(CHARACTER_CLASSES)
+            raise ValueError(
+                f"policy '{name}': unknown class '{kind}'. Valid classes: {valid}"
+            )
+        if not isinstance(count, int) or count < 0:
+            raise ValueError(
+                f"policy '{name}': required count of '{kind}' must be a "
+                "non-negative int"
+            )
+    if not specials or any(_character_class(char) != "special" for char in specials):
+        raise ValueError(
+            f"policy '{name}': specials must be non-empty and non-alphanumeric"
+        )
+
+    alphabets = {**_CLASS_ALPHABETS, "special": specials}
+    return CompliancePolicy(
+        name=name,
+        min_length=min_length,
+        min_classes=min_classes,
+        require=tuple(
+            (kind, require[kind]) for kind in CHARACTER_CLASSES if require.get(kind)
+        ),
+        alphabets=tuple((kind, alphabets[kind]) for kind in CHARACTER_CLASSES),
+    )
+
+
+@lru_cache(maxsize=None)
+def _compile_builtin(name: str) -> CompliancePolicy:
+    """Compile a built-in policy once per process."""
+
+    return _compile(name, POLICIES[name])
+
+
+def compile_policy(
+    spec: str | Mapping[str, Any],
+    custom_policies: Iterable[Mapping[str, Any]] = (),
+) -> CompliancePolicy:
+    """Compile a policy for generators to enforce during generation.
+
+    Parameters
+    ----------
+    spec : str | Mapping[str, Any]
+        Name of a built-in policy ("nist", "owasp") or of an entry of
+        ``custom_policies``, or a specification with the keys
+        ``min_length``, ``min_classes``, ``require`` (class -> minimum count,
+        classes being "lower", "upper", "digit" and "special") and
+        ``specials`` (characters placed for the special class).
+    custom_policies : Iterable[Mapping[str, Any]], default ()
+        Named specifications, as in the ``compliance.custom_policies``
+        setting. They take precedence over built-in names.
+
+    Returns
+    -------
+    CompliancePolicy
+        Compiled policy.
+
+    Raises
+    ------
+    ValueError
+        If the name is unknown or the specification is invalid.
+
+    Examples
+    --------
+    >>> policy = compile_policy("owasp")
+    >>> policy.min_length, policy.min_classes
+    (10, 3)
+    >>> compile_policy({"require": {"digit": 2}}).require
+    (('digit', 2),)
+    """
+    if isinstance(spec, Mapping):
+        return _compile(spec.get("name", "custom"), spec)
+
+    custom_policies = tuple(custom_policies)
+    for custom in custom_policies:
+        if custom.get("name") == spec:
+            return _compile(spec, custom)
+    if spec in POLICIES:
+        return _compile_builtin(spec)
+
+    custom_names = {c.get("name") for c in custom_policies}
+    names = sorted(set(POLICIES) | {n for n in custom_names if isinstance(n, str)})
+    raise ValueError(f"Unknown policy: '{spec}'. Available: {', '.join(names)}")
@@ -4,33 +4,58 @@ Checks passwords against lists of common passwords and English dictionary
 words to identify easily guessable passwords.
 """
 
+from bisect import bisect_left
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
+from clinkey_cli.wordlists.packed import PackedWordlist
+
 
 # Load common passwords list
 _DATA_DIR = Path(__file__).parent / "data"
 _COMMON_PASSWORDS_FILE = _DATA_DIR / "common_passwords.txt"
 
+# Sorted packed copy of the list, rebuilt with
+# ``python -m clinkey_cli.wordlists.build --sorted common_passwords.txt``
+_COMMON_PASSWORDS_PACKED = _DATA_DIR / "common_passwords.bin"
+
 
-def _load_common_passwords() -> set[str]:
+def _load_common_passwords() -> Sequence[str]:
     """Load common passwords from data file.
 
+    The packed copy is memory-mapped, so processes share its pages instead
+    of each building a set. The text file is parsed only when the packed
+    copy is missing.
+
     Returns
     -------
-    set[str]
-        Set of common passwords (lowercase).
+    Sequence[str]
+        Sorted common passwords (lowercase, without duplicates).
     """
+    if _COMMON_PASSWORDS_PACKED.exists():
+        return PackedWordlist.open(_COMMON_PASSWORDS_PACKED)
+
     if not _COMMON_PASSWORDS_FILE.exists():
-        return set()
+        return ()
 
     with open(_COMMON_PASSWORDS_FILE, "r", encoding="utf-8") as f:
-        return {line.strip().lower() for line in f if line.strip()}
+        return tuple(sorted({line.strip().lower() for line in f if line.strip()}))
 
 
 # Pre-load common passwords
 _COMMON_PASSWORDS = _load_common_passwords()
 
+# Longest common password, bounding the prefixes worth searching
+_LONGEST_COMMON = max(map(len, _COMMON_PASSWORDS), default=0)
+
+
+def _is_common(word: str) -> bool:
+    """Binary search ``word`` in the sorted common passwords."""
+
+    index = bisect_left(_COMMON_PASSWORDS, word)
+    return index < len(_COMMON_PASSWORDS) and _COMMON_PASSWORDS[index] == word
+
 
 # Common English dictionary words (subset for lightweight detection)
 _COMMON_WORDS = {
@@ -78,23 +103,18 @@ def check_common_password(password: str) -> dict[str, Any]:
 
     password_lower = password.lower()
 
-    # Direct match
-    if password_lower in _COMMON_PASSWORDS:
-        return {
-            "is_common": True,
-            "matches": [password_lower],
-        }
-
-    # Check for variations (with numbers appended)
-    for common in _COMMON_PASSWORDS:
-        if password_lower.startswith(common):
-            # Check if rest is just numbers
-            suffix = password_lower[len(common):]
-            if suffix.isdigit() or not suffix:
+    # Direct match, then shorter prefixes while the cut-off suffix is digits
+    longest = min(len(password_lower), _LONGEST_COMMON)
+    if longest == len(password_lower) or password_lower[longest:].isdigit():
+        for end in range(longest, 0, -1):
+            prefix = password_lower[:end]
+            if _is_common(prefix):
                 return {
                     "is_common": True,
-                    "matches": [common],
+                    "matches": [prefix],
                 }
+            if not password_lower[end - 1].isdigit():
+                break
 
     return {
         "is_common": False,
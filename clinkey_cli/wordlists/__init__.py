@@ -1,5 +1,18 @@
 """Wordlists for passphrase generation."""
 
-from clinkey_cli.wordlists.eff_large import EFF_LARGE_WORDLIST
+from typing import Any
 
 __all__ = ["EFF_LARGE_WORDLIST"]
+
+
+def __getattr__(name: str) -> Any:
+    """Map the bundled wordlist on first access (PEP 562).
+
+    Keeps ``import clinkey_cli.wordlists.packed`` from mapping the EFF list
+    when only the packed format is needed.
+    """
+    if name == "EFF_LARGE_WORDLIST":
+        from clinkey_cli.wordlists.eff_large import load_eff_large
+
+        return load_eff_large()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
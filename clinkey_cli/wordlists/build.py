@@ -0,0 +1,104 @@
+"""Compile wordlists into the packed binary format.
+
+Usage::
+
+    python -m clinkey_cli.wordlists.build [--sorted] SOURCE [DEST]
+
+``SOURCE`` is either a JSON array of words or a text file with one word per
+line. Diceware-style lines such as ``11111<TAB>abacus`` keep only the last
+field. ``DEST`` defaults to ``SOURCE`` with a ``.bin`` suffix. ``--sorted``
+lowercases, deduplicates and sorts the words, for lists searched by
+bisection rather than sampled.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from clinkey_cli.wordlists.packed import pack_wordlist
+
+
+def read_words(source: str | Path) -> list[str]:
+    """Read words from a JSON array or a plain text list.
+
+    Parameters
+    ----------
+    source : str | pathlib.Path
+        Path of the source wordlist.
+
+    Returns
+    -------
+    list[str]
+        Words in file order, stripped of surrounding whitespace.
+
+    Raises
+    ------
+    ValueError
+        If a JSON source is not an array of strings.
+    """
+    path = Path(source)
+    text = path.read_text(encoding="utf-8")
+
+    if path.suffix == ".json":
+        words = json.loads(text)
+        if not isinstance(words, list) or not all(
+            isinstance(word, str) for word in words
+        ):
+            raise ValueError(f"{path} must contain a JSON array of strings")
+        return [word.strip() for word in words]
+
+    return [line.split()[-1] for line in text.splitlines() if line.strip()]
+
+
+def build_wordlist(
+    source: str | Path, dest: str | Path | None = None, sort: bool = False
+) -> Path:
+    """Convert a wordlist file into a packed ``.bin`` file.
+
+    Parameters
+    ----------
+    source : str | pathlib.Path
+        JSON or text wordlist.
+    dest : str | pathlib.Path | None, default None
+        Output path. Defaults to ``source`` with a ``.bin`` suffix.
+    sort : bool, default False
+        Store the words lowercased, deduplicated and sorted, so that
+        membership can be tested with :mod:`bisect` on the mapped file.
+
+    Returns
+    -------
+    pathlib.Path
+        Path of the written file.
+
+    Examples
+    --------
+    >>> build_wordlist("clinkey_cli/wordlists/eff_large.json")  # doctest: +SKIP
+    PosixPath('clinkey_cli/wordlists/eff_large.bin')
+    """
+    source = Path(source)
+    dest = source.with_suffix(".bin") if dest is None else Path(dest)
+    words = read_words(source)
+    if sort:
+        words = sorted({word.lower() for word in words})
+    dest.write_bytes(pack_wordlist(words))
+    return dest
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+
+    args = sys.argv[1:] if argv is None else argv
+    sort = "--sorted" in args
+    args = [arg for arg in args if arg != "--sorted"]
+    if len(args) not in (1, 2):
+        print(__doc__.strip(), file=sys.stderr)
+        return 2
+
+    source, dest = args[0], args[1] if len(args) == 2 else None
+    path = build_wordlist(source, dest, sort=sort)
+    print(f"Wrote {path}")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
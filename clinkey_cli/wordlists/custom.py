@@ -0,0 +1,178 @@
+"""User-supplied wordlists backed by a cached packed index.
+
+The first time a wordlist file is used, its words are normalized (Unicode
+NFC, lowercase), deduplicated in first-seen order and written as a packed
+index with a length histogram (see :mod:`clinkey_cli.wordlists.packed`).
+Later runs memory-map that index directly, so a list of millions of words
+costs a few syscalls to open and one offset lookup per selected word.
+
+The index is stored next to the source as ``<name>.clkidx`` when that
+directory is writable, and under ``~/.clinkey/cache/wordlists`` otherwise.
+The index records the size, modification time and change time of the
+source, and is rebuilt as soon as any of them differs. The change time
+catches files replaced with their old modification time preserved, as
+``cp -p``, rsync or tar extraction do.
+"""
+
+import hashlib
+import os
+import tempfile
+import unicodedata
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+
+from clinkey_cli.wordlists.build import read_words
+from clinkey_cli.wordlists.packed import (
+    PackedWordlist,
+    pack_wordlist,
+    read_source_stamp,
+)
+
+# Suffix appended to a wordlist file name to form its sidecar index
+INDEX_SUFFIX = ".clkidx"
+
+# Fallback directory for indexes of wordlists in read-only locations
+CACHE_DIR = Path.home() / ".clinkey" / "cache" / "wordlists"
+
+# Number of opened custom wordlists kept mapped per process
+_OPEN_WORDLISTS_CACHE_SIZE = 8
+
+
+def normalize_words(words: Iterable[str]) -> list[str]:
+    """Normalize and deduplicate words, keeping first-seen order.
+
+    Parameters
+    ----------
+    words : Iterable[str]
+        Raw words.
+
+    Returns
+    -------
+    list[str]
+        NFC-normalized, lowercase, non-empty unique words.
+
+    Examples
+    --------
+    >>> normalize_words(["Zebra", "zebra", " Cafe\\u0301 ", ""])
+    ['zebra', 'café']
+    """
+    unique = dict.fromkeys(
+        unicodedata.normalize("NFC", word).strip().lower() for word in words
+    )
+    unique.pop("", None)
+    return list(unique)
+
+
+def _fallback_index_path(source: Path) -> Path:
+    """Return the cache location used when the source directory is read-only."""
+
+    key = hashlib.blake2b(str(source).encode("utf-8"), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{source.stem}-{key}{INDEX_SUFFIX}"
+
+
+def _source_stamp(source: Path) -> tuple[int, int, int]:
+    """Size, modification time and change time of ``source``."""
+
+    stat = source.stat()
+    return stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns
+
+
+def _is_fresh(index: Path, source: Path) -> bool:
+    """Whether ``index`` exists and was built from ``source`` as it is now."""
+
+    try:
+        return read_source_stamp(index) == _source_stamp(source)
+    except FileNotFoundError:
+        return False
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` so readers never see a partial file."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, temp_name = tempfile.mkstemp(prefix=path.name, dir=path.parent)
+    try:
+        with os.fdopen(handle, "wb") as temp_file:
+            temp_file.write(data)
+        os.replace(temp_name, path)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+
+
+def build_index(source: str | os.PathLike[str]) -> Path:
+    """Return a fresh packed index for ``source``, building it if needed.
+
+    Parameters
+    ----------
+    source : str | os.PathLike[str]
+        JSON array or text wordlist (one word per line, diceware numbering
+        allowed).
+
+    Returns
+    -------
+    pathlib.Path
+        Path of the up-to-date index.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the source file does not exist.
+    ValueError
+        If the source contains no words.
+    """
+    source = Path(source).resolve()
+    if not source.is_file():
+        raise FileNotFoundError(f"Wordlist not found: {source}")
+
+    sidecar = source.with_name(source.name + INDEX_SUFFIX)
+    fallback = _fallback_index_path(source)
+    for index in (sidecar, fallback):
+        if _is_fresh(index, source):
+            return index
+
+    # Stamped before reading, so edits made meanwhile trigger a rebuild
+    stamp = _source_stamp(source)
+    words = normalize_words(read_words(source))
+    if not words:
+        raise ValueError(f"Wordlist contains no words: {source}")
+    data = pack_wordlist(words, histogram=True, source_stamp=stamp)
+
+    try:
+        _write_atomic(sidecar, data)
+        return sidecar
+    except OSError:
+        _write_atomic(fallback, data)
+        return fallback
+
+
+@lru_cache(maxsize=_OPEN_WORDLISTS_CACHE_SIZE)
+def _open_index(index: Path, mtime_ns: int) -> PackedWordlist:
+    """Map an index once per process (``mtime_ns`` invalidates the cache)."""
+
+    return PackedWordlist.open(index)
+
+
+def load_wordlist(source: str | os.PathLike[str]) -> PackedWordlist:
+    """Open a user-supplied wordlist through its cached index.
+
+    Parameters
+    ----------
+    source : str | os.PathLike[str]
+        Path of the wordlist file.
+
+    Returns
+    -------
+    PackedWordlist
+        Memory-mapped, normalized and deduplicated words.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the source file does not exist.
+    ValueError
+        If the source contains no words.
+    """
+    index = build_index(source)
+    return _open_index(index, index.stat().st_mtime_ns)
@@ -3,13 +3,42 @@
 This wordlist contains 7,776 words optimized for memorability and
 unambiguity. Each word can be selected with 5 dice rolls (6^5 = 7,776).
 
+The words ship precompiled in ``eff_large.bin`` (see
+:mod:`clinkey_cli.wordlists.packed`), rebuilt from ``eff_large.json`` with
+``python -m clinkey_cli.wordlists.build``. The file is mapped on first use
+of :func:`load_eff_large` (or ``EFF_LARGE_WORDLIST``), not at import.
+
 Source: Electronic Frontier Foundation
 https://www.eff.org/deeplinks/2016/07/new-wordlists-random-passphrases
 """
+
 import importlib.resources as resources
-import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from clinkey_cli.wordlists.packed import PackedWordlist
+
+
+@lru_cache(maxsize=None)
+def load_eff_large() -> PackedWordlist:
+    """Map the bundled EFF large wordlist, once per process.
+
+    Returns
+    -------
+    PackedWordlist
+        The 7,776 words, shared by every caller.
+    """
+    wordlist_path = resources.files(__package__).joinpath("eff_large.bin")
+    if isinstance(wordlist_path, Path):
+        return PackedWordlist.open(wordlist_path)
+    else:  # pragma: no cover - zipped installs cannot be memory-mapped
+        return PackedWordlist(wordlist_path.read_bytes())
+
 
+def __getattr__(name: str) -> Any:
+    """Map ``EFF_LARGE_WORDLIST`` on first access (PEP 562)."""
 
-wordlist_path = resources.files(__package__).joinpath("eff_large.json")
-with wordlist_path.open("r", encoding="utf-8") as wordlist_file:
-    EFF_LARGE_WORDLIST = json.load(wordlist_file)
+    if name == "EFF_LARGE_WORDLIST":
+        return load_eff_large()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,394 @@
+"""Compact memory-mapped wordlist format.
+
+A packed wordlist is a small header, an array of ``count + 1`` little-endian
+``uint32`` offsets and a single UTF-8 blob holding every word back to back.
+Opening one maps the file read-only, so loading costs a few syscalls instead
+of parsing thousands of strings, and forked or concurrent processes share
+the same pages. Words are decoded only when they are selected: ASCII lists
+are viewed as one string on first access and sliced per word, others are
+decoded word by word.
+
+Layout::
+
+    magic      8 bytes   b"CLKWORDS"
+    version    uint16    1
+    flags      uint16    bit 0: every word is ASCII
+                         bit 1: a length histogram follows the header
+                         bit 2: a source stamp follows the header
+    count      uint32    number of words
+    [stamp     uint64 size, int64 mtime_ns, int64 ctime_ns of the source]
+    [bins      uint32    number of histogram bins]
+    [histogram uint32 * bins, words per character length]
+    offsets    uint32 * (count + 1)
+    blob       UTF-8 bytes
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from functools import cached_property
+from pathlib import Path
+from typing import overload
+
+# File signature identifying a packed wordlist
+MAGIC = b"CLKWORDS"
+
+# Current format version
+FORMAT_VERSION = 1
+
+# Header layout: magic, version, flags, word count
+_HEADER = struct.Struct("<8sHHI")
+
+# Flag set when every word is ASCII, so casing preserves byte offsets
+_FLAG_ASCII = 0x1
+
+# Flag set when a word length histogram is stored after the header
+_FLAG_HISTOGRAM = 0x2
+
+# Flag set when the stamp of the file the list was built from is stored
+_FLAG_SOURCE = 0x4
+
+# Source stamp layout: size, modification time and change time
+_SOURCE_STAMP = struct.Struct("<Qqq")
+
+# Width of one entry of the offsets array
+_OFFSET_SIZE = 4
+
+# Largest list recased blob-wide; bigger lists are recased per selected word
+RECASE_BLOB_MAX_WORDS = 1 << 16
+
+
+class PackedWordlist(Sequence[str]):
+    """Read-only sequence of words backed by a packed wordlist buffer.
+
+    Parameters
+    ----------
+    buffer : bytes | mmap.mmap
+        Content of a packed wordlist file.
+
+    Raises
+    ------
+    ValueError
+        If the buffer is not a valid packed wordlist.
+
+    Examples
+    --------
+    >>> words = PackedWordlist(pack_wordlist(["alpha", "beta"]))
+    >>> len(words), words[1]
+    (2, 'beta')
+    """
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        """Validate the header and index the buffer without copying it.
+
+        Parameters
+        ----------
+        buffer : bytes | mmap.mmap
+            Content of a packed wordlist file.
+
+        Raises
+        ------
+        ValueError
+            If the buffer is not a valid packed wordlist.
+        """
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Invalid packed wordlist: truncated header")
+
+        magic, version, flags, count = _HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError("Invalid packed wordlist: bad magic number")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported packed wordlist version: {version}")
+
+        offsets_start = _HEADER.size
+        source_stamp: tuple[int, int, int] | None = None
+        if flags & _FLAG_SOURCE:
+            source_stamp = _SOURCE_STAMP.unpack_from(buffer, offsets_start)
+            offsets_start += _SOURCE_STAMP.size
+
+        histogram: tuple[int, ...] | None = None
+        if flags & _FLAG_HISTOGRAM:
+            (bins,) = struct.unpack_from("<I", buffer, offsets_start)
+            histogram = struct.unpack_from(f"<{bins}I", buffer, offsets_start + 4)
+            offsets_start += (bins + 1) * _OFFSET_SIZE
+
+        blob_start = offsets_start + (count + 1) * _OFFSET_SIZE
+        if len(buffer) < blob_start:
+            raise ValueError("Invalid packed wordlist: truncated offsets")
+
+        raw = memoryview(buffer)[offsets_start:blob_start]
+        offsets: memoryview | array[int]
+        if sys.byteorder == "little":
+            offsets = raw.cast("I")
+        else:  # pragma: no cover - big-endian hosts
+            offsets = array("I", raw)
+            offsets.byteswap()
+
+        if blob_start + offsets[-1] != len(buffer):
+            raise ValueError("Invalid packed wordlist: blob size mismatch")
+
+        self._buffer = buffer
+        self._offsets = offsets
+        self._blob_start = blob_start
+        self._count = count
+        self.is_ascii = bool(flags & _FLAG_ASCII)
+        self.source_stamp = source_stamp
+        self._histogram = histogram
+
+    @classmethod
+    def open(cls, path: str | Path) -> "PackedWordlist":
+        """Memory-map a packed wordlist file.
+
+        Parameters
+        ----------
+        path : str | pathlib.Path
+            Path of the ``.bin`` file.
+
+        Returns
+        -------
+        PackedWordlist
+            Wordlist backed by a read-only shared mapping.
+        """
+        with open(path, "rb") as handle:
+            buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def length_histogram(self) -> dict[int, int]:
+        """Number of words of each length, in characters.
+
+        Read from the file when it was packed with a histogram, otherwise
+        computed by decoding every word once.
+        """
+        if self._histogram is None:
+            self._histogram = _histogram(self)
+        return {length: count for length, count in enumerate(self._histogram) if count}
+
+    @cached_property
+    def _text(self) -> str | None:
+        """Whole blob as one string, when byte and character offsets agree."""
+
+        if not self.is_ascii:
+            return None
+        return self._buffer[self._blob_start :].decode("ascii")
+
+    def materialize(self) -> None:
+        """Build the decoded view now rather than on the first selection.
+
+        Called before forking worker processes, so that they inherit the
+        view instead of each decoding a private copy.
+        """
+        _ = self._text
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("wordlist index out of range")
+
+        start = self._offsets[index]
+        end = self._offsets[index + 1]
+        text = self._text
+        if text is not None:
+            return text[start:end]
+
+        base = self._blob_start
+        return self._buffer[base + start : base + end].decode("utf-8")
+
+    def take(self, indices: Iterable[int]) -> list[str]:
+        """Return the words at ``indices``, decoding only those words.
+
+        Parameters
+        ----------
+        indices : Iterable[int]
+            Non-negative indices, each below ``len(self)``.
+
+        Returns
+        -------
+        list[str]
+            Selected words, in the order of ``indices``.
+        """
+        text = self._text
+        if text is None:
+            return [self[index] for index in indices]
+
+        offsets = self._offsets
+        return [text[offsets[index] : offsets[index + 1]] for index in indices]
+
+    def _with_blob(self, blob: bytes) -> "PackedWordlist":
+        """Return a wordlist sharing this index over a transformed blob."""
+
+        header = bytes(self._buffer[: self._blob_start])
+        return PackedWordlist(header + blob)
+
+    def upper(self) -> "Sequence[str]":
+        """Return the same wordlist in uppercase.
+
+        Small ASCII lists are converted with a single pass over the blob;
+        other lists are recased word by word, only when a word is selected.
+
+        Returns
+        -------
+        Sequence[str]
+            Index-aligned uppercase variant.
+        """
+        if not self.is_ascii or self._count > RECASE_BLOB_MAX_WORDS:
+            return RecasedWordlist(self, str.upper)
+        return self._with_blob(self._buffer[self._blob_start :].upper())
+
+    def capitalized(self) -> "Sequence[str]":
+        """Return the same wordlist with each word capitalized.
+
+        Returns
+        -------
+        Sequence[str]
+            Index-aligned variant matching ``str.capitalize``.
+        """
+        if not self.is_ascii or self._count > RECASE_BLOB_MAX_WORDS:
+            return RecasedWordlist(self, str.capitalize)
+
+        blob = bytearray(self._buffer[self._blob_start :].lower())
+        for position in self._offsets[:-1]:
+            if 0x61 <= blob[position] <= 0x7A:  # ASCII a-z
+                blob[position] -= 0x20
+        return self._with_blob(bytes(blob))
+
+
+class RecasedWordlist(Sequence[str]):
+    """View of a packed wordlist applying a casing method per selected word.
+
+    Used for non-ASCII lists, where casing can change byte lengths, and for
+    lists too large to be worth recasing as a whole.
+
+    Parameters
+    ----------
+    words : PackedWordlist
+        Underlying wordlist.
+    method : Callable[[str], str]
+        Casing method, e.g. ``str.upper``.
+    """
+
+    def __init__(self, words: PackedWordlist, method: Callable[[str], str]) -> None:
+        self._words = words
+        self._method = method
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._method(word) for word in self._words[index]]
+        return self._method(self._words[index])
+
+    def take(self, indices: Iterable[int]) -> list[str]:
+        """Return the recased words at ``indices``."""
+
+        return list(map(self._method, self._words.take(indices)))
+
+
+def _histogram(words: Iterable[str]) -> tuple[int, ...]:
+    """Count words per character length, indexed by length."""
+
+    counts = Counter(map(len, words))
+    return tuple(counts.get(length, 0) for length in range(max(counts) + 1))
+
+
+def read_source_stamp(path: str | Path) -> tuple[int, int, int] | None:
+    """Read the source stamp of a packed wordlist without mapping it.
+
+    Parameters
+    ----------
+    path : str | pathlib.Path
+        Path of the ``.bin`` file.
+
+    Returns
+    -------
+    tuple[int, int, int] | None
+        Stamp given to :func:`pack_wordlist`, or None if the file has none
+        or is not a packed wordlist.
+
+    Raises
+    ------
+    OSError
+        If the file cannot be read.
+    """
+    with open(path, "rb") as handle:
+        head = handle.read(_HEADER.size + _SOURCE_STAMP.size)
+    if len(head) < _HEADER.size + _SOURCE_STAMP.size:
+        return None
+    magic, version, flags, _ = _HEADER.unpack_from(head)
+    if magic != MAGIC or version != FORMAT_VERSION or not flags & _FLAG_SOURCE:
+        return None
+    return _SOURCE_STAMP.unpack_from(head, _HEADER.size)
+
+
+def pack_wordlist(
+    words: Iterable[str],
+    histogram: bool = False,
+    source_stamp: tuple[int, int, int] | None = None,
+) -> bytes:
+    """Serialize words into the packed wordlist format.
+
+    Parameters
+    ----------
+    words : Iterable[str]
+        Words in selection order.
+    histogram : bool, default False
+        Store the word length histogram alongside the words.
+    source_stamp : tuple[int, int, int] | None, default None
+        Size, ``st_mtime_ns`` and ``st_ctime_ns`` of the file the words
+        were read from, so caches can tell when it changes.
+
+    Returns
+    -------
+    bytes
+        Packed wordlist content.
+
+    Raises
+    ------
+    ValueError
+        If the list is empty or a word is empty.
+    """
+    encoded = []
+    for word in words:
+        if not word:
+            raise ValueError("Wordlist entries must be non-empty")
+        encoded.append(word.encode("utf-8"))
+    if not encoded:
+        raise ValueError("Wordlist must contain at least one word")
+
+    offsets = array("I", [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+        offsets.byteswap()
+
+    blob = b"".join(encoded)
+    flags = _FLAG_ASCII if blob.isascii() else 0
+
+    section = b""
+    if source_stamp is not None:
+        flags |= _FLAG_SOURCE
+        section += _SOURCE_STAMP.pack(*source_stamp)
+    if histogram:
+        flags |= _FLAG_HISTOGRAM
+        counts = _histogram(word.decode("utf-8") for word in encoded)
+        section += struct.pack(f"<I{len(counts)}I", len(counts), *counts)
+
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, flags, len(encoded))
+    return header + section + offsets.tobytes() + blob
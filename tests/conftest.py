@@ -9,3 +9,35 @@ from clinkey_cli.main import Clinkey
 def clinkey():
     """Provide a fresh Clinkey instance for each test."""
     return Clinkey()
+
+
+# Module of the fake third-party generator installed by ``plugin_path``
+PLUGIN_MODULE = '''
+from clinkey_cli.generators.base import BaseGenerator
+
+
+class TokenGenerator(BaseGenerator):
+    def generate(self, length=16, **kwargs):
+        return self.transform("TOKEN-" + "X" * length, **kwargs)
+'''
+
+
+@pytest.fixture
+def plugin_path(tmp_path, monkeypatch):
+    """Install a fake distribution advertising a ``token`` generator.
+
+    Returns the directory holding it, already prepended to ``sys.path``.
+    """
+    (tmp_path / "clinkey_token_plugin.py").write_text(PLUGIN_MODULE)
+    dist_info = tmp_path / "clinkey_token_plugin-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: clinkey-token-plugin\nVersion: 1.0\n"
+    )
+    (dist_info / "entry_points.txt").write_text(
+        "[clinkey.generators]\n"
+        "token = clinkey_token_plugin:TokenGenerator\n"
+        "normal = clinkey_token_plugin:TokenGenerator\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return tmp_path
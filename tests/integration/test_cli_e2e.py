@@ -1,9 +1,12 @@
 """End-to-end CLI integration tests."""
 
+import re
 import subprocess
 import tempfile
 from pathlib import Path
 
+import pytest
+
 
 class TestBackwardCompatibility:
     """Test that existing CLI commands work identically."""
@@ -188,6 +191,360 @@ class TestPatternCLI:
         assert len(passwords) == 5
 
 
+class TestStreamCLI:
+    """Test streaming output mode."""
+
+    def test_stream_stdout(self):
+        """Test --stream prints one plain password per line."""
+        result = subprocess.run(
+            ["clinkey", "-t", "pattern", "--pattern", "DDDD", "-n", "2000", "--stream"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        passwords = result.stdout.splitlines()
+        assert len(passwords) == 2000
+        assert all(len(p) == 4 and p.isdigit() for p in passwords)
+
+    def test_stream_to_file(self):
+        """Test --stream combined with --output."""
+        with tempfile.TemporaryDirectory() as directory:
+            output_path = Path(directory) / "out.txt"
+            result = subprocess.run(
+                ["clinkey", "-l", "20", "-n", "600", "--stream", "-o", str(output_path)],
+                capture_output=True,
+                text=True,
+            )
+
+            assert result.returncode == 0
+            assert len(output_path.read_text().splitlines()) == 600
+
+
+class TestWorkersCLI:
+    """Test multi-process generation."""
+
+    def test_workers_stream(self):
+        """Test --workers generates the requested number of passwords."""
+        result = subprocess.run(
+            ["clinkey", "-t", "strong", "-n", "3000", "-w", "2", "--stream"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        assert len(result.stdout.splitlines()) == 3000
+
+
+class TestUniqueCLI:
+    """Test duplicate-free batch mode."""
+
+    def test_unique_small_keyspace(self):
+        """Test --unique fills a batch from a tiny keyspace without repeats."""
+        result = subprocess.run(
+            ["clinkey", "-t", "pattern", "--pattern", "DD", "-n", "100", "--unique"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        passwords = result.stdout.splitlines()
+        assert len(passwords) == 100
+        assert len(set(passwords)) == 100
+        assert "duplicate password(s)" in result.stderr
+
+    def test_unique_exhausted_keyspace(self):
+        """Test --unique fails cleanly when the keyspace is too small."""
+        result = subprocess.run(
+            ["clinkey", "-t", "pattern", "--pattern", "D", "-n", "11", "--unique"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode != 0
+        assert "keyspace exhausted" in result.stderr
+
+
+class TestSeedCLI:
+    """Test reproducible generation."""
+
+    def test_seed_reproduces_output(self):
+        """Test the same seed prints the same passwords, with a warning."""
+        command = ["clinkey", "-t", "strong", "-n", "5", "--seed", "42", "--stream"]
+        first = subprocess.run(command, capture_output=True, text=True)
+        second = subprocess.run(command, capture_output=True, text=True)
+
+        assert first.returncode == 0
+        assert first.stdout == second.stdout
+        assert len(first.stdout.splitlines()) == 5
+        assert "Never use these passwords" in first.stderr
+
+    def test_seed_output_independent_of_workers(self):
+        """Test a seeded batch is the same in one process or in a pool."""
+        command = ["clinkey", "-t", "pattern", "--pattern", "LLDD", "-n", "2500"]
+        command += ["--seed", "7", "--stream"]
+        single = subprocess.run([*command, "-w", "1"], capture_output=True, text=True)
+        pooled = subprocess.run([*command, "-w", "3"], capture_output=True, text=True)
+
+        assert single.returncode == pooled.returncode == 0
+        assert single.stdout == pooled.stdout
+        assert len(single.stdout.splitlines()) == 2500
+
+
+class TestMinBitsCLI:
+    """Test sizing passwords from a target entropy."""
+
+    def test_min_bits_sizes_passphrase(self):
+        """Test --min-bits raises the word count to reach the target."""
+        result = subprocess.run(
+            ["clinkey", "-t", "passphrase", "--min-bits", "70", "--stream"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        assert len(result.stdout.strip().split("-")) == 6
+
+    def test_min_bits_sizes_syllable_length(self):
+        """Test --min-bits lengthens syllable passwords."""
+        result = subprocess.run(
+            ["clinkey", "-t", "strong", "--min-bits", "100", "--stream"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        assert len(result.stdout.strip()) > 16
+
+    def test_min_bits_rejects_weak_pattern(self):
+        """Test a pattern below the target is refused before generating."""
+        result = subprocess.run(
+            ["clinkey", "-t", "pattern", "--pattern", "DDDD", "--min-bits", "20"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode != 0
+        assert "--min-bits" in result.stderr
+
+
+class TestPolicyCLI:
+    """Test compliance policies from the command line."""
+
+    def test_policy_applies_to_every_password(self):
+        """Test --policy owasp yields compliant passwords."""
+        from clinkey_cli.security.compliance import check_owasp_compliance
+
+        result = subprocess.run(
+            ["clinkey", "-t", "normal", "-n", "50", "--policy", "owasp", "--stream"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        passwords = result.stdout.splitlines()
+        assert len(passwords) == 50
+        assert all(check_owasp_compliance(p)["compliant"] for p in passwords)
+
+    def test_unknown_policy(self):
+        """Test an unknown policy name is rejected."""
+        result = subprocess.run(
+            ["clinkey", "-t", "normal", "--policy", "nope"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode != 0
+        assert "Unknown policy" in result.stderr
+
+
+class TestRulesCLI:
+    """Test generation from site password rules."""
+
+    def test_rules(self):
+        """Test --rules samples compliant passwords of the clamped length."""
+        result = subprocess.run(
+            [
+                "clinkey",
+                "-t",
+                "pattern",
+                "--rules",
+                "required: upper; required: digit; allowed: lower; maxlength: 12",
+                "-l",
+                "20",
+                "-n",
+                "20",
+                "--stream",
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        passwords = result.stdout.splitlines()
+        assert len(passwords) == 20
+        assert all(re.fullmatch(r"[A-Za-z0-9]{12}", p) for p in passwords)
+        assert all(re.search(r"[A-Z]", p) and re.search(r"\d", p) for p in passwords)
+
+    def test_invalid_rules(self):
+        """Test malformed rules are reported against --rules."""
+        result = subprocess.run(
+            ["clinkey", "-t", "pattern", "--rules", "required: emoji"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode != 0
+        assert "--rules" in result.stderr
+
+    @pytest.mark.parametrize("type_args", [[], ["-t", "strong"]])
+    def test_rules_require_pattern_type(self, type_args):
+        """Test rules are rejected, not ignored, outside the pattern type."""
+        result = subprocess.run(
+            ["clinkey", *type_args, "--rules", "required: digit; maxlength: 8"],
+            input="",
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode != 0
+        assert "--rules" in result.stderr
+        assert result.stdout == ""
+
+
+class TestLanguageCLI:
+    """Test syllable language packs from the command line."""
+
+    def test_language_pack(self):
+        """Test --language generates from the selected pack."""
+        command = ["clinkey", "-t", "strong", "-l", "24", "-n", "5", "--stream"]
+        result = subprocess.run(
+            command + ["--language", "french"], capture_output=True, text=True
+        )
+
+        assert result.returncode == 0
+        passwords = result.stdout.splitlines()
+        assert len(passwords) == 5
+        assert all(re.fullmatch(r"\d\d[A-Z-]{22}", p) for p in passwords)
+
+    def test_unknown_language(self):
+        """Test unknown languages are rejected by the option."""
+        result = subprocess.run(
+            ["clinkey", "-t", "strong", "--language", "klingon"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode != 0
+        assert "--language" in result.stderr
+
+    @pytest.mark.parametrize(
+        "type_args", [["-t", "passphrase"], ["-t", "pattern", "--pattern", "DD"]]
+    )
+    def test_language_requires_syllable_type(self, type_args):
+        """Test a language is rejected, not ignored, outside syllable types."""
+        result = subprocess.run(
+            ["clinkey", *type_args, "--language", "french"],
+            input="",
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode != 0
+        assert "--language" in result.stderr
+        assert result.stdout == ""
+
+    @pytest.mark.parametrize(
+        "option",
+        [["--language", "french"], ["-w", "2"], ["--unordered"], ["--stats"]],
+    )
+    def test_options_skip_interactive_prompt(self, option):
+        """Test generation options alone run non-interactively."""
+        result = subprocess.run(
+            ["clinkey", *option], input="", capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stdout
+        assert "Choose one to copy" in result.stdout
+
+
+class TestStatsCLI:
+    """Test generator instrumentation from the command line."""
+
+    def test_stats_printed_on_stderr(self):
+        """Test --stats reports timings without touching stdout."""
+        result = subprocess.run(
+            ["clinkey", "-t", "strong", "-n", "20", "--stream", "--stats"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        assert len(result.stdout.splitlines()) == 20
+        assert "generate: 20 call(s)" in result.stderr
+        assert "fit_to_length.truncated_chars" in result.stderr
+
+    def test_stats_rejects_workers(self):
+        """Test worker processes cannot be instrumented."""
+        result = subprocess.run(
+            ["clinkey", "-t", "strong", "-n", "20", "-w", "2", "--stats"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode != 0
+        assert "--stats" in result.stderr
+
+
+class TestWordlistCLI:
+    """Test passphrases from a custom wordlist."""
+
+    def test_custom_wordlist(self):
+        """Test --wordlist draws words from the file and caches its index."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "words.txt"
+            source.write_text("alpha\nbravo\ncharlie\nALPHA\n", encoding="utf-8")
+
+            result = subprocess.run(
+                [
+                    "clinkey",
+                    "-t",
+                    "passphrase",
+                    "--wordlist",
+                    str(source),
+                    "-n",
+                    "3",
+                    "-w",
+                    "2",
+                    "--stream",
+                ],
+                capture_output=True,
+                text=True,
+            )
+
+            assert result.returncode == 0
+            for line in result.stdout.splitlines():
+                assert set(line.split("-")) <= {"Alpha", "Bravo", "Charlie"}
+            assert (Path(tmpdir) / "words.txt.clkidx").exists()
+
+    @pytest.mark.parametrize("type_args", [[], ["-t", "pattern", "--pattern", "DDDD"]])
+    def test_wordlist_requires_passphrase_type(self, type_args, tmp_path):
+        """Test a wordlist is rejected, not ignored, outside passphrases."""
+        source = tmp_path / "words.txt"
+        source.write_text("alpha\nbravo\n", encoding="utf-8")
+
+        result = subprocess.run(
+            ["clinkey", *type_args, "--wordlist", str(source)],
+            input="",
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode != 0
+        assert "--wordlist" in result.stderr
+        assert result.stdout == ""
+
+
 class TestHelpText:
     """Test CLI help output."""
 
@@ -1,9 +1,13 @@
 """Integration tests for CLI password generation function."""
 
+import io
+
 import pytest
 from click import BadParameter
 
-from clinkey_cli.cli import _generate_passwords
+from clinkey_cli.cli import _generate_passwords, _iter_passwords, _stream_passwords
+from clinkey_cli.generators import GeneratorStats
+from clinkey_cli.generators.registry import registry
 
 
 class TestSyllableGeneration:
@@ -196,3 +200,55 @@ class TestPatternGeneration:
 
         assert "Pattern template required" in str(exc_info.value)
         assert "--pattern" in str(exc_info.value)
+
+
+class TestStreamingGeneration:
+    """Test lazy generation and buffered writing used by --stream."""
+
+    def test_iter_passwords_is_lazy(self):
+        """Test huge counts do not generate anything up front."""
+        stream = _iter_passwords(
+            type_="pattern",
+            length=16,
+            number=10_000_000,
+            lower=False,
+            no_sep=False,
+            separator=None,
+            word_count=4,
+            capitalize=True,
+            pattern="DDDD",
+        )
+
+        assert next(stream).isdigit()
+
+    def test_stream_passwords_writes_all_lines(self):
+        """Test every password is written once, across several buffers."""
+        handle = io.StringIO()
+        passwords = (f"pw{i}" for i in range(25))
+
+        written = _stream_passwords(handle, passwords, buffer_lines=10)
+
+        assert written == 25
+        assert handle.getvalue().splitlines() == [f"pw{i}" for i in range(25)]
+
+    def test_stats_leave_cached_generator_uninstrumented(self):
+        """Test --stats instruments a private instance, not the shared one."""
+        stats = GeneratorStats()
+        stream = _iter_passwords(
+            type_="pattern",
+            length=16,
+            number=5,
+            lower=False,
+            no_sep=False,
+            separator=None,
+            word_count=4,
+            capitalize=True,
+            pattern="DDDD",
+            stats=stats,
+        )
+
+        assert len(list(stream)) == 5
+        assert stats.snapshot()["timers"]["generate"]["calls"] == 5
+        cached = registry.create("pattern")
+        assert cached._stats is None
+        assert "generate" not in vars(cached)
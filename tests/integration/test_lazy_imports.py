@@ -0,0 +1,103 @@
+"""Import-time tests: a run only loads the modules it needs."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Runs the CLI in a fresh interpreter and prints the clinkey modules it loaded
+_SCRIPT = """
+import sys
+from clinkey_cli.cli import main
+
+try:
+    main(sys.argv[1:], standalone_mode=False)
+finally:
+    loaded = sorted(m for m in sys.modules if m.startswith("clinkey_cli"))
+    print("\\n".join(loaded), file=sys.stderr)
+"""
+
+
+def _loaded_modules(*args: str, env: dict[str, str] | None = None) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", _SCRIPT, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return set(result.stderr.split())
+
+
+class TestLazyImports:
+    """Test that generators and their data load only on demand."""
+
+    def test_pattern_run_never_loads_wordlists(self):
+        """Test `clinkey -t pattern` does not touch the wordlists package."""
+        loaded = _loaded_modules("-t", "pattern", "--pattern", "CvcDD", "--stream")
+
+        assert "clinkey_cli.generators.pattern" in loaded
+        assert not any(name.startswith("clinkey_cli.wordlists") for name in loaded)
+        assert "clinkey_cli.generators.passphrase" not in loaded
+        assert "clinkey_cli.generators.syllable" not in loaded
+
+    @pytest.mark.parametrize("type_", ["normal", "strong"])
+    def test_syllable_run_never_loads_wordlists(self, type_):
+        """Test syllable types do not load the passphrase wordlist."""
+        loaded = _loaded_modules("-t", type_, "--stream")
+
+        assert "clinkey_cli.generators.syllable" in loaded
+        assert not any(name.startswith("clinkey_cli.wordlists") for name in loaded)
+
+    def test_single_process_run_skips_parallel_engine(self):
+        """Test the process pool is imported only when --workers is used."""
+        loaded = _loaded_modules("-t", "pattern", "--pattern", "DD", "--stream")
+        assert "clinkey_cli.generators.parallel" not in loaded
+
+    def test_policy_run_skips_security_analyzer(self):
+        """Test --policy loads the compliance rules, not the breach checker."""
+        loaded = _loaded_modules("-t", "strong", "--policy", "owasp", "--stream")
+
+        assert "clinkey_cli.security.compliance" in loaded
+        assert "clinkey_cli.security.analyzer" not in loaded
+        assert "clinkey_cli.security.breach" not in loaded
+
+    def test_packed_format_does_not_map_eff_list(self):
+        """Test using the packed format alone leaves the EFF list unmapped."""
+        script = (
+            "import sys, clinkey_cli.security.dictionary, clinkey_cli.wordlists;"
+            "print('clinkey_cli.wordlists.eff_large' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+
+class TestPluginGenerators:
+    """Test third-party generators through the CLI."""
+
+    @pytest.fixture
+    def env(self, plugin_path):
+        """Environment exposing the fake plugin to a child interpreter."""
+        return {**os.environ, "PYTHONPATH": str(plugin_path)}
+
+    def test_plugin_type_selectable(self, env):
+        """Test a plugin generator can be used with --type."""
+        result = subprocess.run(
+            [sys.executable, "-m", "clinkey_cli.cli", "-t", "token", "-l", "4"]
+            + ["-n", "2", "--stream"],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.splitlines() == ["TOKEN-XXXX", "TOKEN-XXXX"]
+
+    def test_builtin_run_skips_plugin_discovery(self, env):
+        """Test built-in types never scan entry points or import plugins."""
+        loaded = _loaded_modules(
+            "-t", "pattern", "--pattern", "DD", "--stream", env=env
+        )
+        assert "clinkey_token_plugin" not in loaded
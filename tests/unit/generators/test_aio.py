@@ -0,0 +1,122 @@
+"""Unit tests for the asyncio generation adapters."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from clinkey_cli.generators.aio import aiter_chunks
+from clinkey_cli.generators.pattern import PatternGenerator
+
+
+async def _collect(stream):
+    return [item async for item in stream]
+
+
+class TestAiterChunks:
+    """Test streaming a synchronous source through an executor."""
+
+    @pytest.mark.asyncio
+    async def test_yields_all_items_in_order(self):
+        """Test items come back complete and ordered across chunks."""
+        items = [str(i) for i in range(1000)]
+        assert await _collect(aiter_chunks(items, chunk_size=64)) == items
+
+    @pytest.mark.asyncio
+    async def test_empty_source(self):
+        """Test an empty source ends immediately."""
+        assert await _collect(aiter_chunks([])) == []
+
+    def test_invalid_chunk_size(self):
+        """Test chunk_size must be positive."""
+        with pytest.raises(ValueError, match="chunk_size must be at least 1"):
+            aiter_chunks([], chunk_size=0)
+
+    @pytest.mark.asyncio
+    async def test_runs_in_given_executor(self):
+        """Test generation happens on the configured executor's threads."""
+        threads = set()
+
+        def source():
+            for i in range(10):
+                threads.add(threading.current_thread().name)
+                yield str(i)
+
+        with ThreadPoolExecutor(thread_name_prefix="clinkey-test") as executor:
+            await _collect(aiter_chunks(source(), executor, chunk_size=3))
+
+        assert threads and all(name.startswith("clinkey-test") for name in threads)
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self):
+        """Test other coroutines run while a slow batch is generated."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        def slow_source():
+            for i in range(20):
+                time.sleep(0.005)
+                yield str(i)
+
+        task = asyncio.create_task(ticker())
+        await _collect(aiter_chunks(slow_source(), chunk_size=5))
+        task.cancel()
+
+        assert ticks > 10
+
+    @pytest.mark.asyncio
+    async def test_cancellation_stops_generation(self):
+        """Test cancelling the consumer stops pulling from the source."""
+        produced = 0
+
+        def endless():
+            nonlocal produced
+            while True:
+                produced += 1
+                time.sleep(0.001)
+                yield "x"
+
+        async def consume():
+            async for _ in aiter_chunks(endless(), chunk_size=10):
+                pass
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        await asyncio.sleep(0.05)
+        stopped_at = produced
+        await asyncio.sleep(0.05)
+        assert produced == stopped_at
+
+
+class TestGeneratorAsyncAPI:
+    """Test the coroutine methods on generators."""
+
+    @pytest.mark.asyncio
+    async def test_agenerate(self):
+        """Test agenerate returns one password."""
+        password = await PatternGenerator().agenerate(pattern="DDDD")
+        assert len(password) == 4 and password.isdigit()
+
+    @pytest.mark.asyncio
+    async def test_agenerate_batch(self):
+        """Test agenerate_batch streams count passwords."""
+        stream = PatternGenerator().agenerate_batch(500, chunk_size=64, pattern="LD")
+        passwords = await _collect(stream)
+        assert len(passwords) == 500
+        assert all(len(p) == 2 for p in passwords)
+
+    def test_agenerate_batch_validates_eagerly(self):
+        """Test invalid counts fail before iteration starts."""
+        with pytest.raises(ValueError, match="count must be non-negative"):
+            PatternGenerator().agenerate_batch(-1, pattern="D")
@@ -17,3 +17,46 @@ class TestBaseGenerator:
         """Test that BaseGenerator defines abstract generate method."""
         assert hasattr(BaseGenerator, "generate")
         assert getattr(BaseGenerator.generate, "__isabstractmethod__", False)
+
+
+class TestIterGenerate:
+    """Test lazy batch generation shared by all generators."""
+
+    @pytest.fixture
+    def gen(self):
+        """Provide a PatternGenerator as a concrete BaseGenerator."""
+        from clinkey_cli.generators.pattern import PatternGenerator
+
+        return PatternGenerator()
+
+    def test_iter_generate_count(self, gen):
+        """Test iter_generate yields exactly count passwords."""
+        passwords = list(gen.iter_generate(5, pattern="DDDD"))
+        assert len(passwords) == 5
+        assert all(p.isdigit() and len(p) == 4 for p in passwords)
+
+    def test_iter_generate_unbounded(self, gen):
+        """Test iter_generate without count never stops on its own."""
+        stream = gen.iter_generate(pattern="DD")
+        assert len([next(stream) for _ in range(1000)]) == 1000
+
+    def test_iter_generate_negative_count(self, gen):
+        """Test negative counts are rejected before iteration starts."""
+        with pytest.raises(ValueError, match="count must be non-negative"):
+            gen.iter_generate(-1, pattern="DD")
+
+
+class TestEntropyModel:
+    """Test the keyspace defaults for generators without a model."""
+
+    def test_keyspace_not_implemented_by_default(self):
+        """Test generators must opt in to keyspace reporting."""
+
+        class Opaque(BaseGenerator):
+            def generate(self, length=16, **kwargs):
+                return "x" * length
+
+        with pytest.raises(NotImplementedError, match="Opaque"):
+            Opaque().entropy_bits(length=16)
+        with pytest.raises(NotImplementedError):
+            Opaque().params_for_bits(10, length=16)
@@ -0,0 +1,115 @@
+"""Unit tests for the multi-process batch engine."""
+
+from itertools import islice
+
+import pytest
+
+from clinkey_cli.generators import GeneratorStats
+from clinkey_cli.generators.parallel import _chunk_sizes, generate_parallel
+
+
+class TestChunkSizes:
+    """Test batch sharding."""
+
+    def test_chunk_sizes_exact(self):
+        """Test a count splits into full chunks plus a remainder."""
+        assert list(_chunk_sizes(2500, 1000)) == [1000, 1000, 500]
+
+    def test_chunk_sizes_unbounded(self):
+        """Test count=None yields chunks forever."""
+        assert list(islice(_chunk_sizes(None, 10), 3)) == [10, 10, 10]
+
+
+class TestGenerateParallel:
+    """Test parallel generation through a process pool."""
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_generates_requested_count(self, ordered):
+        """Test ordered and unordered modes yield exactly count passwords."""
+        passwords = list(
+            generate_parallel(
+                "pattern",
+                2345,
+                workers=2,
+                ordered=ordered,
+                chunk_size=500,
+                pattern="LLDD",
+            )
+        )
+        assert len(passwords) == 2345
+        assert all(len(p) == 4 and p[2:].isdigit() for p in passwords)
+
+    def test_workers_draw_independent_randomness(self):
+        """Test worker processes never replay each other's random bytes."""
+        passwords = list(
+            generate_parallel(
+                "pattern", 4000, workers=4, chunk_size=100, pattern="L" * 16
+            )
+        )
+        assert len(set(passwords)) == len(passwords)
+
+    def test_seeded_output_independent_of_workers(self):
+        """Test a seed reproduces the same ordered batch on any pool size."""
+        runs = [
+            list(
+                generate_parallel(
+                    "pattern",
+                    700,
+                    workers=workers,
+                    chunk_size=100,
+                    seed=5,
+                    pattern="LLLLDDDD",
+                )
+            )
+            for workers in (1, 2, 3)
+        ]
+        assert runs[0] == runs[1] == runs[2]
+        assert len(set(runs[0])) == 700
+
+    def test_single_worker_runs_in_process(self):
+        """Test workers=1 validates eagerly and can collect stats."""
+        with pytest.raises(ValueError, match="length must be at least"):
+            generate_parallel("normal", 10, workers=1, length=4)
+
+        stats = GeneratorStats()
+        stream = generate_parallel(
+            "pattern", 250, workers=1, chunk_size=100, stats=stats, pattern="DD"
+        )
+        assert len(list(stream)) == 250
+        assert stats.snapshot()["timers"]["generate"]["calls"] == 250
+
+    def test_unbounded_stream_can_be_closed(self):
+        """Test count=None streams until the consumer stops."""
+        stream = generate_parallel(
+            "normal", None, workers=2, chunk_size=50, length=20
+        )
+        assert len(list(islice(stream, 120))) == 120
+        stream.close()
+
+    def test_worker_errors_propagate(self):
+        """Test generator validation errors surface in the parent."""
+        with pytest.raises(ValueError, match="length must be at least"):
+            list(generate_parallel("normal", 10, workers=2, length=4))
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"workers": 0}, "workers must be at least 1"),
+            ({"workers": 2, "chunk_size": 0}, "chunk_size must be at least 1"),
+            ({"workers": 2, "stats": GeneratorStats()}, "workers=1"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs, message):
+        """Test invalid pool configuration is rejected eagerly."""
+        with pytest.raises(ValueError, match=message):
+            generate_parallel("normal", 10, **kwargs)
+
+    def test_unknown_generator(self):
+        """Test unknown generator names are rejected eagerly."""
+        with pytest.raises(ValueError, match="Unknown generator"):
+            generate_parallel("nonexistent", 10, workers=2)
+
+    def test_unknown_language_rejected_before_forking(self):
+        """Test language packs are loaded in the parent, ahead of the pool."""
+        with pytest.raises(ValueError, match="Unknown language"):
+            generate_parallel("normal", 10, workers=2, options={"language": "klingon"})
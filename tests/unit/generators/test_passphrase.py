@@ -1,8 +1,11 @@
 """Unit tests for passphrase generator."""
 
+import math
+
 import pytest
 
 from clinkey_cli.generators.passphrase import PassphraseGenerator
+from clinkey_cli.generators.random_source import RandomSource
 
 
 class TestPassphraseGeneratorInit:
@@ -105,3 +108,92 @@ class TestPassphraseValidation:
         """Test invalid wordlist name."""
         with pytest.raises(ValueError, match="Unknown wordlist"):
             PassphraseGenerator(wordlist="invalid")
+
+
+class TestGenerateMany:
+    """Test batch passphrase generation."""
+
+    @pytest.fixture
+    def gen(self):
+        """Provide a PassphraseGenerator instance."""
+        return PassphraseGenerator()
+
+    def test_generate_many_count_and_format(self, gen):
+        """Test every passphrase has word_count known words."""
+        known = {word.capitalize() for word in gen._wordlist}
+        passphrases = gen.generate_many(50, word_count=5, separator="_")
+        assert len(passphrases) == 50
+        for passphrase in passphrases:
+            words = passphrase.split("_")
+            assert len(words) == 5
+            assert set(words) <= known
+
+    def test_generate_many_no_capitalize_matches_generate(self, gen):
+        """Test casing follows the same rule as generate."""
+        single = gen.generate(capitalize=False)
+        batch = gen.generate_many(3, capitalize=False)
+        assert all(p == p.upper() for p in batch + [single])
+
+    def test_generate_many_zero(self, gen):
+        """Test n=0 returns an empty list."""
+        assert gen.generate_many(0) == []
+
+    def test_generate_many_validation(self, gen):
+        """Test invalid counts are rejected."""
+        with pytest.raises(ValueError, match="n must be non-negative"):
+            gen.generate_many(-1)
+        with pytest.raises(ValueError, match="word_count must be at least"):
+            gen.generate_many(5, word_count=2)
+
+    def test_generate_many_numpy_path_matches_python_path(self, monkeypatch):
+        """Test the NumPy path draws the same words as the pure-Python path."""
+        pytest.importorskip("numpy")
+        import clinkey_cli.generators.passphrase as passphrase_module
+
+        def batch(use_numpy):
+            monkeypatch.setattr(passphrase_module, "HAS_NUMPY", use_numpy)
+            source = RandomSource.deterministic(11)
+            return PassphraseGenerator(random_source=source).generate_many(2000)
+
+        assert batch(True) == batch(False)
+
+
+class TestPassphraseEntropy:
+    """Test the closed-form keyspace of passphrases."""
+
+    def test_keyspace_from_wordlist_size(self):
+        """Test every word multiplies the keyspace by the list size."""
+        gen = PassphraseGenerator()
+        assert gen.keyspace(word_count=5) == 7776**5
+        assert gen.entropy_bits(word_count=5) == pytest.approx(5 * math.log2(7776))
+
+    def test_params_for_bits_picks_minimal_word_count(self):
+        """Test the smallest word count reaching the target is chosen."""
+        gen = PassphraseGenerator()
+        params = gen.params_for_bits(60, separator="_")
+        assert params == {"separator": "_", "word_count": 5}
+        assert gen.entropy_bits(word_count=4) < 60 <= gen.entropy_bits(**params)
+
+    def test_params_for_bits_never_lowers_word_count(self):
+        """Test an explicit larger word count is kept."""
+        gen = PassphraseGenerator()
+        assert gen.params_for_bits(10, word_count=7)["word_count"] == 7
+
+    def test_params_for_bits_out_of_reach(self):
+        """Test targets beyond the maximum word count are rejected."""
+        with pytest.raises(ValueError, match="cannot reach 200 bits"):
+            PassphraseGenerator().params_for_bits(200)
+
+
+class TestPassphrasePolicy:
+    """Test compliance by construction."""
+
+    def test_generate_and_generate_many_comply(self):
+        """Test digits are placed into every passphrase."""
+        from clinkey_cli.security.compliance import compile_policy
+
+        policy = compile_policy({"require": {"digit": 1}})
+        gen = PassphraseGenerator()
+        passphrases = gen.generate_many(200, policy=policy)
+        passphrases.append(gen.generate(policy=policy))
+        assert all(policy.check(phrase) for phrase in passphrases)
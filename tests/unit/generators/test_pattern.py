@@ -1,10 +1,17 @@
 """Unit tests for pattern-based password generator."""
 
+import math
 import re
+from itertools import islice
 
 import pytest
 
-from clinkey_cli.generators.pattern import PatternGenerator
+from clinkey_cli.generators.pattern import (
+    PatternGenerator,
+    PatternProgram,
+    compile_pattern,
+)
+from clinkey_cli.generators.random_source import RandomSource
 
 
 class TestPatternGeneratorInit:
@@ -164,3 +171,230 @@ class TestPatternGeneratorValidation:
         """Test generation requires either pattern or length."""
         with pytest.raises(ValueError, match="must provide either pattern or length"):
             gen.generate()
+
+
+class TestPatternCompilation:
+    """Test compile-once pattern programs."""
+
+    def test_compile_returns_immutable_program(self):
+        """Test compiled programs are tuples of tables and literals."""
+        program = PatternGenerator.compile("Cv-[ab]D")
+        assert isinstance(program, PatternProgram)
+        assert isinstance(program.steps, tuple)
+        assert program.steps[1:3] == ("v", "-")
+        assert program.steps[3] == ("a", "b")
+        assert program.steps[4] == tuple("0123456789")
+        assert program.length == 5
+
+    def test_compile_is_cached(self):
+        """Test the same pattern string yields the same program object."""
+        assert PatternGenerator.compile("LLDD") is PatternGenerator.compile("LLDD")
+
+    def test_batch_parses_pattern_once(self):
+        """Test generating a batch compiles the template a single time."""
+        gen = PatternGenerator()
+        pattern = "Cvvc-[abc]-DDDD-unique-batch"
+        misses_before = compile_pattern.cache_info().misses
+        passwords = list(gen.iter_generate(200, pattern=pattern))
+        assert compile_pattern.cache_info().misses == misses_before + 1
+        assert all(p[5] in "abc" for p in passwords)
+
+    @pytest.mark.parametrize("pattern", ["XYZ", "LL[ab", "[]DD", "----"])
+    def test_compile_rejects_invalid_patterns(self, pattern):
+        """Test invalid templates raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid pattern"):
+            PatternGenerator.compile(pattern)
+
+
+class TestPatternGrammar:
+    """Test quantifiers, ranges, negated sets and named classes."""
+
+    def test_quantifier_repeats_atom(self):
+        """Test {n} repeats classes, sets and literals."""
+        program = PatternGenerator.compile("D{8}-{2}[ab]{3}")
+        assert program.length == 13
+        assert program.runs == (
+            (tuple("0123456789"), 8),
+            ("--", 1),
+            (("a", "b"), 3),
+        )
+
+    def test_quantified_output(self):
+        """Test generated passwords follow the expanded program."""
+        gen = PatternGenerator()
+        for _ in range(50):
+            assert re.fullmatch(r"[0-9a-f]{32}", gen.generate(pattern="[a-f0-9]{32}"))
+
+    def test_ranges(self):
+        """Test ranges expand and edge dashes stay literal."""
+        assert PatternGenerator.compile("[a-c0-2]").steps[0] == tuple("abc012")
+        assert PatternGenerator.compile("[-a-c]").steps[0] == tuple("-abc")
+        assert PatternGenerator.compile("[ab-]").steps[0] == tuple("ab-")
+
+    def test_negated_set(self):
+        """Test [^...] draws printable ASCII except the listed characters."""
+        table = PatternGenerator.compile("[^0O1l]").steps[0]
+        assert not set(table) & set("0O1l")
+        assert {"a", "Z", "9", "!"} <= set(table)
+        assert " " not in table
+
+    def test_named_classes(self):
+        """Test [:name:] expands inside sets and combines with characters."""
+        table = PatternGenerator.compile("[[:hex:]_]").steps[0]
+        assert table == tuple("0123456789abcdef_")
+
+    def test_equal_sets_share_tables(self):
+        """Test equal sets compile to one table, merged into one run."""
+        program = PatternGenerator.compile("[a-c][abc]")
+        assert program.runs == ((tuple("abc"), 2),)
+
+    def test_entropy_of_runs(self):
+        """Test keyspace and entropy account for repeated runs."""
+        gen = PatternGenerator()
+        assert gen.keyspace(pattern="D{8}") == 10**8
+        assert gen.entropy_bits(pattern="[[:hex:]]{32}") == pytest.approx(128)
+
+    def test_unquantified_braces_are_literals(self):
+        """Test braces without a count keep their literal meaning."""
+        program = PatternGenerator.compile("{D}")
+        assert program.steps[0] == "{" and program.steps[2] == "}"
+
+    @pytest.mark.parametrize(
+        "pattern, message",
+        [
+            ("[z-a]", "Invalid range"),
+            ("[[:nope:]]", "Unknown named class"),
+            ("[^[:alnum:][:punct:]]", "excludes every character"),
+            ("D{0}", "at least 1"),
+            ("D{5000}", "expands beyond"),
+        ],
+    )
+    def test_invalid_grammar(self, pattern, message):
+        """Test malformed extensions raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            PatternGenerator.compile(pattern)
+
+    def test_pattern_length_from_program(self):
+        """Test lengths come from the compiled program."""
+        gen = PatternGenerator()
+        assert gen.get_pattern_length("L{4}-D{4}") == 9
+        with pytest.raises(ValueError):
+            gen.get_pattern_length("XYZ")
+
+
+class TestColumnwiseBatch:
+    """Test column-wise generation of many passwords from one pattern."""
+
+    def test_generate_many_matches_pattern(self):
+        """Test every password follows the template."""
+        passwords = PatternGenerator().generate_many(500, pattern="vch-[A-Z0-9]{10}")
+        assert len(passwords) == 500
+        assert all(re.fullmatch(r"vch-[A-Z0-9]{10}", p) for p in passwords)
+        assert len(set(passwords)) > 490
+
+    def test_generate_many_empty_and_invalid(self):
+        """Test n=0 returns nothing and bad input still raises."""
+        gen = PatternGenerator()
+        assert gen.generate_many(0, pattern="DDDD") == []
+        with pytest.raises(ValueError):
+            gen.generate_many(-1, pattern="DDDD")
+        with pytest.raises(ValueError, match="Invalid pattern"):
+            gen.generate_many(5, pattern="XYZ")
+
+    @pytest.mark.parametrize("stats", [False, True])
+    def test_iter_generate_ignores_extra_kwargs(self, stats):
+        """Test both stream paths ignore options meant for other generators."""
+        gen = PatternGenerator()
+        if stats:
+            gen.enable_stats()
+        passwords = list(
+            gen.iter_generate(3, pattern="DDDD", lower=True, no_separator=True)
+        )
+        assert len(passwords) == 3
+        assert all(p.isdigit() for p in passwords)
+
+    @pytest.mark.parametrize("pattern", ["vch-[A-Z0-9]{10}", "Cv-é[ab]{3}D", "D"])
+    def test_numpy_path_matches_python_path(self, monkeypatch, pattern):
+        """Test both backends draw the same passwords from the same stream."""
+        pytest.importorskip("numpy")
+        import clinkey_cli.generators.pattern as pattern_module
+
+        def batch(use_numpy):
+            monkeypatch.setattr(pattern_module, "HAS_NUMPY", use_numpy)
+            source = RandomSource.deterministic(5)
+            gen = PatternGenerator(random_source=source)
+            return gen.generate_many(5000, pattern=pattern)
+
+        assert batch(True) == batch(False)
+
+    def test_column_distribution(self):
+        """Test each position of a run draws uniformly from its table."""
+        passwords = PatternGenerator().generate_many(20000, pattern="[ab]{4}")
+        for position in range(4):
+            share = sum(p[position] == "a" for p in passwords) / len(passwords)
+            assert 0.47 < share < 0.53
+
+    def test_generate_many_with_policy_and_rules(self):
+        """Test policies and site rules are honoured in batches."""
+        from clinkey_cli.security.compliance import compile_policy
+
+        gen = PatternGenerator()
+        policy = compile_policy({"require": {"digit": 1}})
+        passwords = gen.generate_many(200, pattern="l{8}", policy=policy)
+        assert all(policy.check(p) for p in passwords)
+        passwords = gen.generate_many(50, rules="required: digit; maxlength: 12")
+        assert all(len(p) == 12 and re.search(r"\d", p) for p in passwords)
+
+    def test_iter_generate_streams_chunks(self):
+        """Test streams yield exact counts and validate eagerly."""
+        gen = PatternGenerator()
+        assert len(list(gen.iter_generate(2500, pattern="D{6}"))) == 2500
+        stream = gen.iter_generate(pattern="D{6}")
+        assert len(list(islice(stream, 3000))) == 3000
+        with pytest.raises(ValueError):
+            gen.iter_generate(5, pattern="XYZ")
+
+
+class TestPatternEntropy:
+    """Test the closed-form keyspace of compiled patterns."""
+
+    def test_keyspace_multiplies_class_sizes(self):
+        """Test each class contributes its table size, literals nothing."""
+        gen = PatternGenerator()
+        assert gen.keyspace(pattern="CV-DD") == 20 * 6 * 10 * 10
+        assert gen.entropy_bits(pattern="DDDD") == pytest.approx(4 * math.log2(10))
+
+    def test_repeated_set_characters(self):
+        """Test duplicate characters in a set skew its entropy."""
+        gen = PatternGenerator()
+        assert gen.keyspace(pattern="[aab]") == 2
+        assert gen.entropy_bits(pattern="[aab]") == pytest.approx(
+            -(2 / 3) * math.log2(2 / 3) - (1 / 3) * math.log2(1 / 3)
+        )
+
+    def test_params_for_bits_checks_pattern(self):
+        """Test patterns cannot grow, so a weak one is rejected."""
+        gen = PatternGenerator()
+        assert gen.params_for_bits(13, pattern="DDDD") == {"pattern": "DDDD"}
+        with pytest.raises(ValueError, match="cannot reach 14 bits"):
+            gen.params_for_bits(14, pattern="DDDD")
+
+    def test_invalid_pattern(self):
+        """Test keyspace validates like generate."""
+        with pytest.raises(ValueError):
+            PatternGenerator().keyspace(pattern="XYZ")
+
+
+class TestPatternPolicy:
+    """Test compliance by construction."""
+
+    def test_literals_kept(self):
+        """Test classes are placed at class positions only."""
+        from clinkey_cli.security.compliance import compile_policy
+
+        policy = compile_policy({"min_classes": 4, "require": {"digit": 2}})
+        gen = PatternGenerator()
+        for _ in range(300):
+            password = gen.generate(pattern="LLLL.LLLL", policy=policy)
+            assert password[4] == "."
+            assert policy.check(password)
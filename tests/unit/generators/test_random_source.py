@@ -0,0 +1,213 @@
+"""Unit tests for the buffered randomness source."""
+
+from collections import Counter
+
+import pytest
+
+from clinkey_cli.generators.passphrase import PassphraseGenerator
+from clinkey_cli.generators.pattern import PatternGenerator
+from clinkey_cli.generators.random_source import (
+    DeterministicSource,
+    RandomSource,
+    default_source,
+    derive_seed,
+)
+from clinkey_cli.generators.syllable import SyllableGenerator
+
+
+class CountingSource(RandomSource):
+    """RandomSource recording how often it hits the OS."""
+
+    def __init__(self, chunk_size: int = 4096) -> None:
+        super().__init__(chunk_size)
+        self.reads = 0
+
+    def _read(self, size: int) -> bytes:
+        self.reads += 1
+        return super()._read(size)
+
+
+class TestRandomSourceSampling:
+    """Test index extraction from the buffer."""
+
+    @pytest.fixture
+    def source(self):
+        """Provide a fresh RandomSource instance."""
+        return RandomSource()
+
+    @pytest.mark.parametrize("n", [2, 7, 26, 255, 256, 257, 7776, 70000, 2**40])
+    def test_indices_within_bounds(self, source, n):
+        """Test indices always fall in [0, n)."""
+        values = source.indices(n, 500)
+        assert len(values) == 500
+        assert all(0 <= value < n for value in values)
+
+    def test_indices_single_value_bound(self, source):
+        """Test n=1 always yields zero."""
+        assert source.indices(1, 5) == [0, 0, 0, 0, 0]
+
+    def test_indices_huge_bound(self, source):
+        """Test bounds wider than 64 bits fall back to big-int sampling."""
+        n = 2**80 + 13
+        assert all(0 <= value < n for value in source.indices(n, 20))
+
+    def test_indices_roughly_uniform(self, source):
+        """Test every value of a small range is drawn with similar frequency."""
+        counts = Counter(source.indices(6, 60000))
+        assert set(counts) == set(range(6))
+        assert all(9000 < count < 11000 for count in counts.values())
+
+    def test_indices_invalid_arguments(self, source):
+        """Test non-positive bounds and negative counts are rejected."""
+        with pytest.raises(ValueError, match="n must be positive"):
+            source.indices(0, 1)
+        with pytest.raises(ValueError, match="k must be non-negative"):
+            source.indices(10, -1)
+
+    def test_choice_and_choices(self, source):
+        """Test choice helpers select from the sequence."""
+        assert source.choice("abc") in "abc"
+        picks = source.choices(("x", "y"), 10)
+        assert len(picks) == 10
+        assert set(picks) <= {"x", "y"}
+
+    def test_choice_empty_sequence(self, source):
+        """Test choosing from an empty sequence raises IndexError."""
+        with pytest.raises(IndexError):
+            source.choice([])
+        with pytest.raises(IndexError):
+            source.choices([], 3)
+
+    def test_token_bytes_length(self, source):
+        """Test token_bytes returns the requested number of bytes."""
+        assert len(source.token_bytes(10)) == 10
+        assert len(source.token_bytes(10000)) == 10000
+
+    def test_invalid_chunk_size(self):
+        """Test chunk size must be positive."""
+        with pytest.raises(ValueError, match="chunk_size must be positive"):
+            RandomSource(chunk_size=0)
+
+
+class TestRandomSourceBuffering:
+    """Test that reads are amortised over large chunks."""
+
+    def test_small_draws_share_one_read(self):
+        """Test many small draws are served from a single OS read."""
+        source = CountingSource(chunk_size=4096)
+        for _ in range(1000):
+            source.randbelow(20)
+        assert source.reads == 1
+
+    def test_reset_discards_buffer(self):
+        """Test reset forces a fresh read."""
+        source = CountingSource()
+        source.randbelow(10)
+        source.reset()
+        source.randbelow(10)
+        assert source.reads == 2
+
+
+class TestGeneratorsUseRandomSource:
+    """Test generators draw from the configured source."""
+
+    def test_generators_default_to_shared_source(self):
+        """Test generators fall back to the module-level default source."""
+        assert SyllableGenerator()._random is default_source
+        assert PassphraseGenerator()._random is default_source
+        assert PatternGenerator()._random is default_source
+
+    @pytest.mark.parametrize(
+        "factory, kwargs",
+        [
+            (SyllableGenerator, {"length": 32, "password_type": "super_strong"}),
+            (PassphraseGenerator, {"word_count": 6}),
+            (PatternGenerator, {"pattern": "Cvvc-DDDD-[xyz]S"}),
+        ],
+    )
+    def test_generators_use_injected_source(self, factory, kwargs):
+        """Test a whole batch is generated from a handful of OS reads."""
+        source = CountingSource()
+        gen = factory(random_source=source)
+        for _ in range(50):
+            gen.generate(**kwargs)
+        assert 1 <= source.reads <= 5
+
+
+class TestDeterministicSource:
+    """Test the seeded HMAC-DRBG source."""
+
+    def test_same_seed_same_stream(self):
+        """Test equal seeds reproduce the exact byte stream."""
+        a = RandomSource.deterministic(1234)
+        b = RandomSource.deterministic(1234)
+        assert a.token_bytes(10000) == b.token_bytes(10000)
+        assert a.indices(7776, 100) == b.indices(7776, 100)
+
+    def test_different_seeds_differ(self):
+        """Test distinct seeds produce unrelated streams."""
+        assert (
+            RandomSource.deterministic("a").token_bytes(32)
+            != RandomSource.deterministic("b").token_bytes(32)
+        )
+
+    def test_bytes_and_int_seeds(self):
+        """Test the seed is kept and int seeds are accepted."""
+        source = DeterministicSource(b"seed")
+        assert source.seed == b"seed"
+        assert RandomSource.deterministic(0).token_bytes(8) != source.token_bytes(8)
+
+    def test_numeric_string_seed_matches_int(self):
+        """Test a command-line seed of digits equals the same int seed."""
+        assert (
+            RandomSource.deterministic("7").token_bytes(32)
+            == RandomSource.deterministic(7).token_bytes(32)
+        )
+        assert derive_seed("7", 3) == derive_seed(7, 3)
+
+    def test_invalid_seed(self):
+        """Test unsupported seed values are rejected."""
+        with pytest.raises(ValueError, match="seed must be non-negative"):
+            RandomSource.deterministic(-1)
+        with pytest.raises(TypeError, match="seed must be int, str or bytes"):
+            RandomSource.deterministic(1.5)
+
+    def test_derive_seed(self):
+        """Test child seeds are stable and distinct per index."""
+        assert derive_seed(7, 0) == derive_seed(7, 0)
+        assert derive_seed(7, 0) != derive_seed(7, 1)
+        assert derive_seed(7, 0) != derive_seed(8, 0)
+
+    @pytest.mark.parametrize(
+        "factory, kwargs",
+        [
+            (SyllableGenerator, {"length": 32, "password_type": "super_strong"}),
+            (PassphraseGenerator, {"word_count": 6}),
+            (PatternGenerator, {"pattern": "Cvvc-DDDD-[xyz]S"}),
+        ],
+    )
+    def test_generators_replay_identical_output(self, factory, kwargs):
+        """Test seeded generators replay the same passwords."""
+        runs = [
+            list(
+                factory(random_source=RandomSource.deterministic(99)).iter_generate(
+                    20, **kwargs
+                )
+            )
+            for _ in range(2)
+        ]
+        assert runs[0] == runs[1]
+        assert len(set(runs[0])) > 1
+
+
+class TestIndicesArray:
+    """Test the optional NumPy-backed sampler."""
+
+    @pytest.mark.parametrize("n", [1, 2, 7, 256, 257, 7776, 70000, 2**40, 2**64])
+    def test_matches_indices(self, n):
+        """Test both samplers return the same values from the same stream."""
+        pytest.importorskip("numpy")
+        expected = RandomSource.deterministic(3).indices(n, 2000)
+        assert RandomSource.deterministic(3).indices_array(n, 2000).tolist() == (
+            expected
+        )
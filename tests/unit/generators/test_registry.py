@@ -1,11 +1,15 @@
 """Unit tests for generator registry."""
 
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from clinkey_cli.generators.base import BaseGenerator
 from clinkey_cli.generators.passphrase import PassphraseGenerator
 from clinkey_cli.generators.pattern import PatternGenerator
-from clinkey_cli.generators.registry import GeneratorRegistry
+from clinkey_cli.generators.registry import GeneratorRegistry, _freeze
 from clinkey_cli.generators.syllable import SyllableGenerator
 
 
@@ -54,6 +58,142 @@ class TestGeneratorRegistry:
         assert "pattern" in generators
 
 
+class TestLazyRegistration:
+    """Test generators registered by module reference."""
+
+    def test_lazy_reference_resolved_on_get(self):
+        """Test a 'module:Class' reference resolves to the class."""
+        registry = GeneratorRegistry()
+        registry.register("lazy", "clinkey_cli.generators.pattern:PatternGenerator")
+        assert "lazy" in registry.list_generators()
+        assert registry.get("lazy") is PatternGenerator
+        assert registry._generators["lazy"] is PatternGenerator
+
+    def test_invalid_lazy_reference(self):
+        """Test references without a class name are rejected."""
+        registry = GeneratorRegistry()
+        with pytest.raises(ValueError, match="Invalid generator reference"):
+            registry.register("broken", "clinkey_cli.generators.pattern")
+
+    def test_unknown_lazy_class_fails_on_get(self):
+        """Test a missing class surfaces when the generator is requested."""
+        registry = GeneratorRegistry()
+        registry.register("missing", "clinkey_cli.generators.pattern:Nope")
+        with pytest.raises(AttributeError):
+            registry.get("missing")
+
+
+class TestEntryPointDiscovery:
+    """Test plugin generators advertised through entry points."""
+
+    def test_plugin_discovered_lazily(self, plugin_path):
+        """Test plugins are listed without importing their module."""
+        registry = GeneratorRegistry(entry_point_group="clinkey.generators")
+        assert "token" in registry.list_generators()
+        assert "clinkey_token_plugin" not in sys.modules
+
+        generator = registry.get("token")()
+        assert generator.generate(length=3) == "TOKEN-XXX"
+
+    def test_plugin_cannot_shadow_registered_name(self, plugin_path):
+        """Test registered generators win over plugins of the same name."""
+        registry = GeneratorRegistry(entry_point_group="clinkey.generators")
+        registry.register("normal", SyllableGenerator)
+        registry.discover()
+        assert registry.get("normal") is SyllableGenerator
+
+    def test_registered_names_skip_discovery(self, plugin_path):
+        """Test known names resolve without scanning entry points."""
+        registry = GeneratorRegistry(entry_point_group="clinkey.generators")
+        registry.register("pattern", PatternGenerator)
+        assert registry.get("pattern") is PatternGenerator
+        assert registry.known_names() == ["pattern"]
+        assert "token" in registry
+        assert "token" in registry.known_names()
+
+    def test_discovery_disabled_without_group(self, plugin_path):
+        """Test registries without a group never scan entry points."""
+        registry = GeneratorRegistry()
+        assert "token" not in registry
+
+
+class TestCreate:
+    """Test cached generator instances."""
+
+    @pytest.fixture
+    def registry(self):
+        """Provide a registry with the built-in generators."""
+        registry = GeneratorRegistry()
+        registry.register("normal", SyllableGenerator)
+        registry.register("strong", SyllableGenerator)
+        registry.register("passphrase", PassphraseGenerator)
+        registry.register("pattern", PatternGenerator)
+        return registry
+
+    def test_create_returns_shared_instance(self, registry):
+        """Test repeated calls return the same warm instance."""
+        gen = registry.create("pattern")
+        assert isinstance(gen, PatternGenerator)
+        assert registry.create("pattern") is gen
+
+    def test_create_normalizes_configuration(self, registry):
+        """Test defaults, aliases and path types map to one instance."""
+        assert registry.create("normal") is registry.create("strong")
+        assert registry.create("passphrase") is registry.create(
+            "passphrase", wordlist="eff_large"
+        )
+        assert registry.create("normal") is not registry.create(
+            "normal", language="french"
+        )
+
+    def test_create_rejects_unknown_options(self, registry):
+        """Test configuration must match the constructor."""
+        with pytest.raises(TypeError):
+            registry.create("pattern", colour="blue")
+
+    def test_create_evicts_least_recently_used(self, registry, monkeypatch):
+        """Test the cache stays bounded."""
+        monkeypatch.setattr("clinkey_cli.generators.registry.INSTANCE_CACHE_SIZE", 2)
+        first = registry.create("pattern")
+        registry.create("normal")
+        registry.create("pattern")
+        registry.create("normal", language="french")
+
+        assert registry.create("pattern") is first
+        assert len(registry._instances) == 2
+
+    def test_shared_instance_cannot_be_instrumented(self, registry):
+        """Test stats are refused on cached instances, not on private ones."""
+        with pytest.raises(RuntimeError, match="shared PatternGenerator"):
+            registry.create("pattern").enable_stats()
+
+        assert registry.create("pattern")._stats is None
+        registry.get("pattern")().enable_stats()
+
+    def test_create_key_mixes_set_item_types(self):
+        """Test sets of mixed, mutually unordered items are cacheable."""
+        assert _freeze({1, "a", None}) == _freeze({None, "a", 1})
+
+    def test_clear_instances(self, registry):
+        """Test clearing forces a fresh instance."""
+        gen = registry.create("pattern")
+        registry.clear_instances()
+        assert registry.create("pattern") is not gen
+
+    def test_create_is_thread_safe(self, registry):
+        """Test concurrent callers all receive the same instance."""
+        barrier = threading.Barrier(8)
+
+        def create():
+            barrier.wait()
+            return registry.create("passphrase", wordlist="eff_large")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            instances = list(executor.map(lambda _: create(), range(8)))
+
+        assert all(instance is instances[0] for instance in instances)
+
+
 class TestDefaultRegistry:
     """Test default global registry."""
 
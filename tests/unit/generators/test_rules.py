@@ -0,0 +1,168 @@
+"""Unit tests for site password rules."""
+
+import re
+import string
+
+import pytest
+
+from clinkey_cli.generators.pattern import PatternGenerator, PatternProgram
+from clinkey_cli.generators.random_source import RandomSource
+from clinkey_cli.generators.rules import (
+    DEFAULT_RULES_LENGTH,
+    compile_rules,
+    draw_limited,
+    parse_rules,
+)
+
+SITE_RULES = (
+    "minlength: 12; maxlength: 24; required: upper; required: digit; "
+    "required: [-_.]; allowed: lower; max-consecutive: 2;"
+)
+
+
+class TestParseRules:
+    """Test the passwordrules parser."""
+
+    def test_full_rules(self):
+        """Test every supported property is parsed."""
+        rules = parse_rules(SITE_RULES)
+        assert rules.required == (
+            tuple(string.ascii_uppercase),
+            tuple(string.digits),
+            ("-", ".", "_"),
+        )
+        assert set(rules.allowed) == set(
+            string.ascii_letters + string.digits + "-_."
+        )
+        assert (rules.min_length, rules.max_length) == (12, 24)
+        assert rules.max_consecutive == 2
+
+    def test_defaults_to_ascii_printable(self):
+        """Test rules without character sets allow all printable ASCII."""
+        rules = parse_rules("minlength: 8")
+        assert len(rules.allowed) == 94
+        assert rules.required == ()
+
+    def test_repeated_properties_combine(self):
+        """Test the strictest bounds win and allowed sets merge."""
+        rules = parse_rules(
+            "allowed: digit; allowed: [ab]; maxlength: 20; maxlength: 10; "
+            "minlength: 4; minlength: 6; max-consecutive: 3; max-consecutive: 2"
+        )
+        assert rules.allowed == tuple(string.digits + "ab")
+        assert (rules.min_length, rules.max_length, rules.max_consecutive) == (
+            6,
+            10,
+            2,
+        )
+
+    def test_custom_sets_may_hold_delimiters(self):
+        """Test ';' and ',' inside a custom set are characters, not separators."""
+        rules = parse_rules("required: [;,]; allowed: []x]")
+        assert rules.required == ((",", ";"),)
+        assert rules.allowed == (",", ";", "]", "x")
+
+    def test_case_and_unknown_properties(self):
+        """Test property names are case-insensitive and unknown ones ignored."""
+        rules = parse_rules("REQUIRED: Digit; future-rule: 3")
+        assert rules.required == (tuple(string.digits),)
+
+    def test_cached_by_rule_string(self):
+        """Test parsing happens once per rule string."""
+        assert parse_rules(SITE_RULES) is parse_rules(SITE_RULES)
+
+    @pytest.mark.parametrize(
+        "rules",
+        [
+            "required upper",
+            "required: emoji",
+            "required: [abc",
+            "allowed: []",
+            "maxlength: ten",
+            "max-consecutive: 0",
+            "minlength: 10; maxlength: 8",
+            "required: upper; required: digit; maxlength: 1",
+            "allowed: [a]; max-consecutive: 2",
+            "required: [a]; allowed: [ab]; max-consecutive: 1",
+        ],
+    )
+    def test_invalid_rules(self, rules):
+        """Test malformed or unsatisfiable rules are rejected."""
+        with pytest.raises(ValueError):
+            parse_rules(rules)
+
+
+class TestCompileRules:
+    """Test compilation into pattern programs."""
+
+    def test_program_uses_pattern_steps(self):
+        """Test rules compile to one allowed-alphabet step per character."""
+        compiled = compile_rules(SITE_RULES, 16)
+        assert isinstance(compiled.program, PatternProgram)
+        assert compiled.length == 16
+        assert set(compiled.program.steps) == {parse_rules(SITE_RULES).allowed}
+
+    @pytest.mark.parametrize(
+        ("length", "expected"),
+        [(None, DEFAULT_RULES_LENGTH), (4, 12), (40, 24), (20, 20)],
+    )
+    def test_length_clamped(self, length, expected):
+        """Test the length is clamped to minlength and maxlength."""
+        assert compile_rules(SITE_RULES, length).length == expected
+
+    def test_cached(self):
+        """Test programs are cached by rule string and length."""
+        assert compile_rules(SITE_RULES, 16) is compile_rules(SITE_RULES, 16)
+
+    def test_keyspace(self):
+        """Test the keyspace counts required and free positions."""
+        compiled = compile_rules("required: digit; allowed: [ab]; maxlength: 3")
+        assert compiled.keyspace == 10 * 12**2
+
+
+class TestRulesGeneration:
+    """Test sampling passwords from compiled rules."""
+
+    def test_every_password_complies(self):
+        """Test required classes and run limits hold without rejection."""
+        gen = PatternGenerator()
+        for _ in range(1000):
+            password = gen.generate(rules=SITE_RULES, length=16)
+            assert len(password) == 16
+            assert re.search(r"[A-Z]", password)
+            assert re.search(r"\d", password)
+            assert re.search(r"[-_.]", password)
+            assert not re.search(r"(.)\1\1", password)
+            assert set(password) <= set(parse_rules(SITE_RULES).allowed)
+
+    def test_run_limit_with_forced_character(self):
+        """Test a single-character requirement never forces a long run."""
+        gen = PatternGenerator()
+        rules = "required: [x]; allowed: [xyz]; max-consecutive: 1"
+        for _ in range(500):
+            password = gen.generate(rules=rules, length=20)
+            assert "x" in password
+            assert not re.search(r"(.)\1", password)
+
+    def test_required_positions_vary(self):
+        """Test required sets are not pinned to fixed positions."""
+        gen = PatternGenerator()
+        rules = "required: digit; allowed: lower; maxlength: 8"
+        positions = {
+            re.search(r"\d", gen.generate(rules=rules, length=8)).start()
+            for _ in range(500)
+        }
+        assert len(positions) == 8
+
+    def test_reproducible_with_seed(self):
+        """Test rules draw from the generator's random source."""
+        first = PatternGenerator(RandomSource.deterministic(3))
+        second = PatternGenerator(RandomSource.deterministic(3))
+        assert first.generate(rules=SITE_RULES) == second.generate(rules=SITE_RULES)
+
+    def test_draw_limited_without_runs(self):
+        """Test draw_limited keeps runs within the limit."""
+        source = RandomSource()
+        tables = [("a", "b")] * 50
+        for _ in range(200):
+            assert not re.search(r"(.)\1\1", draw_limited(tables, 2, source.randbelow))
@@ -0,0 +1,77 @@
+"""Unit tests for compiled generation specs."""
+
+from itertools import islice, product
+
+import pytest
+
+from clinkey_cli.generators.spec import GenerationSpec, compile_translation
+
+
+def _chained(password, lower, no_separator, separator, removed=""):
+    """Reference: the replace()/lower() chain the table replaces."""
+    if no_separator:
+        for char in "-_" + removed:
+            password = password.replace(char, "")
+    elif separator is not None:
+        password = password.replace("-", separator).replace("_", separator)
+    return password.lower() if lower else password
+
+
+class TestCompileTranslation:
+    """Test separator and case transforms folded into one table."""
+
+    @pytest.mark.parametrize(
+        "lower, no_separator, separator, removed",
+        list(product((False, True), (False, True), (None, ".", "X"), ("", "X"))),
+    )
+    def test_matches_chained_transforms(self, lower, no_separator, separator, removed):
+        """Test one translate pass equals the sequential transforms."""
+        password = "AB-CD_EF.GH-X9!"
+        table = compile_translation(lower, no_separator, separator, removed)
+        expected = _chained(password, lower, no_separator, separator, removed)
+        assert password.translate(table) == expected
+
+    def test_identity_is_empty(self):
+        """Test no transform compiles to an empty table."""
+        assert compile_translation() == {}
+
+    def test_cached(self):
+        """Test identical options share one table."""
+        assert compile_translation(True, separator=".") is compile_translation(
+            True, separator="."
+        )
+
+
+class TestGenerationSpec:
+    """Test the compiled pipeline."""
+
+    def test_pipeline_order(self):
+        """Test strip, translate then finish run in order."""
+        spec = GenerationSpec(
+            produce=lambda: "-AB-CD-",
+            table=compile_translation(lower=True, separator="."),
+            strip="-",
+            finish=str.upper,
+        )
+        assert spec() == "AB.CD"
+
+    def test_execute(self):
+        """Test execute returns exactly n passwords."""
+        spec = GenerationSpec(produce=lambda: "AB", table={})
+        assert spec.execute(3) == ["AB", "AB", "AB"]
+        assert spec.execute(0) == []
+        with pytest.raises(ValueError):
+            spec.execute(-1)
+
+    def test_stream(self):
+        """Test stream is lazy and unbounded by default."""
+        calls = []
+
+        def produce():
+            calls.append(None)
+            return "AB"
+
+        stream = GenerationSpec(produce=produce, table={}).stream()
+        assert calls == []
+        assert list(islice(stream, 5)) == ["AB"] * 5
+        assert len(calls) == 5
@@ -0,0 +1,137 @@
+"""Unit tests for opt-in generator statistics."""
+
+import threading
+
+import pytest
+
+from clinkey_cli.generators.passphrase import PassphraseGenerator
+from clinkey_cli.generators.pattern import PatternGenerator
+from clinkey_cli.generators.stats import GeneratorStats, timed
+from clinkey_cli.generators.syllable import SyllableGenerator
+
+
+class TestGeneratorStats:
+    """Test the thread-safe collector."""
+
+    def test_counters_and_timers(self):
+        """Test counters add up and timers count calls."""
+        stats = GeneratorStats()
+        stats.add("retries")
+        stats.add("retries", 4)
+        stats.record("generate", 1_500)
+        stats.record("generate", 500)
+
+        assert stats.snapshot() == {
+            "counters": {"retries": 5},
+            "timers": {"generate": {"calls": 2, "seconds": 2e-6}},
+        }
+
+        stats.reset()
+        assert stats.snapshot() == {"counters": {}, "timers": {}}
+
+    def test_concurrent_updates(self):
+        """Test no increment is lost across threads."""
+        stats = GeneratorStats()
+
+        def worker():
+            for _ in range(5_000):
+                stats.add("hits")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert stats.snapshot()["counters"]["hits"] == 40_000
+
+    def test_timed_records_failures(self):
+        """Test calls raising an exception are still timed."""
+        stats = GeneratorStats()
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            timed("fail", fail, stats)()
+        assert stats.snapshot()["timers"]["fail"]["calls"] == 1
+
+
+class TestGeneratorInstrumentation:
+    """Test stats collection on generators."""
+
+    def test_disabled_by_default(self):
+        """Test generators collect nothing until enabled."""
+        gen = PatternGenerator()
+        gen.generate(pattern="DDDD")
+        assert gen.stats() == {"counters": {}, "timers": {}}
+        assert "generate" not in vars(gen)
+
+    def test_enable_times_generate(self):
+        """Test every generate call is timed, including batches."""
+        gen = PatternGenerator()
+        stats = gen.enable_stats()
+        gen.generate(pattern="DDDD")
+        list(gen.iter_generate(9, pattern="DDDD"))
+
+        assert stats.snapshot()["timers"]["generate"]["calls"] == 10
+        assert gen.stats() == stats.snapshot()
+
+    def test_enable_only_affects_instance(self):
+        """Test other instances stay uninstrumented."""
+        instrumented = PatternGenerator()
+        other = PatternGenerator()
+        instrumented.enable_stats()
+        other.generate(pattern="D")
+        assert other.stats()["timers"] == {}
+
+    def test_disable(self):
+        """Test disabling restores the plain method."""
+        gen = PatternGenerator()
+        gen.enable_stats()
+        gen.disable_stats()
+        gen.generate(pattern="D")
+        assert gen.stats() == {"counters": {}, "timers": {}}
+        assert "generate" not in vars(gen)
+
+    def test_shared_collector(self):
+        """Test one collector aggregates several generators."""
+        stats = GeneratorStats()
+        first = PatternGenerator()
+        second = PatternGenerator()
+        first.enable_stats(stats)
+        second.enable_stats(stats)
+        first.generate(pattern="D")
+        second.generate(pattern="D")
+        assert stats.snapshot()["timers"]["generate"]["calls"] == 2
+
+    def test_syllable_counters(self):
+        """Test truncation and extension words are counted."""
+        gen = SyllableGenerator()
+        gen.enable_stats()
+        for _ in range(50):
+            gen.generate(16)
+            gen.generate(120)
+
+        counters = gen.stats()["counters"]
+        assert counters["fit_to_length.truncated_chars"] > 0
+        assert counters["extension_words"] > 0
+
+    def test_policy_adjustments_counted(self):
+        """Test passwords changed by a policy are counted."""
+        from clinkey_cli.security.compliance import compile_policy
+
+        gen = PatternGenerator()
+        gen.enable_stats()
+        policy = compile_policy({"require": {"digit": 1}})
+        gen.generate(pattern="LLLL", policy=policy)
+        gen.generate(pattern="DDDD", policy=policy)
+
+        assert gen.stats()["counters"]["policy.adjusted"] == 1
+
+    def test_passphrase_batch_counters(self):
+        """Test generate_many counts the words it draws."""
+        gen = PassphraseGenerator()
+        gen.enable_stats()
+        gen.generate_many(10, word_count=5)
+        assert gen.stats()["counters"]["generate_many.words"] == 50
@@ -1,10 +1,16 @@
 """Unit tests for syllable-based password generator."""
 
 import re
+from itertools import product
 
 import pytest
 
-from clinkey_cli.generators.syllable import SyllableGenerator
+from clinkey_cli.generators.syllable import (
+    _WORD_LENGTH_SHAPES,
+    MAX_PASSWORD_LENGTH,
+    MIN_PASSWORD_LENGTH,
+    SyllableGenerator,
+)
 
 
 def _assert_word_pattern(password: str, gen: SyllableGenerator):
@@ -170,3 +176,175 @@ class TestSyllableGeneratorValidation:
         """Test invalid password type raises ValueError."""
         with pytest.raises(ValueError, match="Unsupported type"):
             gen.generate(length=16, password_type="invalid")
+
+
+class TestSyllableTables:
+    """Test class-level precomputed tables."""
+
+    def test_tables_shared_between_instances(self):
+        """Test instances reuse the same frozen tables."""
+        first, second = SyllableGenerator(), SyllableGenerator()
+        assert first._simple_syllables is second._simple_syllables
+        assert first._all_syllables is second._all_syllables
+        assert isinstance(first._complex_syllables, tuple)
+
+    def test_all_syllables_is_uppercased_union(self):
+        """Test the combined pool covers both syllable sets."""
+        gen = SyllableGenerator()
+        expected = [s.upper() for s in gen._simple_syllables + gen._complex_syllables]
+        assert list(gen._all_syllables) == expected
+
+    def test_word_length_shapes_match_rejection_rules(self):
+        """Test enumerated shapes are exactly those the old loop accepted."""
+        accepted = []
+        for shape in product((1, 2, 3, 4), repeat=4):
+            lengths = list(shape)
+            if lengths.count(1) > 1 or max(lengths) < 3:
+                continue
+            if len(set(lengths)) == 1:
+                continue
+            if sum(1 for length in lengths if length >= 2) < 3:
+                continue
+            accepted.append(shape)
+        assert _WORD_LENGTH_SHAPES == tuple(accepted)
+
+    def test_random_word_lengths_single_draw(self):
+        """Test word lengths come from the enumerated shapes."""
+        gen = SyllableGenerator()
+        for _ in range(50):
+            assert tuple(gen._random_word_lengths()) in _WORD_LENGTH_SHAPES
+
+
+class TestExactLengthAssembly:
+    """Test incremental word extension up to the target length."""
+
+    @pytest.fixture
+    def gen(self):
+        """Provide a fresh SyllableGenerator instance."""
+        return SyllableGenerator()
+
+    @pytest.mark.parametrize("length", [16, 17, 63, 100, 128])
+    @pytest.mark.parametrize("password_type", ["normal", "strong", "super_strong"])
+    def test_exact_length_all_types(self, gen, length, password_type):
+        """Test every type reaches the exact requested length."""
+        for _ in range(20):
+            password = gen.generate(length=length, password_type=password_type)
+            assert len(password) == length
+
+    def test_extension_draws_only_needed_syllables(self, gen):
+        """Test the last word overshoots by less than one syllable."""
+        for target in range(20, 129):
+            words = gen._extend_words_to_length(["ABCD"], target, "-")
+            assembled = len("-".join(words))
+            # Longest syllable is three characters
+            assert target <= assembled < target + 3
+
+    def test_extension_words_are_unique(self, gen):
+        """Test extension never repeats a word."""
+        words = gen._extend_words_to_length(["ABCD"], 128, "-")
+        non_empty = [word for word in words if word]
+        assert len(non_empty) == len(set(non_empty))
+
+    def test_extension_separator_only_tail(self, gen):
+        """Test no syllables are drawn when only the separator fits."""
+        assert gen._extend_words_to_length(["ABCD"], 5, "-") == ["ABCD", ""]
+
+
+class TestSyllableEntropy:
+    """Test the conservative closed-form keyspace."""
+
+    TYPES = ("normal", "strong", "super_strong")
+
+    @pytest.mark.parametrize("password_type", TYPES)
+    def test_keyspace_grows_with_length(self, password_type):
+        """Test longer passwords never have a smaller keyspace."""
+        gen = SyllableGenerator()
+        sizes = [
+            gen.keyspace(length, password_type)
+            for length in range(MIN_PASSWORD_LENGTH, MAX_PASSWORD_LENGTH + 1)
+        ]
+        assert sizes == sorted(sizes)
+        assert sizes[-1] > sizes[0]
+
+    def test_digits_add_entropy(self):
+        """Test the digit block of strong passwords is counted."""
+        gen = SyllableGenerator()
+        assert gen.entropy_bits(length=16, password_type="strong") > gen.entropy_bits(
+            length=16
+        )
+
+    def test_removed_separators_collapse_specials(self):
+        """Test '-' and '_' specials count once when separators are removed."""
+        gen = SyllableGenerator()
+        kept = gen.keyspace(20, "super_strong")
+        removed = gen.keyspace(20, "super_strong", no_separator=True)
+        assert removed * 15 == kept * 14
+
+    @pytest.mark.parametrize("password_type", TYPES)
+    def test_params_for_bits_picks_minimal_length(self, password_type):
+        """Test the chosen length is the first one reaching the target."""
+        gen = SyllableGenerator()
+        params = gen.params_for_bits(
+            100, length=16, password_type=password_type, lower=True
+        )
+        length = params["length"]
+        assert params["lower"] is True
+        assert gen.entropy_bits(length=length, password_type=password_type) >= 100
+        assert gen.entropy_bits(length=length - 1, password_type=password_type) < 100
+
+    def test_params_for_bits_never_lowers_length(self):
+        """Test an explicit longer length is kept."""
+        assert SyllableGenerator().params_for_bits(10, length=40)["length"] == 40
+
+    def test_params_for_bits_out_of_reach(self):
+        """Test targets beyond the maximum length are rejected."""
+        with pytest.raises(ValueError, match="cannot reach 1000 bits"):
+            SyllableGenerator().params_for_bits(1000)
+
+    def test_keyspace_validates(self):
+        """Test keyspace rejects what generate rejects."""
+        with pytest.raises(ValueError):
+            SyllableGenerator().keyspace(8)
+        with pytest.raises(ValueError):
+            SyllableGenerator().keyspace(16, "weird")
+
+
+class TestSyllablePolicy:
+    """Test compliance by construction."""
+
+    @pytest.mark.parametrize("options", [{}, {"lower": True}, {"no_separator": True}])
+    def test_every_password_complies(self, options):
+        """Test OWASP's 3-of-4 rule holds on the first attempt."""
+        from clinkey_cli.security.compliance import compile_policy
+
+        policy = compile_policy("owasp")
+        gen = SyllableGenerator()
+        for _ in range(300):
+            password = gen.generate(16, policy=policy, **options)
+            assert len(password) <= 16
+            assert policy.check(password)
+
+
+class TestSyllableSpec:
+    """Test options validated once and compiled into a spec."""
+
+    def test_compile_validates(self):
+        """Test invalid options fail at compile time."""
+        gen = SyllableGenerator()
+        with pytest.raises(ValueError):
+            gen.compile(MIN_PASSWORD_LENGTH - 1)
+        with pytest.raises(ValueError):
+            gen.compile(20, "invalid")
+
+    def test_execute_applies_transforms(self):
+        """Test the spec lowercases and swaps separators in one pass."""
+        spec = SyllableGenerator().compile(40, "strong", lower=True, separator=".")
+        for password in spec.execute(50):
+            assert len(password) == 40
+            assert password == password.lower()
+            assert "-" not in password
+
+    def test_iter_generate_validates_eagerly(self):
+        """Test iter_generate rejects bad options before the first password."""
+        with pytest.raises(ValueError):
+            SyllableGenerator().iter_generate(5, length=1)
@@ -0,0 +1,65 @@
+"""Unit tests for memory-bounded batch deduplication."""
+
+import pytest
+
+from clinkey_cli.generators.unique import UniqueFilter
+
+
+class TestUniqueFilterInMemory:
+    """Test deduplication while digests fit in memory."""
+
+    def test_filter_rejects_duplicates(self):
+        """Test duplicates are dropped and counted."""
+        with UniqueFilter() as seen:
+            result = list(seen.filter(["a", "b", "a", "c", "b"]))
+            assert result == ["a", "b", "c"]
+            assert seen.accepted == 3
+            assert seen.rejected == 2
+            assert not seen.spilled
+
+    def test_passwords_are_not_stored(self):
+        """Test only fixed-size digests are kept."""
+        with UniqueFilter() as seen:
+            seen.add("correct-horse")
+            assert "correct-horse" not in seen._seen
+            assert all(len(digest) == 16 for digest in seen._seen)
+
+    def test_invalid_memory_limit(self):
+        """Test the memory budget must be positive."""
+        with pytest.raises(ValueError, match="memory_limit_mb must be positive"):
+            UniqueFilter(memory_limit_mb=0)
+
+
+class TestUniqueFilterSpill:
+    """Test the switch to the on-disk index."""
+
+    def test_spills_past_memory_limit(self, tmp_path):
+        """Test digests move to disk and deduplication stays exact."""
+        seen = UniqueFilter(memory_limit_mb=1, directory=tmp_path)
+        limit = seen.max_memory_entries
+        values = [f"pw-{i}" for i in range(limit + 500)]
+
+        assert list(seen.filter(values)) == values
+        assert seen.spilled
+        assert seen._seen == set()
+
+        # Values seen before and after the spill are both rejected
+        assert not seen.add("pw-0")
+        assert not seen.add(f"pw-{limit + 499}")
+        assert seen.add("fresh")
+        assert seen.rejected == 2
+
+        seen.close()
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestUniqueFilterExhaustion:
+    """Test small keyspaces cannot loop forever."""
+
+    def test_exhausted_keyspace_raises(self):
+        """Test a long run of duplicates aborts the stream."""
+        source = (str(i % 3) for i in range(1000))
+        with UniqueFilter() as seen:
+            with pytest.raises(ValueError, match="keyspace exhausted"):
+                list(seen.filter(source, max_consecutive_rejections=50))
+            assert seen.accepted == 3
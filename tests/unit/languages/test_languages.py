@@ -0,0 +1,183 @@
+"""Unit tests for syllable language packs."""
+
+import json
+import marshal
+import os
+import re
+
+import pytest
+
+import clinkey_cli.languages as languages
+from clinkey_cli.generators.syllable import SyllableGenerator
+from clinkey_cli.languages import (
+    SyllablePack,
+    available_languages,
+    compile_pack,
+    load_language,
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep compiled packs out of the real home directory."""
+    path = tmp_path / "cache"
+    monkeypatch.setattr(languages, "CACHE_DIR", path)
+    load_language.cache_clear()
+    yield path
+    load_language.cache_clear()
+
+
+class TestBundledPacks:
+    """Test the packs shipped with the package."""
+
+    def test_available(self):
+        """Test the EU packs are bundled."""
+        assert {"french", "german", "italian", "spanish"} <= set(available_languages())
+
+    @pytest.mark.parametrize("language", ["french", "german", "italian", "spanish"])
+    def test_pack_compiles(self, language):
+        """Test every pack compiles into frozen, ASCII tables."""
+        pack = load_language(language)
+        assert isinstance(pack, SyllablePack)
+        assert all(isinstance(table, tuple) for table in pack[1:])
+        assert all(re.fullmatch(r"[A-Z]{2,}", s) for s in pack.all_syllables)
+        assert len(pack.all_syllables) == len(set(pack.all_syllables))
+
+    def test_unknown_language(self):
+        """Test unknown names list the valid ones."""
+        with pytest.raises(ValueError, match="Valid languages: english, "):
+            load_language("klingon")
+
+
+class TestCompilePack:
+    """Test compiling pack data files."""
+
+    def test_cross_products(self):
+        """Test onsets, codas and clusters expand into complex syllables."""
+        pack = compile_pack(
+            "demo",
+            {
+                "consonants": "bd",
+                "vowels": "ae",
+                "onsets": ["tr"],
+                "codas": ["n"],
+                "clusters": ["tra", "oui"],
+            },
+        )
+        assert pack.simple_syllables == ("ba", "be", "da", "de")
+        assert pack.complex_syllables == ("TRA", "TRE", "AN", "EN", "OUI")
+        assert pack.all_syllables[:4] == ("BA", "BE", "DA", "DE")
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"vowels": ""},
+            {"onsets": ["é"]},
+            {"codas": "nt"},
+            {"clusters": ["o"]},
+            {"extra": []},
+        ],
+    )
+    def test_invalid_data(self, change):
+        """Test malformed packs raise ValueError."""
+        data = {
+            "consonants": "bd",
+            "vowels": "a",
+            "onsets": ["tr"],
+            "codas": [],
+            "clusters": [],
+        }
+        with pytest.raises(ValueError, match="Invalid language pack"):
+            compile_pack("demo", {**data, **change})
+
+
+class TestPackCaching:
+    """Test per-process and on-disk caching of compiled packs."""
+
+    def test_cached_per_process(self):
+        """Test a pack is compiled once and shared."""
+        assert load_language("french") is load_language("french")
+
+    def test_disk_cache_reused(self, cache_dir, monkeypatch):
+        """Test later processes load the compiled tables from disk."""
+        pack = load_language("german")
+        assert list(cache_dir.iterdir())
+
+        load_language.cache_clear()
+        monkeypatch.setattr(languages, "compile_pack", pytest.fail)
+        assert load_language("german") == pack
+
+    def test_corrupt_cache_recompiled(self, cache_dir):
+        """Test an unreadable cache is rebuilt instead of failing."""
+        pack = load_language("italian")
+        (cache := next(cache_dir.iterdir())).write_bytes(b"garbage")
+
+        load_language.cache_clear()
+        assert load_language("italian") == pack
+        _, tables = marshal.loads(cache.read_bytes())
+        assert SyllablePack(*tables) == pack
+
+    def test_cache_rebuilt_when_data_replaced(self, tmp_path, monkeypatch):
+        """Test a data file replaced with its mtime preserved is recompiled."""
+        monkeypatch.setattr(languages, "PACKS_DIR", tmp_path)
+        data = tmp_path / "demo.json"
+        pack = {"consonants": "bd", "vowels": "a", "onsets": [], "codas": []}
+        data.write_text(json.dumps({**pack, "clusters": ["oi"]}), encoding="utf-8")
+        assert load_language("demo").complex_syllables == ("OI",)
+
+        before = data.stat()
+        data.write_text(json.dumps({**pack, "clusters": ["ou"]}), encoding="utf-8")
+        os.utime(data, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+        load_language.cache_clear()
+        assert load_language("demo").complex_syllables == ("OU",)
+
+    def test_unwritable_cache_ignored(self, tmp_path, monkeypatch):
+        """Test packs still load when the cache directory is unusable."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setattr(languages, "CACHE_DIR", blocker / "cache")
+        assert load_language("spanish").language == "spanish"
+
+    def test_bundled_data_is_valid_json(self):
+        """Test every data file decodes and compiles."""
+        for language in available_languages():
+            source = languages.PACKS_DIR / f"{language}.json"
+            compile_pack(language, json.loads(source.read_text(encoding="utf-8")))
+
+
+class TestSyllableGeneratorLanguages:
+    """Test generating passwords from language packs."""
+
+    @pytest.mark.parametrize("language", ["french", "german", "italian", "spanish"])
+    def test_generate(self, language):
+        """Test passwords draw their words from the pack's syllables."""
+        gen = SyllableGenerator(language=language)
+        pack = load_language(language)
+        assert gen._all_syllables is pack.all_syllables
+        for _ in range(20):
+            password = gen.generate(24, "strong")
+            assert len(password) == 24
+            assert re.fullmatch(r"\d\d[A-Z-]+", password)
+
+    def test_instances_share_tables(self):
+        """Test instances of one language share the compiled tables."""
+        first = SyllableGenerator(language="french")
+        second = SyllableGenerator(language="french")
+        assert first._complex_syllables is second._complex_syllables
+
+    def test_english_unchanged(self):
+        """Test English keeps the built-in class tables."""
+        gen = SyllableGenerator()
+        assert "_all_syllables" not in vars(gen)
+
+    def test_keyspace_uses_pack(self):
+        """Test the entropy floor follows the pack's cluster inventory."""
+        english = SyllableGenerator().keyspace(24)
+        french = SyllableGenerator(language="french").keyspace(24)
+        assert english != french
+
+    def test_unknown_language(self):
+        """Test unknown languages are rejected at construction."""
+        with pytest.raises(ValueError, match="Unknown language"):
+            SyllableGenerator(language="klingon")
@@ -2,9 +2,12 @@
 
 import pytest
 
+from clinkey_cli.generators.random_source import RandomSource
 from clinkey_cli.security.compliance import (
+    CompliancePolicy,
     check_nist_compliance,
     check_owasp_compliance,
+    compile_policy,
     validate_compliance,
 )
 
@@ -128,3 +131,100 @@ class TestValidateCompliance:
 
         with pytest.raises(ValueError, match="password must be a string"):
             validate_compliance([])
+
+
+class TestCompilePolicy:
+    """Test policy compilation."""
+
+    def test_builtin_policies(self):
+        """Test NIST and OWASP compile to their length and class rules."""
+        assert compile_policy("nist").min_length == 8
+        owasp = compile_policy("owasp")
+        assert isinstance(owasp, CompliancePolicy)
+        assert (owasp.min_length, owasp.min_classes) == (10, 3)
+        assert compile_policy("owasp") is owasp
+
+    def test_custom_policy_by_name(self):
+        """Test configured policies are found by name before built-ins."""
+        custom = [{"name": "owasp", "min_length": 20, "require": {"digit": 3}}]
+        policy = compile_policy("owasp", custom)
+        assert policy.min_length == 20
+        assert policy.require == (("digit", 3),)
+
+    def test_inline_specification(self):
+        """Test a mapping compiles directly."""
+        policy = compile_policy({"require": {"special": 1}, "specials": "#"})
+        assert policy.name == "custom"
+        assert dict(policy.alphabets)["special"] == "#"
+
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            "unknown",
+            {"min_length": -1},
+            {"min_classes": 5},
+            {"require": {"emoji": 1}},
+            {"require": {"digit": "2"}},
+            {"specials": "a"},
+            {"typo": 1},
+        ],
+    )
+    def test_invalid_policies(self, spec):
+        """Test unknown names and malformed specifications are rejected."""
+        with pytest.raises(ValueError):
+            compile_policy(spec)
+
+
+class TestApplyPolicy:
+    """Test placing required classes into generated passwords."""
+
+    STRICT = {
+        "min_length": 12,
+        "min_classes": 4,
+        "require": {"digit": 2, "special": 2},
+    }
+
+    def test_compliant_password_unchanged(self):
+        """Test passwords already meeting the policy are returned as-is."""
+        policy = compile_policy("owasp")
+        assert policy.apply("MySecurePass123!", RandomSource()) == "MySecurePass123!"
+
+    def test_places_missing_classes(self):
+        """Test every output meets the policy and keeps the length."""
+        policy = compile_policy(self.STRICT)
+        source = RandomSource()
+        for _ in range(500):
+            password = policy.apply("ABCDEFGHIJKL", source)
+            assert len(password) == 12
+            assert policy.check(password)
+            assert check_owasp_compliance(password)["compliant"]
+
+    def test_never_removes_required_characters(self):
+        """Test a class at its minimum count is not overwritten."""
+        policy = compile_policy({"require": {"digit": 2, "upper": 3}})
+        for _ in range(200):
+            password = policy.apply("12abcdefgh", RandomSource())
+            assert sum(c.isdigit() for c in password) >= 2
+            assert sum(c.isupper() for c in password) >= 3
+
+    def test_fixed_positions_kept(self):
+        """Test fixed positions are never replaced."""
+        policy = compile_policy(self.STRICT)
+        for _ in range(200):
+            password = policy.apply("ABCD-EFGH-IJKL", RandomSource(), {4, 9})
+            assert password[4] == password[9] == "-"
+            assert policy.check(password)
+
+    def test_deterministic_with_seeded_source(self):
+        """Test placement draws from the given source."""
+        policy = compile_policy(self.STRICT)
+        first = policy.apply("ABCDEFGHIJKL", RandomSource.deterministic(7))
+        second = policy.apply("ABCDEFGHIJKL", RandomSource.deterministic(7))
+        assert first == second
+
+    def test_too_short(self):
+        """Test passwords below the minimum length or too short to fit fail."""
+        with pytest.raises(ValueError, match="at least 10"):
+            compile_policy("owasp").apply("Short1!", RandomSource())
+        with pytest.raises(ValueError, match="too short"):
+            compile_policy({"require": {"digit": 3}}).apply("ab", RandomSource())
@@ -2,11 +2,13 @@
 
 import pytest
 
+from clinkey_cli.security import dictionary
 from clinkey_cli.security.dictionary import (
     check_common_password,
     check_dictionary_words,
     analyze_dictionary,
 )
+from clinkey_cli.wordlists.packed import PackedWordlist
 
 
 class TestCommonPasswordCheck:
@@ -29,6 +31,29 @@ class TestCommonPasswordCheck:
         assert result["is_common"] is False
         assert len(result["matches"]) == 0
 
+    def test_longest_common_prefix_matches(self):
+        """Test digits appended to a common password report the longest one."""
+        assert check_common_password("Password1234")["matches"] == ["password123"]
+        assert check_common_password("dragon2024")["matches"] == ["dragon"]
+
+    @pytest.mark.parametrize("password", ["xpassword", "password!1", "dragon1!"])
+    def test_only_digits_may_follow(self, password):
+        """Test a common password must be followed by digits only."""
+        assert check_common_password(password)["is_common"] is False
+
+    def test_long_digit_suffix(self):
+        """Test very long digit suffixes are still matched."""
+        result = check_common_password("qwerty" + "7" * 10_000)
+        assert result["matches"] == ["qwerty"]
+
+    def test_packed_list_matches_text_source(self):
+        """Test the shipped common_passwords.bin is up to date with its source."""
+        text = dictionary._COMMON_PASSWORDS_FILE.read_text(encoding="utf-8")
+        expected = sorted({line.strip().lower() for line in text.splitlines()} - {""})
+
+        assert isinstance(dictionary._COMMON_PASSWORDS, PackedWordlist)
+        assert list(dictionary._COMMON_PASSWORDS) == expected
+
 
 class TestDictionaryWordCheck:
     """Test dictionary word detection."""
@@ -0,0 +1,144 @@
+"""Unit tests for the Clinkey adapter."""
+
+import asyncio
+import string
+import threading
+from itertools import islice
+
+import pytest
+
+from clinkey_cli.main import MAX_BATCH_SIZE, Clinkey
+
+
+class TestIterPasswords:
+    """Test lazy password streams from the Clinkey adapter."""
+
+    def test_iter_passwords_beyond_batch_limit(self, clinkey):
+        """Test streams are not capped by MAX_BATCH_SIZE."""
+        stream = clinkey.iter_passwords(length=20, count=MAX_BATCH_SIZE + 10)
+        passwords = list(stream)
+        assert len(passwords) == MAX_BATCH_SIZE + 10
+        assert all(len(password) <= 20 for password in passwords)
+
+    def test_iter_passwords_unbounded(self, clinkey):
+        """Test count=None yields on demand."""
+        stream = clinkey.iter_passwords(type="strong", length=24)
+        assert len(list(islice(stream, 50))) == 50
+
+    def test_iter_passwords_validates_eagerly(self, clinkey):
+        """Test invalid options fail before the first password is requested."""
+        with pytest.raises(ValueError):
+            clinkey.iter_passwords(length=1)
+        with pytest.raises(ValueError):
+            clinkey.iter_passwords(type="invalid")
+        with pytest.raises(ValueError):
+            clinkey.iter_passwords(count=-1)
+
+
+class TestCompiledSpec:
+    """Test options validated once per configuration."""
+
+    def test_compile_cached(self, clinkey):
+        """Test repeated configurations reuse the same spec."""
+        spec = clinkey.compile(length=20, type="strong")
+        assert clinkey.compile(length=20, type="strong") is spec
+        assert clinkey.compile(length=20, type="normal") is not spec
+
+    def test_compile_follows_new_separator(self, clinkey):
+        """Test changing the instance separator compiles a new spec."""
+        spec = clinkey.compile(length=20, no_separator=True)
+        clinkey.new_separator = "+"
+        assert clinkey.compile(length=20, no_separator=True) is not spec
+
+    def test_compile_rejects_unsafe_separator(self, clinkey):
+        """Test the separator is validated at compile time."""
+        with pytest.raises(ValueError):
+            clinkey.compile(new_separator=" ")
+
+    def test_batch_applies_transforms(self, clinkey):
+        """Test batches strip, remove separators and lowercase."""
+        passwords = clinkey.generate_batch(
+            length=20, count=50, lower=True, no_separator=True, new_separator="+"
+        )
+        for password in passwords:
+            assert password == password.lower()
+            assert not set(password) & set("-_+")
+
+
+class TestAsyncBatch:
+    """Test the asyncio streaming adapter."""
+
+    def test_agenerate_batch(self, clinkey):
+        """Test passwords stream through ``async for``."""
+
+        async def collect():
+            stream = clinkey.agenerate_batch(type="strong", count=300, chunk_size=32)
+            return [password async for password in stream]
+
+        passwords = asyncio.run(collect())
+        assert len(passwords) == 300
+        assert all(len(password) <= 16 for password in passwords)
+
+    def test_agenerate_batch_validates_eagerly(self, clinkey):
+        """Test invalid options fail when the stream is created."""
+        with pytest.raises(ValueError):
+            clinkey.agenerate_batch(type="invalid")
+        with pytest.raises(ValueError):
+            clinkey.agenerate_batch(chunk_size=0)
+
+
+class TestConcurrentGeneration:
+    """Stress a single shared instance from many threads."""
+
+    SEPARATORS = "@#+=!%*~"
+    PER_THREAD = 300
+
+    def _hammer(self, worker) -> list[BaseException]:
+        """Run ``worker(separator)`` on one thread per separator at once."""
+        barrier = threading.Barrier(len(self.SEPARATORS))
+        errors: list[BaseException] = []
+
+        def run(separator: str) -> None:
+            barrier.wait()
+            try:
+                worker(separator)
+            except BaseException as exc:  # surfaced by the assertion below
+                errors.append(exc)
+
+        threads = [
+            threading.Thread(target=run, args=(separator,))
+            for separator in self.SEPARATORS
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return errors
+
+    def test_shared_clinkey_keeps_per_call_separators(self):
+        """Test threads never observe another thread's separator."""
+        shared = Clinkey()
+
+        def worker(separator: str) -> None:
+            for _ in range(self.PER_THREAD):
+                password = shared.generate_password(
+                    length=40, type="normal", new_separator=separator
+                )
+                foreign = set(password) - set(string.ascii_uppercase)
+                assert foreign <= {separator}, (separator, password)
+
+        assert self._hammer(worker) == []
+        assert shared.new_separator is None
+        assert shared._generator._separators == ("-",)
+
+    def test_shared_syllable_generator(self):
+        """Test the underlying generator is safe to share as well."""
+        shared = Clinkey()._generator
+
+        def worker(separator: str) -> None:
+            for _ in range(self.PER_THREAD):
+                password = shared.strong(separator)
+                foreign = set(password) - set(string.ascii_uppercase + string.digits)
+                assert foreign <= {separator}, (separator, password)
+
+        assert self._hammer(worker) == []
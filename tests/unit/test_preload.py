@@ -0,0 +1,41 @@
+"""Unit tests for loading shared datasets ahead of forking."""
+
+import gc
+
+from clinkey_cli.generators.passphrase import _cased_wordlist
+from clinkey_cli.languages import load_language
+from clinkey_cli.preload import preload
+from clinkey_cli.security.dictionary import _COMMON_PASSWORDS
+from clinkey_cli.wordlists import EFF_LARGE_WORDLIST
+
+
+class TestPreload:
+    """Test dataset preloading."""
+
+    def test_builds_decoded_views(self):
+        """Test packed lists and their recased variants are decoded eagerly."""
+        preload()
+
+        for words in (
+            EFF_LARGE_WORDLIST,
+            _cased_wordlist(EFF_LARGE_WORDLIST, True),
+            _cased_wordlist(EFF_LARGE_WORDLIST, False),
+            _COMMON_PASSWORDS,
+        ):
+            assert "_text" in vars(words)
+
+    def test_compiles_language_packs(self):
+        """Test requested packs are compiled, and English is skipped."""
+        load_language.cache_clear()
+
+        preload(languages=["english", "german"])
+
+        assert load_language.cache_info().currsize == 1
+
+    def test_freeze(self):
+        """Test freeze moves tracked objects to the permanent generation."""
+        try:
+            preload(freeze=True)
+            assert gc.get_freeze_count() > 0
+        finally:
+            gc.unfreeze()
@@ -0,0 +1,119 @@
+"""Unit tests for user-supplied wordlists and their cached index."""
+
+import os
+
+import pytest
+
+from clinkey_cli.generators.passphrase import PassphraseGenerator
+from clinkey_cli.wordlists import custom
+from clinkey_cli.wordlists.custom import (
+    INDEX_SUFFIX,
+    build_index,
+    load_wordlist,
+    normalize_words,
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep fallback indexes out of the real home directory."""
+    path = tmp_path / "cache"
+    monkeypatch.setattr(custom, "CACHE_DIR", path)
+    return path
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Provide a small wordlist with duplicates and mixed case."""
+    path = tmp_path / "words.txt"
+    path.write_text("Apple\napple\n  Banana \n\nÉclair\ncafé\n", encoding="utf-8")
+    return path
+
+
+class TestNormalizeWords:
+    """Test normalization and deduplication."""
+
+    def test_normalize_dedupes_in_first_seen_order(self):
+        """Test case, whitespace and Unicode forms collapse to one entry."""
+        words = ["Zebra", "zebra ", "café", "café", "", "ant"]
+        assert normalize_words(words) == ["zebra", "café", "ant"]
+
+
+class TestBuildIndex:
+    """Test sidecar index creation and reuse."""
+
+    def test_index_written_next_to_source(self, source):
+        """Test the first use writes a sidecar with normalized words."""
+        index = build_index(source)
+
+        assert index == source.with_name(source.name + INDEX_SUFFIX)
+        words = load_wordlist(source)
+        assert list(words) == ["apple", "banana", "éclair", "café"]
+        assert words.length_histogram == {4: 1, 5: 1, 6: 2}
+
+    def test_index_reused_when_fresh(self, source, monkeypatch):
+        """Test later runs map the existing index without re-reading the text."""
+        build_index(source)
+        monkeypatch.setattr(custom, "read_words", pytest.fail)
+        assert list(load_wordlist(source))[0] == "apple"
+
+    def test_index_rebuilt_when_source_changes(self, source):
+        """Test editing the source invalidates the index."""
+        index = build_index(source)
+        source.write_text("kiwi\n", encoding="utf-8")
+        stamp = index.stat().st_mtime_ns + 1_000_000_000
+        os.utime(source, ns=(stamp, stamp))
+
+        assert list(load_wordlist(source)) == ["kiwi"]
+
+    def test_index_rebuilt_when_replaced_with_old_mtime(self, source, tmp_path):
+        """Test a source replaced in place with its mtime preserved is seen."""
+        build_index(source)
+        before = source.stat()
+        source.write_text("kiwi\nmango\n", encoding="utf-8")
+        os.utime(source, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+        assert list(load_wordlist(source)) == ["kiwi", "mango"]
+
+    def test_fallback_to_cache_dir(self, source, cache_dir, monkeypatch):
+        """Test read-only source directories use the cache directory."""
+        write = custom._write_atomic
+
+        def refuse_sidecar(path, data):
+            if path.parent == source.parent:
+                raise PermissionError(path)
+            write(path, data)
+
+        monkeypatch.setattr(custom, "_write_atomic", refuse_sidecar)
+        index = build_index(source)
+
+        assert index.parent == cache_dir
+        assert build_index(source) == index
+
+    def test_empty_wordlist_rejected(self, tmp_path):
+        """Test a file without words is an error."""
+        path = tmp_path / "empty.txt"
+        path.write_text("\n  \n", encoding="utf-8")
+        with pytest.raises(ValueError, match="contains no words"):
+            build_index(path)
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing source raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            build_index(tmp_path / "missing.txt")
+
+
+class TestPassphraseWithCustomWordlist:
+    """Test PassphraseGenerator on a custom wordlist."""
+
+    def test_generator_accepts_path(self, source):
+        """Test passphrases draw from the custom list, cased per word."""
+        gen = PassphraseGenerator(wordlist=source)
+        assert gen.wordlist_name == str(source)
+
+        words = set(gen.generate(word_count=6).split("-"))
+        assert words <= {"Apple", "Banana", "Éclair", "Café"}
+
+        upper = {"APPLE", "BANANA", "ÉCLAIR", "CAFÉ"}
+        for passphrase in gen.generate_many(5, capitalize=False):
+            assert set(passphrase.split("-")) <= upper
@@ -0,0 +1,117 @@
+"""Unit tests for the packed wordlist format."""
+
+import json
+from importlib import resources
+
+import pytest
+
+from clinkey_cli.wordlists import EFF_LARGE_WORDLIST
+from clinkey_cli.wordlists.build import build_wordlist, read_words
+from clinkey_cli.wordlists.packed import (
+    PackedWordlist,
+    pack_wordlist,
+    read_source_stamp,
+)
+
+
+class TestPackedWordlist:
+    """Test reading packed wordlists."""
+
+    def test_round_trip(self):
+        """Test words survive packing, including non-ASCII ones."""
+        words = ["alpha", "beta", "élan", "γ"]
+        packed = PackedWordlist(pack_wordlist(words))
+        assert len(packed) == 4
+        assert list(packed) == words
+        assert packed[-1] == "γ"
+        assert packed[1:3] == ["beta", "élan"]
+        assert packed.take([3, 0, 0]) == ["γ", "alpha", "alpha"]
+        assert not packed.is_ascii
+
+    def test_index_out_of_range(self):
+        """Test out-of-range indices raise IndexError."""
+        packed = PackedWordlist(pack_wordlist(["one"]))
+        with pytest.raises(IndexError):
+            packed[1]
+
+    @pytest.mark.parametrize("words", [["abacus", "zebra"], ["élan", "ßig"]])
+    def test_cased_variants(self, words):
+        """Test upper and capitalized variants match str methods."""
+        packed = PackedWordlist(pack_wordlist(words))
+        assert list(packed.upper()) == [word.upper() for word in words]
+        assert list(packed.capitalized()) == [word.capitalize() for word in words]
+
+    @pytest.mark.parametrize(
+        "buffer, message",
+        [
+            (b"short", "truncated header"),
+            (b"NOTWORDS" + bytes(8), "bad magic number"),
+            (pack_wordlist(["a", "b"])[:-1], "blob size mismatch"),
+        ],
+    )
+    def test_invalid_buffers(self, buffer, message):
+        """Test corrupt files are rejected."""
+        with pytest.raises(ValueError, match=message):
+            PackedWordlist(buffer)
+
+    def test_pack_rejects_empty(self):
+        """Test empty lists and empty words cannot be packed."""
+        with pytest.raises(ValueError, match="at least one word"):
+            pack_wordlist([])
+        with pytest.raises(ValueError, match="non-empty"):
+            pack_wordlist(["a", ""])
+
+
+class TestBuildWordlist:
+    """Test the conversion step."""
+
+    def test_build_from_text(self, tmp_path):
+        """Test diceware and plain text lists are converted."""
+        source = tmp_path / "words.txt"
+        source.write_text("11111\tabacus\n11112\tabdomen\n\nzebra\n", encoding="utf-8")
+
+        dest = build_wordlist(source)
+
+        assert dest == tmp_path / "words.bin"
+        assert list(PackedWordlist.open(dest)) == ["abacus", "abdomen", "zebra"]
+
+    def test_source_stamp(self, tmp_path):
+        """Test the stamp of the source survives packing and is read back."""
+        path = tmp_path / "words.bin"
+        data = pack_wordlist(["a", "b"], histogram=True, source_stamp=(1, 2, 3))
+        path.write_bytes(data)
+
+        assert PackedWordlist.open(path).source_stamp == (1, 2, 3)
+        assert read_source_stamp(path) == (1, 2, 3)
+        path.write_bytes(pack_wordlist(["a", "b"]))
+        assert read_source_stamp(path) is None
+
+    def test_build_sorted(self, tmp_path):
+        """Test sorted builds lowercase, deduplicate and sort the words."""
+        source = tmp_path / "words.txt"
+        source.write_text("Zebra\nabacus\nzebra\nMango\n", encoding="utf-8")
+
+        dest = build_wordlist(source, sort=True)
+
+        assert list(PackedWordlist.open(dest)) == ["abacus", "mango", "zebra"]
+
+    def test_materialize(self):
+        """Test the decoded view can be built ahead of the first selection."""
+        words = PackedWordlist(pack_wordlist(["alpha", "beta"]))
+        words.materialize()
+        assert "_text" in vars(words)
+        assert words.take([1, 0]) == ["beta", "alpha"]
+
+    def test_build_rejects_invalid_json(self, tmp_path):
+        """Test JSON sources must be arrays of strings."""
+        source = tmp_path / "words.json"
+        source.write_text('{"a": 1}', encoding="utf-8")
+        with pytest.raises(ValueError, match="JSON array of strings"):
+            read_words(source)
+
+    def test_bundled_binary_matches_json(self):
+        """Test the shipped eff_large.bin is up to date with its JSON source."""
+        source = resources.files("clinkey_cli.wordlists").joinpath("eff_large.json")
+        words = json.loads(source.read_text(encoding="utf-8"))
+        assert isinstance(EFF_LARGE_WORDLIST, PackedWordlist)
+        assert list(EFF_LARGE_WORDLIST) == words